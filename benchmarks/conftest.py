@@ -0,0 +1,373 @@
+"""
+Local Artifactory stand-in server used by the benchmarks.
+
+It implements, in memory, the subset of the REST API used by pyartifactory: storage, deploy/download,
+list, repositories, builds and security (users, groups, permissions). Latency and bandwidth can be
+configured with the --fake-latency and --fake-bandwidth options to get closer to a remote server.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import pytest
+
+from pyartifactory import Artifactory
+
+CONTEXT = "/artifactory"
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+class FakeArtifactoryState:
+    """In memory content of the fake Artifactory."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.files: Dict[str, bytes] = {}
+        self.checksums: Dict[str, Dict[str, str]] = {}
+        self.repositories: Dict[str, Dict[str, Any]] = {}
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.groups: Dict[str, Dict[str, Any]] = {}
+        self.permissions: Dict[str, Dict[str, Any]] = {}
+        self.builds: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def add_file(self, path: str, content: bytes) -> None:
+        path = path.strip("/")
+        with self.lock:
+            self.files[path] = content
+            self.checksums[path] = {
+                "md5": hashlib.md5(content).hexdigest(),  # noqa: S324
+                "sha1": hashlib.sha1(content).hexdigest(),  # noqa: S324
+                "sha256": hashlib.sha256(content).hexdigest(),
+            }
+
+    def add_repository(self, key: str, rclass: str = "local", package_type: str = "generic") -> None:
+        self.repositories[key] = {"key": key, "rclass": rclass, "packageType": package_type}
+
+    def add_build(self, name: str, number: str, started: str = NOW, modules: Optional[List[Any]] = None) -> None:
+        self.builds.setdefault(name, {})[number] = {
+            "version": "1.0.1",
+            "name": name,
+            "number": number,
+            "started": started,
+            "modules": modules or [],
+        }
+
+    def children(self, folder: str) -> List[Tuple[str, bool]]:
+        prefix = f"{folder}/"
+        entries: Dict[str, bool] = {}
+        for path in self.files:
+            if path.startswith(prefix):
+                head, _, tail = path[len(prefix) :].partition("/")
+                entries[head] = entries.get(head, False) or bool(tail)
+        return sorted(entries.items())
+
+
+class FakeArtifactoryHandler(BaseHTTPRequestHandler):
+    """Request handler dispatching the REST API routes of the fake Artifactory."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: FakeArtifactoryServer
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Keep the benchmark output quiet."""
+
+    @property
+    def state(self) -> FakeArtifactoryState:
+        return self.server.state
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._dispatch("GET")
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self._dispatch("HEAD")
+
+    def do_PUT(self) -> None:  # noqa: N802
+        self._dispatch("PUT")
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._dispatch("POST")
+
+    def do_PATCH(self) -> None:  # noqa: N802
+        self._dispatch("PATCH")
+
+    def do_DELETE(self) -> None:  # noqa: N802
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str) -> None:
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        url = urlsplit(self.path)
+        route = unquote(url.path)[len(CONTEXT) + 1 :]
+        query = parse_qs(url.query, keep_blank_values=True)
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0) or 0))
+        for pattern, handler in ROUTES:
+            match = pattern.match(route)
+            if match:
+                status, payload = handler(self, method if method != "HEAD" else "GET", query, body, *match.groups())
+                break
+        else:
+            status, payload = 404, {"errors": [{"status": 404, "message": "Not Found"}]}
+        self._respond(status, payload, head=method == "HEAD")
+
+    def _respond(self, status: int, payload: Any, head: bool = False) -> None:
+        if isinstance(payload, bytes):
+            data, content_type = payload, "application/octet-stream"
+        else:
+            data, content_type = json.dumps(payload).encode(), "application/json"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if head:
+            return
+        chunk_size = 65536
+        for start in range(0, len(data), chunk_size):
+            chunk = data[start : start + chunk_size]
+            if self.server.bandwidth:
+                time.sleep(len(chunk) / self.server.bandwidth)
+            self.wfile.write(chunk)
+
+    # Storage
+    def storage(self, method: str, query: Dict[str, List[str]], body: bytes, path: str) -> Tuple[int, Any]:
+        path = path.strip("/")
+        if method != "GET":
+            return 200, {}
+        if "list" in query:
+            return self._list(path, deep=query.get("deep", ["0"])[0] == "1")
+        if path in self.state.files:
+            repo, _, file_path = path.partition("/")
+            return 200, {
+                "repo": repo,
+                "path": f"/{file_path}",
+                "created": NOW,
+                "lastModified": NOW,
+                "uri": f"{CONTEXT}/api/storage/{path}",
+                "downloadUri": f"{CONTEXT}/{path}",
+                "size": len(self.state.files[path]),
+                "checksums": self.state.checksums[path],
+            }
+        children = self.state.children(path)
+        if not children and path not in self.state.repositories:
+            return 404, {"errors": [{"status": 404, "message": "Unable to find item"}]}
+        repo, _, folder_path = path.partition("/")
+        return 200, {
+            "repo": repo,
+            "path": f"/{folder_path}",
+            "created": NOW,
+            "lastModified": NOW,
+            "uri": f"{CONTEXT}/api/storage/{path}",
+            "children": [{"uri": f"/{name}", "folder": folder} for name, folder in children],
+        }
+
+    def _list(self, path: str, deep: bool) -> Tuple[int, Any]:
+        prefix = f"{path}/"
+        files = []
+        for file_path, content in self.state.files.items():
+            if file_path.startswith(prefix) and (deep or "/" not in file_path[len(prefix) :]):
+                files.append(
+                    {
+                        "uri": f"/{file_path[len(prefix):]}",
+                        "size": len(content),
+                        "lastModified": NOW,
+                        "folder": False,
+                        "sha1": self.state.checksums[file_path]["sha1"],
+                        "sha2": self.state.checksums[file_path]["sha256"],
+                    },
+                )
+        return 200, {"uri": f"{CONTEXT}/api/storage/{path}", "created": NOW, "files": files}
+
+    # Deploy and download
+    def artifact(self, method: str, query: Dict[str, List[str]], body: bytes, path: str) -> Tuple[int, Any]:
+        path = path.split(";", 1)[0].strip("/")
+        if method == "PUT":
+            if self.headers.get("X-Checksum-Deploy") == "true":
+                sha1 = self.headers.get("X-Checksum-Sha1")
+                source = next((p for p, sums in self.state.checksums.items() if sums["sha1"] == sha1), None)
+                if source is None:
+                    return 404, {"errors": [{"status": 404, "message": "Checksum not found"}]}
+                body = self.state.files[source]
+            self.state.add_file(path, body)
+            return 201, {}
+        if method == "DELETE":
+            with self.state.lock:
+                self.state.files.pop(path, None)
+            return 204, b""
+        if path not in self.state.files:
+            return 404, {"errors": [{"status": 404, "message": "Not Found"}]}
+        return 200, self.state.files[path]
+
+    # Repositories
+    def repository_list(self, method: str, query: Dict[str, List[str]], body: bytes) -> Tuple[int, Any]:
+        return 200, [
+            {
+                "key": key,
+                "type": repo["rclass"].upper(),
+                "url": f"http://fake{CONTEXT}/{key}",
+                "packageType": repo.get("packageType", "generic"),
+            }
+            for key, repo in self.state.repositories.items()
+        ]
+
+    def repository(self, method: str, query: Dict[str, List[str]], body: bytes, key: str) -> Tuple[int, Any]:
+        return self._entity(self.state.repositories, method, body, key, merge=True)
+
+    # Security
+    def user_list(self, method: str, query: Dict[str, List[str]], body: bytes) -> Tuple[int, Any]:
+        return 200, [{"name": name, "uri": f"http://fake/users/{name}"} for name in self.state.users]
+
+    def user(self, method: str, query: Dict[str, List[str]], body: bytes, name: str) -> Tuple[int, Any]:
+        return self._entity(self.state.users, method, body, name, merge=True, drop=("password",))
+
+    def group_list(self, method: str, query: Dict[str, List[str]], body: bytes) -> Tuple[int, Any]:
+        return 200, [{"name": name, "uri": f"http://fake/groups/{name}"} for name in self.state.groups]
+
+    def group(self, method: str, query: Dict[str, List[str]], body: bytes, name: str) -> Tuple[int, Any]:
+        return self._entity(self.state.groups, method, body, name, merge=True)
+
+    def permission_list(self, method: str, query: Dict[str, List[str]], body: bytes) -> Tuple[int, Any]:
+        return 200, [{"name": name, "uri": f"http://fake/permissions/{name}"} for name in self.state.permissions]
+
+    def permission(self, method: str, query: Dict[str, List[str]], body: bytes, name: str) -> Tuple[int, Any]:
+        return self._entity(self.state.permissions, method, body, name)
+
+    def _entity(
+        self,
+        store: Dict[str, Dict[str, Any]],
+        method: str,
+        body: bytes,
+        name: str,
+        merge: bool = False,
+        drop: Tuple[str, ...] = (),
+    ) -> Tuple[int, Any]:
+        with self.state.lock:
+            if method == "GET":
+                if name not in store:
+                    return 404, {"errors": [{"status": 404, "message": f"{name} not found"}]}
+                return 200, store[name]
+            if method == "DELETE":
+                store.pop(name, None)
+                return 200, b""
+            data = {key: value for key, value in json.loads(body or b"{}").items() if key not in drop}
+            if method == "POST" and merge:
+                if name not in store:
+                    return 404, {"errors": [{"status": 404, "message": f"{name} not found"}]}
+                store[name] = {**store[name], **data}
+            else:
+                store[name] = data
+            return 200, b""
+
+    # Builds
+    def build_list(self, method: str, query: Dict[str, List[str]], body: bytes) -> Tuple[int, Any]:
+        if method == "PUT":
+            build = json.loads(body)
+            self.state.builds.setdefault(build["name"], {})[build["number"]] = build
+            return 204, b""
+        return 200, {
+            "uri": f"http://fake{CONTEXT}/api/build",
+            "builds": [
+                {"uri": f"/{name}", "lastStarted": max(run["started"] for run in runs.values())}
+                for name, runs in self.state.builds.items()
+                if runs
+            ],
+        }
+
+    def build_runs(self, method: str, query: Dict[str, List[str]], body: bytes, name: str) -> Tuple[int, Any]:
+        if name not in self.state.builds:
+            return 404, {"errors": [{"status": 404, "message": f"No build was found for build name: {name}"}]}
+        runs = self.state.builds[name]
+        return 200, {
+            "uri": f"http://fake{CONTEXT}/api/build/{name}",
+            "buildsNumbers": [{"uri": f"/{number}", "started": run["started"]} for number, run in runs.items()],
+        }
+
+    def build_info(self, method: str, query: Dict[str, List[str]], body: bytes, name: str, number: str):
+        run = self.state.builds.get(name, {}).get(number)
+        if run is None:
+            return 404, {"errors": [{"status": 404, "message": f"No build was found for build name: {name}"}]}
+        return 200, {"uri": f"http://fake{CONTEXT}/api/build/{name}/{number}", "buildInfo": run}
+
+    def build_delete(self, method: str, query: Dict[str, List[str]], body: bytes) -> Tuple[int, Any]:
+        request = json.loads(body)
+        with self.state.lock:
+            runs = self.state.builds.get(request["buildName"], {})
+            numbers = list(runs) if request.get("deleteAll") else request.get("buildNumbers", [])
+            for number in numbers:
+                runs.pop(number, None)
+        return 200, b""
+
+    def build_promote(self, method: str, query: Dict[str, List[str]], body: bytes, name: str, number: str):
+        if number not in self.state.builds.get(name, {}):
+            return 404, {"errors": [{"status": 404, "message": f"Cannot find build {name} {number}"}]}
+        return 200, {"messages": []}
+
+
+ROUTES: List[Tuple[re.Pattern[str], Callable[..., Tuple[int, Any]]]] = [
+    (re.compile(pattern), handler)
+    for pattern, handler in (
+        (r"^api/storage/(.+)$", FakeArtifactoryHandler.storage),
+        (r"^api/repositories$", FakeArtifactoryHandler.repository_list),
+        (r"^api/repositories/([^/]+)$", FakeArtifactoryHandler.repository),
+        (r"^api/security/users$", FakeArtifactoryHandler.user_list),
+        (r"^api/security/users/([^/]+)$", FakeArtifactoryHandler.user),
+        (r"^api/security/groups$", FakeArtifactoryHandler.group_list),
+        (r"^api/security/groups/([^/]+)$", FakeArtifactoryHandler.group),
+        (r"^api/(?:v2/)?security/permissions$", FakeArtifactoryHandler.permission_list),
+        (r"^api/(?:v2/)?security/permissions/([^/]+)$", FakeArtifactoryHandler.permission),
+        (r"^api/build$", FakeArtifactoryHandler.build_list),
+        (r"^api/build/delete$", FakeArtifactoryHandler.build_delete),
+        (r"^api/build/promote/([^/]+)/([^/]+)$", FakeArtifactoryHandler.build_promote),
+        (r"^api/build/([^/]+)$", FakeArtifactoryHandler.build_runs),
+        (r"^api/build/([^/]+)/([^/]+)$", FakeArtifactoryHandler.build_info),
+        (r"^(?!api/)(.+)$", FakeArtifactoryHandler.artifact),
+    )
+]
+
+
+class FakeArtifactoryServer(ThreadingHTTPServer):
+    """HTTP server holding the state of the fake Artifactory."""
+
+    daemon_threads = True
+
+    def __init__(self, latency: float = 0.0, bandwidth: float = 0.0) -> None:
+        super().__init__(("127.0.0.1", 0), FakeArtifactoryHandler)
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.state = FakeArtifactoryState()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}{CONTEXT}"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("fake-artifactory")
+    group.addoption("--fake-latency", type=float, default=0.0, help="Latency added to each request, in seconds")
+    group.addoption("--fake-bandwidth", type=float, default=0.0, help="Bandwidth of response bodies, in bytes/s")
+
+
+@pytest.fixture()
+def fake_artifactory(request: pytest.FixtureRequest) -> Iterator[FakeArtifactoryServer]:
+    server = FakeArtifactoryServer(
+        latency=request.config.getoption("--fake-latency"),
+        bandwidth=request.config.getoption("--fake-bandwidth"),
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def artifactory(fake_artifactory: FakeArtifactoryServer) -> Artifactory:
+    return Artifactory(url=fake_artifactory.url, auth=("admin", "password"))  # type: ignore[arg-type]
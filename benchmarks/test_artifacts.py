@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import shutil
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+TREE_DIRECTORIES = 5
+TREE_FILES_PER_DIRECTORY = 20
+DEEP_LIST_FILES = 5000
+FILE_CONTENT = b"x" * 16384
+
+
+def test_tree_download(benchmark, fake_artifactory, artifactory, tmp_path):
+    for directory in range(TREE_DIRECTORIES):
+        for index in range(TREE_FILES_PER_DIRECTORY):
+            fake_artifactory.state.add_file(f"bench-repo/tree/dir{directory}/file{index}.bin", FILE_CONTENT)
+    destination = tmp_path / "download"
+
+    def setup():
+        shutil.rmtree(destination, ignore_errors=True)
+        destination.mkdir()
+
+    benchmark.pedantic(
+        artifactory.artifacts.download,
+        args=("bench-repo/tree", str(destination)),
+        setup=setup,
+        rounds=5,
+    )
+
+    assert len(list((destination / "tree").rglob("*.bin"))) == TREE_DIRECTORIES * TREE_FILES_PER_DIRECTORY
+
+
+def test_bulk_deploy(benchmark, fake_artifactory, artifactory, tmp_path):
+    local_directory = tmp_path / "to_deploy"
+    for directory in range(TREE_DIRECTORIES):
+        (local_directory / f"dir{directory}").mkdir(parents=True)
+        for index in range(TREE_FILES_PER_DIRECTORY):
+            (local_directory / f"dir{directory}" / f"file{index}.bin").write_bytes(FILE_CONTENT)
+
+    benchmark.pedantic(artifactory.artifacts.deploy, args=(local_directory, "bench-repo/deployed"), rounds=5)
+
+    assert len(fake_artifactory.state.files) == TREE_DIRECTORIES * TREE_FILES_PER_DIRECTORY
+
+
+def test_deep_list_parse(benchmark, fake_artifactory, artifactory):
+    for index in range(DEEP_LIST_FILES):
+        fake_artifactory.state.add_file(f"bench-repo/deep/{index % 50}/{index}/file.txt", b"content")
+
+    artifact_list = benchmark(artifactory.artifacts.list, "bench-repo/deep")
+
+    assert len(artifact_list.files) == DEEP_LIST_FILES
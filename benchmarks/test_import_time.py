@@ -0,0 +1,26 @@
+"""
+Import time benchmarks. Each round imports pyartifactory in a fresh interpreter,
+as a short-lived CI invocation would.
+"""
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import pyartifactory",
+        "from pyartifactory import Artifactory; Artifactory(url='http://localhost').artifacts",
+        "from pyartifactory import Artifactory; Artifactory(url='http://localhost').repositories",
+    ],
+    ids=["package", "artifacts", "repositories"],
+)
+def test_import_time(benchmark, statement):
+    benchmark.group = "import time"
+    benchmark.pedantic(subprocess.run, args=([sys.executable, "-c", statement],), kwargs={"check": True}, rounds=10)
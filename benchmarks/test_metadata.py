@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+FAN_OUT = 100
+
+
+def test_user_metadata_fan_out(benchmark, fake_artifactory, artifactory):
+    for index in range(FAN_OUT):
+        name = f"user{index}"
+        fake_artifactory.state.users[name] = {"name": name, "email": f"{name}@example.com", "groups": ["readers"]}
+
+    def fan_out():
+        return [artifactory.users.get(user.name) for user in artifactory.users.list()]
+
+    users = benchmark(fan_out)
+
+    assert len(users) == FAN_OUT
+
+
+def test_repository_metadata_fan_out(benchmark, fake_artifactory, artifactory):
+    for index in range(FAN_OUT):
+        fake_artifactory.state.add_repository(f"repo{index}", rclass=("local", "remote", "virtual")[index % 3])
+        if index % 3 == 1:
+            fake_artifactory.state.repositories[f"repo{index}"]["url"] = "https://example.com"
+
+    def fan_out():
+        return [artifactory.repositories.get_repo(repo.key) for repo in artifactory.repositories.list()]
+
+    repositories = benchmark(fan_out)
+
+    assert len(repositories) == FAN_OUT
+
+
+def test_repository_metadata_detailed_list(benchmark, fake_artifactory, artifactory):
+    for index in range(FAN_OUT):
+        fake_artifactory.state.add_repository(f"repo{index}", rclass=("local", "remote", "virtual")[index % 3])
+        if index % 3 == 1:
+            fake_artifactory.state.repositories[f"repo{index}"]["url"] = "https://example.com"
+
+    repositories = benchmark(artifactory.repositories.list, detailed=True, concurrency=16)
+
+    assert [repository.key for repository in repositories] == [f"repo{index}" for index in range(FAN_OUT)]
+
+
+def test_build_metadata_fan_out(benchmark, fake_artifactory, artifactory):
+    for index in range(FAN_OUT):
+        fake_artifactory.state.add_build("bench-build", str(index))
+
+    def fan_out():
+        runs = artifactory.builds.get_build_runs("bench-build").buildsNumbers or []
+        return [artifactory.builds.get_build_info("bench-build", run.uri.lstrip("/")) for run in runs]
+
+    build_infos = benchmark(fan_out)
+
+    assert len(build_infos) == FAN_OUT
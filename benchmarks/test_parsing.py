@@ -0,0 +1,73 @@
+"""
+Response parsing benchmarks, comparing the default parsing path, the orjson JSON backend
+and the trusted_responses path. The responses are fetched once, only the model construction is measured.
+"""
+from __future__ import annotations
+
+import pytest
+
+from pyartifactory import Artifactory
+from pyartifactory.models import BuildInfo
+from pyartifactory.models.artifact import ArtifactListResponse
+
+pytest.importorskip("pytest_benchmark")
+
+MODULES = 10
+ARTIFACTS_PER_MODULE = 1000
+DEEP_LIST_FILES = 20000
+
+
+@pytest.fixture(
+    params=[("json", False), ("orjson", False), ("json", True)],
+    ids=["default", "orjson", "trusted"],
+)
+def parsing_artifactory(request, fake_artifactory):
+    json_backend, trusted_responses = request.param
+    if json_backend != "json":
+        pytest.importorskip(json_backend)
+    return Artifactory(
+        url=fake_artifactory.url,
+        auth=("admin", "password"),  # type: ignore[arg-type]
+        trusted_responses=trusted_responses,
+        json_backend=json_backend,
+    )
+
+
+def test_large_build_info_parse(benchmark, fake_artifactory, parsing_artifactory):
+    benchmark.group = "large build-info"
+    modules = [
+        {
+            "id": f"module-{module}",
+            "artifacts": [
+                {
+                    "type": "jar",
+                    "sha1": f"{index:040x}",
+                    "sha256": f"{index:064x}",
+                    "md5": f"{index:032x}",
+                    "name": f"artifact-{module}-{index}.jar",
+                    "path": f"org/example/artifact-{module}-{index}.jar",
+                }
+                for index in range(ARTIFACTS_PER_MODULE)
+            ],
+        }
+        for module in range(MODULES)
+    ]
+    fake_artifactory.state.add_build("monorepo", "1", modules=modules)
+    builds = parsing_artifactory.builds
+    response = builds._get("api/build/monorepo/1")
+
+    build_info = benchmark(builds._parse, response, BuildInfo)
+
+    assert sum(len(module.artifacts) for module in build_info.buildInfo.modules) == MODULES * ARTIFACTS_PER_MODULE
+
+
+def test_large_deep_list_parse(benchmark, fake_artifactory, parsing_artifactory):
+    benchmark.group = "large deep list"
+    for index in range(DEEP_LIST_FILES):
+        fake_artifactory.state.add_file(f"bench-repo/deep/{index % 100}/{index}.txt", b"content")
+    artifacts = parsing_artifactory.artifacts
+    response = artifacts._get("api/storage/bench-repo/deep?list", params={"deep": 1, "listFolders": 1})
+
+    artifact_list = benchmark(artifacts._parse, response, ArtifactListResponse)
+
+    assert len(artifact_list.files) == DEEP_LIST_FILES
@@ -1,22 +1,57 @@
 """
 Import all object definitions here.
+Objects are only imported on first access (PEP 562), so that importing pyartifactory stays cheap.
 """
 from __future__ import annotations
 
-import contextlib
+import importlib
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any, Dict, List
 
-from pyartifactory.models.auth import AccessTokenModel
-from pyartifactory.objects.artifact import ArtifactoryArtifact
-from pyartifactory.objects.artifactory import Artifactory
-from pyartifactory.objects.build import ArtifactoryBuild
-from pyartifactory.objects.group import ArtifactoryGroup
-from pyartifactory.objects.permission import ArtifactoryPermission
-from pyartifactory.objects.repository import ArtifactoryRepository
-from pyartifactory.objects.security import ArtifactorySecurity
-from pyartifactory.objects.user import ArtifactoryUser
+if TYPE_CHECKING:
+    from pyartifactory.metrics import InMemoryMetricsCollector, RequestMetric
+    from pyartifactory.models.auth import AccessTokenModel
+    from pyartifactory.objects.access import EffectiveAccess
+    from pyartifactory.objects.artifact import ArtifactoryArtifact
+    from pyartifactory.objects.artifactory import Artifactory
+    from pyartifactory.objects.blob_cache import BlobCache
+    from pyartifactory.objects.build import ArtifactoryBuild
+    from pyartifactory.objects.build_cache import BuildInfoCache
+    from pyartifactory.objects.build_catalog import BuildCatalog
+    from pyartifactory.objects.group import ArtifactoryGroup
+    from pyartifactory.objects.permission import ArtifactoryPermission
+    from pyartifactory.objects.provenance import ProvenanceIndex
+    from pyartifactory.objects.remote_file import RemoteFile
+    from pyartifactory.objects.repository import ArtifactoryRepository
+    from pyartifactory.objects.security import ArtifactorySecurity
+    from pyartifactory.objects.snapshot import ArtifactorySnapshot
+    from pyartifactory.objects.token import AccessTokenManager
+    from pyartifactory.objects.user import ArtifactoryUser
+
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "AccessTokenManager": "pyartifactory.objects.token",
+    "AccessTokenModel": "pyartifactory.models.auth",
+    "Artifactory": "pyartifactory.objects.artifactory",
+    "ArtifactoryGroup": "pyartifactory.objects.group",
+    "ArtifactoryArtifact": "pyartifactory.objects.artifact",
+    "ArtifactoryPermission": "pyartifactory.objects.permission",
+    "ArtifactoryRepository": "pyartifactory.objects.repository",
+    "ArtifactorySecurity": "pyartifactory.objects.security",
+    "ArtifactorySnapshot": "pyartifactory.objects.snapshot",
+    "ArtifactoryUser": "pyartifactory.objects.user",
+    "ArtifactoryBuild": "pyartifactory.objects.build",
+    "BlobCache": "pyartifactory.objects.blob_cache",
+    "BuildCatalog": "pyartifactory.objects.build_catalog",
+    "BuildInfoCache": "pyartifactory.objects.build_cache",
+    "EffectiveAccess": "pyartifactory.objects.access",
+    "InMemoryMetricsCollector": "pyartifactory.metrics",
+    "ProvenanceIndex": "pyartifactory.objects.provenance",
+    "RemoteFile": "pyartifactory.objects.remote_file",
+    "RequestMetric": "pyartifactory.metrics",
+}
 
 __all__ = [
+    "AccessTokenManager",
     "AccessTokenModel",
     "Artifactory",
     "ArtifactoryGroup",
@@ -24,9 +59,33 @@ __all__ = [
     "ArtifactoryPermission",
     "ArtifactoryRepository",
     "ArtifactorySecurity",
+    "ArtifactorySnapshot",
     "ArtifactoryUser",
     "ArtifactoryBuild",
+    "BlobCache",
+    "BuildCatalog",
+    "BuildInfoCache",
+    "EffectiveAccess",
+    "InMemoryMetricsCollector",
+    "ProvenanceIndex",
+    "RemoteFile",
+    "RequestMetric",
 ]
 
-with contextlib.suppress(PackageNotFoundError):
-    __version__ = version("pyartifactory")
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        try:
+            value = version("pyartifactory")
+        except PackageNotFoundError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
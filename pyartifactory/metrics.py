@@ -0,0 +1,220 @@
+"""
+Definition of request metrics collection.
+"""
+from __future__ import annotations
+
+import re
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+from requests import Response
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Ordered from the most specific to the most generic pattern, the first match wins.
+_ROUTE_TEMPLATES: List[Tuple[re.Pattern[str], str]] = [
+    (re.compile(pattern), template)
+    for pattern, template in (
+        (r"^api/storage/.+$", "api/storage/{path}"),
+        (r"^api/metadata/.+$", "api/metadata/{path}"),
+        (r"^api/copy/.+$", "api/copy/{path}"),
+        (r"^api/move/.+$", "api/move/{path}"),
+        (r"^api/repositories/[^/]+$", "api/repositories/{key}"),
+        (r"^api/security/users/[^/]+$", "api/security/users/{name}"),
+        (r"^api/security/groups/[^/]+$", "api/security/groups/{name}"),
+        (r"^api/security/permissions/[^/]+$", "api/security/permissions/{name}"),
+        (r"^api/v2/security/permissions/[^/]+$", "api/v2/security/permissions/{name}"),
+        (r"^api/security/unlockUsers/[^/]+$", "api/security/unlockUsers/{name}"),
+        (r"^api/security/apiKey/[^/]+$", "api/security/apiKey/{name}"),
+        (r"^api/build/promote/[^/]+/[^/]+$", "api/build/promote/{name}/{number}"),
+        (r"^api/build/rename/[^/]+$", "api/build/rename/{name}"),
+        (r"^api/build/(?!delete$)[^/]+/[^/]+$", "api/build/{name}/{number}"),
+        (r"^api/build/(?!delete$)[^/]+$", "api/build/{name}"),
+        (r"^(api|access)/.*$", "{route}"),
+        (r"^.+$", "{repo}/{path}"),
+    )
+]
+
+
+def route_template(route: str) -> str:
+    """
+    Reduce a concrete API route to its template, so that metrics are aggregated per endpoint.
+    Query parameter values are dropped, only their names are kept.
+    :param route: API Route, as given to the HTTP methods of an ArtifactoryObject
+    :return: The route template, e.g. "api/security/users/{name}"
+    """
+    path, _, query = route.partition("?")
+    path = path.split(";", 1)[0].strip("/")
+    template = path
+    for pattern, candidate in _ROUTE_TEMPLATES:
+        if pattern.match(path):
+            template = path if candidate == "{route}" else candidate
+            break
+    if query:
+        keys = [param.split("=", 1)[0] for param in query.split("&") if param]
+        template = f"{template}?{'&'.join(keys)}"
+    return template
+
+
+class RequestMetric(BaseModel):
+    """Models the measurement of a single HTTP request."""
+
+    method: str
+    route: str
+    duration: float
+    status_code: Optional[int] = None
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    retries: int = 0
+    error: Optional[str] = None
+
+    @classmethod
+    def from_response(
+        cls,
+        method: str,
+        route: str,
+        duration: float,
+        response: Optional[Response] = None,
+        error: Optional[BaseException] = None,
+        streamed: bool = False,
+    ) -> RequestMetric:
+        """
+        Build a metric from the outcome of a request.
+        :param method: HTTP method used
+        :param route: API Route that was requested
+        :param duration: Time spent waiting for the response, in seconds
+        :param response: The HTTP response, if any was received
+        :param error: The exception raised by the transport, if any
+        :param streamed: Whether the body was left unread for the caller to stream
+        :return: RequestMetric
+        """
+        metric = cls(
+            method=method.upper(),
+            route=route_template(route),
+            duration=duration,
+            error=type(error).__name__ if error is not None else None,
+        )
+        if response is None:
+            return metric
+
+        metric.status_code = response.status_code
+        if response.request is not None:
+            metric.bytes_sent = int(response.request.headers.get("Content-Length", 0) or 0)
+        if streamed:
+            metric.bytes_received = int(response.headers.get("Content-Length", 0) or 0)
+        else:
+            metric.bytes_received = len(response.content or b"")
+        retries = getattr(response.raw, "retries", None)
+        metric.retries = len(getattr(retries, "history", None) or ())
+        return metric
+
+
+MetricsCallback = Callable[[RequestMetric], None]
+
+
+class EndpointStats(BaseModel):
+    """Models the aggregated metrics of an endpoint."""
+
+    method: str
+    route: str
+    count: int = 0
+    duration_sum: float = 0.0
+    bucket_counts: List[int] = []
+    status_counts: Dict[str, int] = {}
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    retries: int = 0
+    errors: int = 0
+
+
+class InMemoryMetricsCollector:
+    """Metrics callback aggregating request metrics per endpoint in memory."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], EndpointStats] = {}
+
+    def __call__(self, metric: RequestMetric) -> None:
+        key = (metric.method, metric.route)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = EndpointStats(method=metric.method, route=metric.route, bucket_counts=[0] * len(self.buckets))
+                self._stats[key] = stats
+            stats.count += 1
+            stats.duration_sum += metric.duration
+            for index, upper_bound in enumerate(self.buckets):
+                if metric.duration <= upper_bound:
+                    stats.bucket_counts[index] += 1
+            status = str(metric.status_code) if metric.status_code is not None else "error"
+            stats.status_counts[status] = stats.status_counts.get(status, 0) + 1
+            stats.bytes_sent += metric.bytes_sent
+            stats.bytes_received += metric.bytes_received
+            stats.retries += metric.retries
+            if metric.error is not None:
+                stats.errors += 1
+
+    def snapshot(self) -> List[EndpointStats]:
+        """
+        Get a copy of the aggregated metrics
+        :return: A list of endpoint statistics, sorted by method and route
+        """
+        with self._lock:
+            return [self._stats[key].model_copy(deep=True) for key in sorted(self._stats)]
+
+    def reset(self) -> None:
+        """
+        Drop all the aggregated metrics
+        :return: None
+        """
+        with self._lock:
+            self._stats.clear()
+
+    def to_prometheus(self, prefix: str = "pyartifactory") -> str:
+        """
+        Export the aggregated metrics in the Prometheus text exposition format
+        :param prefix: Prefix of the metric names
+        :return: The metrics as text
+        """
+        snapshot = self.snapshot()
+        lines: List[str] = [
+            f"# HELP {prefix}_request_duration_seconds Latency of the HTTP requests sent to Artifactory.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        for stats in snapshot:
+            labels = _format_labels(method=stats.method, route=stats.route)
+            for upper_bound, bucket_count in zip(self.buckets, stats.bucket_counts):
+                bucket_labels = _format_labels(method=stats.method, route=stats.route, le=repr(float(upper_bound)))
+                lines.append(f"{prefix}_request_duration_seconds_bucket{bucket_labels} {bucket_count}")
+            inf_labels = _format_labels(method=stats.method, route=stats.route, le="+Inf")
+            lines.append(f"{prefix}_request_duration_seconds_bucket{inf_labels} {stats.count}")
+            lines.append(f"{prefix}_request_duration_seconds_sum{labels} {stats.duration_sum!r}")
+            lines.append(f"{prefix}_request_duration_seconds_count{labels} {stats.count}")
+
+        lines += [
+            f"# HELP {prefix}_requests_total HTTP requests sent to Artifactory, by response status.",
+            f"# TYPE {prefix}_requests_total counter",
+        ]
+        for stats in snapshot:
+            for status, status_count in sorted(stats.status_counts.items()):
+                status_labels = _format_labels(method=stats.method, route=stats.route, status=status)
+                lines.append(f"{prefix}_requests_total{status_labels} {status_count}")
+
+        counters = (
+            ("request_bytes_sent_total", "Bytes sent in HTTP request bodies.", "bytes_sent"),
+            ("response_bytes_received_total", "Bytes received in HTTP response bodies.", "bytes_received"),
+            ("request_retries_total", "Retries performed by the transport.", "retries"),
+        )
+        for name, description, field in counters:
+            lines += [f"# HELP {prefix}_{name} {description}", f"# TYPE {prefix}_{name} counter"]
+            for stats in snapshot:
+                labels = _format_labels(method=stats.method, route=stats.route)
+                lines.append(f"{prefix}_{name}{labels} {getattr(stats, field)}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(**labels: str) -> str:
+    escaped = (value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for value in labels.values())
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(labels, escaped)) + "}"
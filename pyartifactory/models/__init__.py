@@ -1,61 +1,138 @@
 """
 Import all models here.
+Model modules are only imported on first access to one of their models (PEP 562).
 """
 from __future__ import annotations
 
-from typing import Union
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
-from .artifact import (
-    ArtifactFileInfoResponse,
-    ArtifactFolderInfoResponse,
-    ArtifactInfoResponse,
-    ArtifactPropertiesResponse,
-    ArtifactStatsResponse,
-)
-from .auth import AccessTokenModel, ApiKeyModel, AuthModel, PasswordModel
-from .build import (
-    BuildAgent,
-    BuildArtifact,
-    BuildCreateRequest,
-    BuildDeleteRequest,
-    BuildDiffResponse,
-    BuildDiffResponseDetail,
-    BuildError,
-    BuildInfo,
-    BuildInfoDetail,
-    BuildListResponse,
-    BuildModules,
-    BuildPromotionRequest,
-    BuildPromotionResult,
-    BuildProperties,
-    BuildRuns,
-    Run,
-    SimpleBuild,
-)
-from .group import Group, SimpleGroup
-from .permission import Permission, PermissionV2, SimplePermission
-from .repository import (
-    FederatedRepository,
-    FederatedRepositoryResponse,
-    LocalRepository,
-    LocalRepositoryResponse,
-    RemoteRepository,
-    RemoteRepositoryResponse,
-    SimpleRepository,
-    VirtualRepository,
-    VirtualRepositoryResponse,
-)
-from .user import BaseUserModel, NewUser, SimpleUser, User, UserResponse
+if TYPE_CHECKING:
+    from .artifact import (
+        ArtifactFileInfoResponse,
+        ArtifactFolderInfoResponse,
+        ArtifactInfoResponse,
+        ArtifactPropertiesResponse,
+        ArtifactStatsResponse,
+    )
+    from .auth import AccessTokenModel, ApiKeyModel, AuthModel, PasswordModel
+    from .build import (
+        BuildAgent,
+        BuildArtifact,
+        BuildCreateRequest,
+        BuildDeleteRequest,
+        BuildDiffResponse,
+        BuildDiffResponseDetail,
+        BuildError,
+        BuildInfo,
+        BuildInfoDetail,
+        BuildListResponse,
+        BuildModules,
+        BuildPromotionOutcome,
+        BuildPromotionReport,
+        BuildPromotionRequest,
+        BuildPromotionResult,
+        BuildProperties,
+        BuildProvenance,
+        BuildRetentionPlan,
+        BuildRetentionPolicy,
+        BuildRuns,
+        Run,
+        SimpleBuild,
+    )
+    from .group import Group, GroupMembershipChange, SimpleGroup
+    from .permission import AnyPermission, Permission, PermissionV2, SimplePermission
+    from .repository import (
+        AnyRepository,
+        AnyRepositoryResponse,
+        FederatedRepository,
+        FederatedRepositoryResponse,
+        LocalRepository,
+        LocalRepositoryResponse,
+        RemoteRepository,
+        RemoteRepositoryResponse,
+        RepositoryAction,
+        RepositoryChange,
+        RepositoryFieldChange,
+        RepositoryPlan,
+        SimpleRepository,
+        VirtualRepository,
+        VirtualRepositoryResponse,
+    )
+    from .user import (
+        BaseUserModel,
+        NewUser,
+        SimpleUser,
+        User,
+        UserResponse,
+        UserUpsertAction,
+        UserUpsertReport,
+        UserUpsertResult,
+    )
 
-AnyRepositoryResponse = Union[
-    LocalRepositoryResponse,
-    VirtualRepositoryResponse,
-    RemoteRepositoryResponse,
-    FederatedRepositoryResponse,
-]
-
-AnyRepository = Union[LocalRepository, VirtualRepository, RemoteRepository, FederatedRepository]
-AnyPermission = Union[Permission, PermissionV2]
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "ArtifactFileInfoResponse": "artifact",
+    "ArtifactFolderInfoResponse": "artifact",
+    "ArtifactInfoResponse": "artifact",
+    "ArtifactPropertiesResponse": "artifact",
+    "ArtifactStatsResponse": "artifact",
+    "AccessTokenModel": "auth",
+    "ApiKeyModel": "auth",
+    "AuthModel": "auth",
+    "PasswordModel": "auth",
+    "BuildAgent": "build",
+    "BuildArtifact": "build",
+    "BuildCreateRequest": "build",
+    "BuildDeleteRequest": "build",
+    "BuildDiffResponse": "build",
+    "BuildDiffResponseDetail": "build",
+    "BuildError": "build",
+    "BuildInfo": "build",
+    "BuildInfoDetail": "build",
+    "BuildListResponse": "build",
+    "BuildModules": "build",
+    "BuildPromotionOutcome": "build",
+    "BuildPromotionReport": "build",
+    "BuildPromotionRequest": "build",
+    "BuildPromotionResult": "build",
+    "BuildProperties": "build",
+    "BuildProvenance": "build",
+    "BuildRetentionPlan": "build",
+    "BuildRetentionPolicy": "build",
+    "BuildRuns": "build",
+    "Run": "build",
+    "SimpleBuild": "build",
+    "Group": "group",
+    "GroupMembershipChange": "group",
+    "SimpleGroup": "group",
+    "Permission": "permission",
+    "PermissionV2": "permission",
+    "SimplePermission": "permission",
+    "FederatedRepository": "repository",
+    "FederatedRepositoryResponse": "repository",
+    "LocalRepository": "repository",
+    "LocalRepositoryResponse": "repository",
+    "RemoteRepository": "repository",
+    "RemoteRepositoryResponse": "repository",
+    "RepositoryAction": "repository",
+    "RepositoryChange": "repository",
+    "RepositoryFieldChange": "repository",
+    "RepositoryPlan": "repository",
+    "SimpleRepository": "repository",
+    "VirtualRepository": "repository",
+    "VirtualRepositoryResponse": "repository",
+    "BaseUserModel": "user",
+    "NewUser": "user",
+    "SimpleUser": "user",
+    "User": "user",
+    "UserResponse": "user",
+    "UserUpsertAction": "user",
+    "UserUpsertReport": "user",
+    "UserUpsertResult": "user",
+    "AnyRepositoryResponse": "repository",
+    "AnyRepository": "repository",
+    "AnyPermission": "permission",
+}
 
 __all__ = [
     "ArtifactFileInfoResponse",
@@ -69,6 +146,7 @@ __all__ = [
     "PasswordModel",
     "Group",
     "SimpleGroup",
+    "GroupMembershipChange",
     "Permission",
     "PermissionV2",
     "SimplePermission",
@@ -79,6 +157,10 @@ __all__ = [
     "FederatedRepository",
     "FederatedRepositoryResponse",
     "SimpleRepository",
+    "RepositoryAction",
+    "RepositoryChange",
+    "RepositoryFieldChange",
+    "RepositoryPlan",
     "VirtualRepository",
     "VirtualRepositoryResponse",
     "User",
@@ -86,6 +168,9 @@ __all__ = [
     "BaseUserModel",
     "NewUser",
     "SimpleUser",
+    "UserUpsertAction",
+    "UserUpsertReport",
+    "UserUpsertResult",
     "AnyRepositoryResponse",
     "AnyRepository",
     "AnyPermission",
@@ -99,11 +184,30 @@ __all__ = [
     "BuildInfoDetail",
     "BuildInfo",
     "BuildPromotionResult",
+    "BuildPromotionOutcome",
+    "BuildPromotionReport",
     "BuildPromotionRequest",
     "BuildProperties",
+    "BuildProvenance",
+    "BuildRetentionPlan",
+    "BuildRetentionPolicy",
     "BuildError",
     "BuildDeleteRequest",
     "BuildDiffResponseDetail",
     "BuildDiffResponse",
     "BuildCreateRequest",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
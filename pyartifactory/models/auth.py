@@ -3,21 +3,31 @@ Definition of all auth models.
 """
 from __future__ import annotations
 
-from typing import Optional, Tuple, Union
+from typing import Callable, List, Literal, Optional, Tuple, Union
 
-from pydantic import BaseModel, SecretStr
+from pydantic import BaseModel, ConfigDict, SecretStr
+
+from pyartifactory.metrics import MetricsCallback
+from pyartifactory.tracing import Tracer
 
 
 class AuthModel(BaseModel):
     """Models an auth response."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     url: str
     auth: Optional[Tuple[str, SecretStr]] = None
     access_token: Optional[str] = None
+    token_provider: Optional[Callable[[], str]] = None
     verify: Union[bool, str] = True
     cert: Optional[str] = None
     api_version: int = 1
     timeout: Optional[int] = None
+    metrics_callbacks: List[MetricsCallback] = []
+    tracer: Optional[Tracer] = None
+    trusted_responses: bool = False
+    json_backend: Literal["json", "orjson", "msgspec"] = "json"
 
 
 class ApiKeyModel(BaseModel):
@@ -3,13 +3,26 @@ Definition of all build models.
 """
 from __future__ import annotations
 
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional
+from urllib.parse import unquote
 
 from pydantic import BaseModel, Field, model_serializer, model_validator
 from pydantic_core import PydanticCustomError
 from typing_extensions import Self
 
 
+def parse_build_timestamp(value: str) -> datetime:
+    """
+    :param value: Timestamp as formatted by artifactory, e.g. "2014-09-30T12:00:19.893+0300"
+    :return: The timezone aware datetime
+    """
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+    except ValueError:
+        return datetime.fromisoformat(value)
+
+
 class BuildProperties(BaseModel):
     started: Optional[str] = None
     diff: Optional[str] = None
@@ -29,6 +42,11 @@ class SimpleBuild(BaseModel):
     uri: str
     lastStarted: str
 
+    @property
+    def name(self) -> str:
+        """Name of the build, from its uri."""
+        return unquote(self.uri.lstrip("/"))
+
 
 class BuildListResponse(BaseModel):
     """Models all artifactory builds."""
@@ -43,6 +61,16 @@ class Run(BaseModel):
     uri: str
     started: str
 
+    @property
+    def number(self) -> str:
+        """Build number of the run, from its uri."""
+        return unquote(self.uri.lstrip("/"))
+
+    @property
+    def started_at(self) -> datetime:
+        """Start time of the run."""
+        return parse_build_timestamp(self.started)
+
 
 class BuildRuns(BaseModel):
     """Models artifactory build runs."""
@@ -62,6 +90,16 @@ class BuildArtifact(BaseModel):
     path: str
 
 
+class Dependencies(BaseModel):
+    """Build's dependency."""
+
+    type: Optional[str] = None
+    sha1: Optional[str] = None
+    md5: Optional[str] = None
+    id: Optional[str] = None
+    scopes: Optional[List[str]] = None
+
+
 class BuildModules(BaseModel):
     """Models artifactory's build modules."""
 
@@ -69,6 +107,7 @@ class BuildModules(BaseModel):
     type: Optional[str] = None
     id: str
     artifacts: List[BuildArtifact]
+    dependencies: Optional[List[Dependencies]] = None
 
 
 class BuildAgent(BaseModel):
@@ -110,6 +149,41 @@ class BuildPromotionResult(BaseModel):
     messages: List[Dict[str, str]] = []
 
 
+class BuildPromotionOutcome(BaseModel):
+    """Models the outcome of the promotion of a build run."""
+
+    build_name: str
+    build_number: str
+    messages: List[Dict[str, str]] = []
+    error: Optional[str] = None
+
+    @property
+    def promoted(self) -> bool:
+        """Whether the build run was promoted."""
+        return self.error is None
+
+
+class BuildPromotionReport(BaseModel):
+    """Models the outcome of several build promotions."""
+
+    results: List[BuildPromotionOutcome] = []
+
+    @property
+    def messages(self) -> List[Dict[str, str]]:
+        """The messages of all the promotions, merged."""
+        return [message for result in self.results for message in result.messages]
+
+    @property
+    def promoted(self) -> List[BuildPromotionOutcome]:
+        """The promotions that succeeded."""
+        return [result for result in self.results if result.promoted]
+
+    @property
+    def failed(self) -> List[BuildPromotionOutcome]:
+        """The promotions that failed."""
+        return [result for result in self.results if not result.promoted]
+
+
 class BuildPromotionRequest(BaseModel):
     status: str = ""
     comment: str = ""
@@ -153,6 +227,66 @@ class BuildDeleteRequest(BaseModel):
         return d
 
 
+class BuildRetentionPolicy(BaseModel):
+    """
+    Models a retention policy of build runs: a run is kept if it is one of the last keep_last runs,
+    or if it started less than max_age ago. The other runs are deleted.
+    """
+
+    keep_last: Optional[int] = None
+    max_age: Optional[timedelta] = None
+    delete_artifacts: bool = False
+
+    @model_validator(mode="after")
+    def check_keep_last_or_max_age(self) -> Self:
+        if self.keep_last is not None or self.max_age is not None:
+            return self
+        raise PydanticCustomError("policy_schema_error", "Either keep_last or max_age must be specified", None)
+
+    def expired_runs(self, runs: List[Run], now: datetime) -> List[Run]:
+        """
+        :param runs: Runs of a build
+        :param now: Current time (timezone aware)
+        :return: The runs to delete, most recent first
+        """
+        ordered = sorted(runs, key=lambda run: run.started_at, reverse=True)
+        expired = ordered if self.keep_last is None else ordered[self.keep_last :]
+        if self.max_age is not None:
+            oldest_kept = now - self.max_age
+            expired = [run for run in expired if run.started_at < oldest_kept]
+        return expired
+
+
+class BuildRetentionPlan(BaseModel):
+    """Models the build runs deleted by retention policies."""
+
+    requests: List[BuildDeleteRequest] = []
+    dry_run: bool = False
+
+    @property
+    def deleted(self) -> Dict[str, List[str]]:
+        """Build numbers deleted, by build name."""
+        deleted: Dict[str, List[str]] = {}
+        for request in self.requests:
+            deleted.setdefault(request.buildName, []).extend(request.buildNumbers)
+        return deleted
+
+    def __str__(self) -> str:
+        return "\n".join(
+            f"- {build_name} #{build_number}"
+            for build_name, build_numbers in self.deleted.items()
+            for build_number in build_numbers
+        )
+
+
+class BuildProvenance(BaseModel):
+    """Models the build, and its module, which produced an artifact."""
+
+    build_name: str
+    build_number: str
+    module_id: str
+
+
 class BuildDiffResponseDetail(BaseModel):
     updated: List[str] = []
     unchanged: List[str] = []
@@ -203,18 +337,10 @@ class Artifacts(BaseModel):
 
     type: Optional[str] = None
     sha1: Optional[str] = None
+    sha256: Optional[str] = None
     md5: Optional[str] = None
     name: Optional[str] = None
-
-
-class Dependencies(BaseModel):
-    """Build's dependency."""
-
-    type: Optional[str] = None
-    sha1: Optional[str] = None
-    md5: Optional[str] = None
-    id: Optional[str] = None
-    scopes: Optional[List[str]] = None
+    path: Optional[str] = None
 
 
 class BuildSingleModule(BaseModel):
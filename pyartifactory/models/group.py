@@ -27,3 +27,16 @@ class SimpleGroup(BaseModel):
 
     name: str
     uri: str
+
+
+class GroupMembershipChange(BaseModel):
+    """Models the change of the members of a group needed to reach its desired members."""
+
+    name: str
+    added: List[str] = []
+    removed: List[str] = []
+
+    @property
+    def changed(self) -> bool:
+        """Whether at least one member is added or removed."""
+        return bool(self.added or self.removed)
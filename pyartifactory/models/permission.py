@@ -4,7 +4,7 @@ Definition of all permission models.
 from __future__ import annotations
 
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -105,3 +105,6 @@ class PermissionV2(BaseModel):
     repo: Optional[RepoV2] = None
     build: Optional[BuildV2] = None
     releaseBundle: Optional[ReleaseBundleV2] = None
+
+
+AnyPermission = Union[Permission, PermissionV2]
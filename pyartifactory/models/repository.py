@@ -4,7 +4,7 @@ Definition of all repository models.
 from __future__ import annotations
 
 from enum import Enum
-from typing import List, Literal, Optional
+from typing import Any, List, Literal, Optional, Union
 
 from pydantic import BaseModel, SecretStr
 
@@ -388,3 +388,57 @@ class FederatedRepositoryResponse(FederatedBaseRepostoryModel):
     enableVagrantSupport: bool = False
     enableGitLfsSupport: bool = False
     enableDistRepoSupport: bool = False
+
+
+AnyRepositoryResponse = Union[
+    LocalRepositoryResponse,
+    VirtualRepositoryResponse,
+    RemoteRepositoryResponse,
+    FederatedRepositoryResponse,
+]
+
+AnyRepository = Union[LocalRepository, VirtualRepository, RemoteRepository, FederatedRepository]
+
+
+class RepositoryAction(str, Enum):
+    """Enumerates the actions applying a desired repository configuration."""
+
+    create = "create"
+    update = "update"
+    unchanged = "unchanged"
+
+
+class RepositoryFieldChange(BaseModel):
+    """Models a field of a repository configuration to change."""
+
+    field: str
+    current: Any = None
+    desired: Any = None
+
+
+class RepositoryChange(BaseModel):
+    """Models the change of a repository needed to reach its desired configuration."""
+
+    key: str
+    action: RepositoryAction
+    fields: List[RepositoryFieldChange] = []
+
+
+class RepositoryPlan(BaseModel):
+    """Models the changes needed to reach a desired set of repository configurations."""
+
+    changes: List[RepositoryChange] = []
+    dry_run: bool = False
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether at least one repository has to be created or updated."""
+        return any(change.action != RepositoryAction.unchanged for change in self.changes)
+
+    def __str__(self) -> str:
+        symbols = {RepositoryAction.create: "+", RepositoryAction.update: "~", RepositoryAction.unchanged: " "}
+        lines = []
+        for change in self.changes:
+            lines.append(f"{symbols[change.action]} {change.key} ({change.action.value})")
+            lines.extend(f"    {field.field}: {field.current!r} -> {field.desired!r}" for field in change.fields)
+        return "\n".join(lines)
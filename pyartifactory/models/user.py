@@ -4,6 +4,7 @@ Definition of all user related models.
 from __future__ import annotations
 
 from datetime import datetime
+from enum import Enum
 from typing import List, Optional
 
 from pydantic import BaseModel, EmailStr, SecretStr
@@ -51,3 +52,39 @@ class UserResponse(BaseUserModel):
     lastLoggedIn: Optional[datetime] = None
     realm: Optional[str] = None
     offlineMode: bool = False
+
+
+class UserUpsertAction(str, Enum):
+    """Enumerates the outcomes of a user upsert."""
+
+    created = "created"
+    updated = "updated"
+    unchanged = "unchanged"
+    failed = "failed"
+
+
+class UserUpsertResult(BaseModel):
+    """Models the outcome of the upsert of a user."""
+
+    name: str
+    action: UserUpsertAction
+    fields: List[str] = []
+    error: Optional[str] = None
+
+
+class UserUpsertReport(BaseModel):
+    """Models the outcome of a bulk user upsert."""
+
+    results: List[UserUpsertResult] = []
+
+    def names(self, action: UserUpsertAction) -> List[str]:
+        """
+        :param action: Outcome of the upserts
+        :return: The names of the users with this outcome
+        """
+        return [result.name for result in self.results if result.action == action]
+
+    @property
+    def failed(self) -> List[UserUpsertResult]:
+        """The upserts that failed."""
+        return [result for result in self.results if result.action == UserUpsertAction.failed]
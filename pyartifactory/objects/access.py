@@ -0,0 +1,267 @@
+"""
+Definition of the effective access resolver, answering permission queries locally.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Set, Tuple, Union
+
+from pyartifactory.models.group import Group
+from pyartifactory.models.permission import AnyPermission, Permission, PermissionEnum, PermissionEnumV2
+from pyartifactory.models.repository import SimpleRepository
+from pyartifactory.objects.group import ArtifactoryGroup
+from pyartifactory.objects.object import map_concurrently
+from pyartifactory.objects.permission import ArtifactoryPermission
+from pyartifactory.objects.repository import ArtifactoryRepository
+
+logger = logging.getLogger("pyartifactory")
+
+_V1_ACTIONS = {
+    PermissionEnum.admin: PermissionEnumV2.manage,
+    PermissionEnum.delete: PermissionEnumV2.delete,
+    PermissionEnum.deploy: PermissionEnumV2.write,
+    PermissionEnum.annotate: PermissionEnumV2.annotate,
+    PermissionEnum.read: PermissionEnumV2.read,
+    PermissionEnum.distribute: PermissionEnumV2.distribute,
+    PermissionEnum.managedXrayMeta: PermissionEnumV2.managedXrayMeta,
+}
+
+# Repository names of permission targets standing for a whole class of repositories
+_ANY_REPOSITORIES = {"ANY": None, "ANY LOCAL": "local", "ANY REMOTE": "remote", "ANY DISTRIBUTION": "distribution"}
+
+
+def compile_ant_patterns(patterns: Iterable[str]) -> Optional[Pattern[str]]:
+    """
+    Compile Ant-style path patterns, as used by permission targets, into a single regular expression.
+    "**" matches any number of folders, "*" any characters but "/" and "?" a single one.
+    A pattern may hold several comma separated patterns.
+    :param patterns: Ant-style patterns, e.g. ["org/**", "**/*.jar"]
+    :return: The compiled expression, None when there is no pattern at all
+    """
+    expressions = [
+        _ant_to_regex(pattern.strip().strip("/"))
+        for patterns_list in patterns
+        for pattern in patterns_list.split(",")
+        if pattern.strip()
+    ]
+    if not expressions:
+        return None
+    return re.compile("|".join(f"(?:{expression})" for expression in expressions))
+
+
+def _ant_to_regex(pattern: str) -> str:
+    parts = pattern.split("/")
+    if parts == ["**"]:
+        return ".*"
+    expression = ""
+    for index, part in enumerate(parts):
+        if part == "**":
+            if index == 0:
+                expression += "(?:.*/)?"
+            elif index == len(parts) - 1:
+                expression += "(?:/.*)?"
+            else:
+                expression += "/(?:.*/)?"
+            continue
+        if index > 0 and parts[index - 1] != "**":
+            expression += "/"
+        expression += "".join(
+            "[^/]*" if character == "*" else "[^/]" if character == "?" else re.escape(character) for character in part
+        )
+    return expression
+
+
+class _Target:
+    """A permission target, with its repositories resolved and its patterns compiled."""
+
+    def __init__(
+        self,
+        name: str,
+        repositories: List[str],
+        include_patterns: List[str],
+        exclude_patterns: List[str],
+    ) -> None:
+        self.name = name
+        self.repositories = {repository for repository in repositories if repository not in _ANY_REPOSITORIES}
+        self.any_rclasses = {
+            _ANY_REPOSITORIES[repository] for repository in repositories if repository in _ANY_REPOSITORIES
+        }
+        self.includes = compile_ant_patterns(include_patterns)
+        self.excludes = compile_ant_patterns(exclude_patterns)
+
+    def covers(self, repository: str, rclass: Optional[str], path: Optional[str]) -> bool:
+        if repository not in self.repositories and None not in self.any_rclasses and rclass not in self.any_rclasses:
+            return False
+        if path is None:
+            return True
+        path = path.strip("/")
+        if self.includes is None or not self.includes.fullmatch(path):
+            return False
+        return self.excludes is None or not self.excludes.fullmatch(path)
+
+
+Grant = Tuple[_Target, FrozenSet[PermissionEnumV2]]
+
+
+class EffectiveAccess:
+    """
+    Models the effective access of users to repositories, resolved locally from the permission targets,
+    the group memberships and the repositories.
+    Only the repository part of the permission targets is considered. Groups with admin privileges grant
+    every action; the admin flag of the users themselves is not known here and is not taken into account.
+    """
+
+    def __init__(
+        self,
+        permissions: Iterable[AnyPermission],
+        groups: Iterable[Group],
+        repositories: Iterable[SimpleRepository],
+    ) -> None:
+        """
+        :param permissions: Permission targets, either v1 or v2
+        :param groups: Groups, with their members (userNames)
+        :param repositories: Repositories, to resolve the "ANY LOCAL" or "ANY REMOTE" targets
+        """
+        self._rclasses = {repository.key: repository.type.lower() for repository in repositories}
+        self._user_grants: Dict[str, List[Grant]] = {}
+        self._group_grants: Dict[str, List[Grant]] = {}
+        self._user_groups: Dict[str, Set[str]] = {}
+        self._admin_groups: Set[str] = set()
+
+        for group in groups:
+            if group.adminPrivileges:
+                self._admin_groups.add(group.name)
+            for user_name in group.userNames or []:
+                self._user_groups.setdefault(user_name, set()).add(group.name)
+
+        for permission in permissions:
+            self._add_permission(permission)
+
+    @classmethod
+    def load(
+        cls,
+        permissions: ArtifactoryPermission,
+        groups: ArtifactoryGroup,
+        repositories: ArtifactoryRepository,
+        concurrency: int = 8,
+    ) -> EffectiveAccess:
+        """
+        Bulk loads the permission targets, groups and repositories, the details being fetched concurrently.
+        :param permissions: Permissions client
+        :param groups: Groups client
+        :param repositories: Repositories client
+        :param concurrency: Maximum number of concurrent requests
+        :return: The effective access resolver
+        """
+        permission_names = [permission.name for permission in permissions.list()]
+        group_names = [group.name for group in groups.list()]
+        access = cls(
+            map_concurrently(permissions.session, permissions.get, permission_names, concurrency),
+            map_concurrently(groups.session, groups.get, group_names, concurrency),
+            repositories.list(),
+        )
+        logger.debug("Effective access loaded from %s permission targets", len(permission_names))
+        return access
+
+    def _add_permission(self, permission: AnyPermission) -> None:
+        users: Dict[str, FrozenSet[PermissionEnumV2]]
+        groups: Dict[str, FrozenSet[PermissionEnumV2]]
+        if isinstance(permission, Permission):
+            target = _Target(
+                permission.name,
+                permission.repositories,
+                [permission.includesPattern],
+                [permission.excludesPattern],
+            )
+            users = {
+                user: frozenset(_V1_ACTIONS[action] for action in actions)
+                for user, actions in (permission.principals.users or {}).items()
+            }
+            groups = {
+                group: frozenset(_V1_ACTIONS[action] for action in actions)
+                for group, actions in (permission.principals.groups or {}).items()
+            }
+        else:
+            if permission.repo is None:
+                return
+            target = _Target(
+                permission.name,
+                permission.repo.repositories,
+                permission.repo.includePatterns,
+                permission.repo.excludePatterns,
+            )
+            users = {user: frozenset(actions) for user, actions in (permission.repo.actions.users or {}).items()}
+            groups = {group: frozenset(actions) for group, actions in (permission.repo.actions.groups or {}).items()}
+
+        for user, user_actions in users.items():
+            self._user_grants.setdefault(user, []).append((target, user_actions))
+        for group, group_actions in groups.items():
+            self._group_grants.setdefault(group, []).append((target, group_actions))
+
+    def groups_of(self, user_name: str) -> Set[str]:
+        """
+        :param user_name: Name of the user
+        :return: Names of the groups of the user
+        """
+        return set(self._user_groups.get(user_name, set()))
+
+    def actions(self, user_name: str, repository: str, path: Optional[str] = None) -> Set[PermissionEnumV2]:
+        """
+        :param user_name: Name of the user
+        :param repository: Key of the repository
+        :param path: Path in the repository, None for anywhere in the repository
+        :return: The actions the user is allowed to perform
+        """
+        user_groups = self._user_groups.get(user_name, set())
+        if user_groups & self._admin_groups:
+            return set(PermissionEnumV2)
+        rclass = self._rclasses.get(repository)
+        grants = list(self._user_grants.get(user_name, []))
+        for group_name in user_groups:
+            grants.extend(self._group_grants.get(group_name, []))
+        allowed: Set[PermissionEnumV2] = set()
+        for target, actions in grants:
+            if not actions <= allowed and target.covers(repository, rclass, path):
+                allowed |= actions
+        return allowed
+
+    def can(
+        self,
+        user_name: str,
+        action: Union[PermissionEnumV2, PermissionEnum, str],
+        repository: str,
+        path: Optional[str] = None,
+    ) -> bool:
+        """
+        :param user_name: Name of the user
+        :param action: Action, e.g. PermissionEnumV2.write, PermissionEnum.deploy or "write"
+        :param repository: Key of the repository
+        :param path: Path in the repository, None for anywhere in the repository
+        :return: Whether the user is allowed to perform the action
+        """
+        return _to_action(action) in self.actions(user_name, repository, path)
+
+    def users_with(
+        self,
+        action: Union[PermissionEnumV2, PermissionEnum, str],
+        repository: str,
+        path: Optional[str] = None,
+    ) -> List[str]:
+        """
+        :param action: Action, e.g. PermissionEnumV2.write, PermissionEnum.deploy or "write"
+        :param repository: Key of the repository
+        :param path: Path in the repository, None for anywhere in the repository
+        :return: Names of the known users allowed to perform the action, the members of groups included
+        """
+        users = set(self._user_grants) | set(self._user_groups)
+        return sorted(user for user in users if self.can(user, action, repository, path))
+
+
+def _to_action(action: Union[PermissionEnumV2, PermissionEnum, str]) -> PermissionEnumV2:
+    if isinstance(action, PermissionEnum):
+        return _V1_ACTIONS[action]
+    try:
+        return PermissionEnumV2(action)
+    except ValueError:
+        return _V1_ACTIONS[PermissionEnum[action] if action in PermissionEnum.__members__ else PermissionEnum(action)]
@@ -5,7 +5,7 @@ import os
 import urllib
 from collections.abc import Iterator
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import requests
 from pydantic import ValidationError
@@ -23,6 +23,11 @@ from pyartifactory.models.artifact import (
 )
 from pyartifactory.objects.object import ArtifactoryObject
 
+if TYPE_CHECKING:
+    from pyartifactory.models.build import BuildSingleModule
+    from pyartifactory.objects.blob_cache import BlobCache
+    from pyartifactory.objects.remote_file import RemoteFile
+
 logger = logging.getLogger("pyartifactory")
 
 
@@ -65,9 +70,9 @@ class ArtifactoryArtifact(ArtifactoryObject):
             artifact_as_url = urllib.parse.quote(artifact_as_posix)
             response = self._get(f"api/storage/{artifact_as_url}")
             try:
-                artifact_info: ArtifactInfoResponse = ArtifactFolderInfoResponse.model_validate(response.json())
+                artifact_info: ArtifactInfoResponse = self._parse(response, ArtifactFolderInfoResponse)
             except ValidationError:
-                artifact_info = ArtifactFileInfoResponse.model_validate(response.json())
+                artifact_info = self._parse(response, ArtifactFileInfoResponse)
             return artifact_info
         except requests.exceptions.HTTPError as error:
             http_response: Union[Response, None] = error.response
@@ -82,12 +87,15 @@ class ArtifactoryArtifact(ArtifactoryObject):
         artifact_path: Union[Path, str],
         properties: Optional[Dict[str, List[str]]] = None,
         checksum_enabled: bool = False,
+        build_module: Optional[BuildSingleModule] = None,
     ) -> ArtifactInfoResponse:
         """
         Deploy a file or directory.
         :param artifact_path: Path to artifactory in Artifactory
         :param local_file_location: Location of the file or folder to deploy
         :param checksum_enabled: Enable checksum generation and use it for validation of the deployment
+        :param build_module: Build module to which every deployed file is added as an artifact, with the checksums
+                             computed for the deployment, to be published with create_build
         """
         local_file = Path(local_file_location)
         artifact_folder = Path(artifact_path)
@@ -96,7 +104,13 @@ class ArtifactoryArtifact(ArtifactoryObject):
             for root, _, files in os.walk(local_file.as_posix()):
                 new_root = f"{artifact_folder}/{root[len(local_file.as_posix()):]}"
                 for file in files:
-                    self.deploy(Path(f"{root}/{file}"), Path(f"{new_root}/{file}"), properties, checksum_enabled)
+                    self.deploy(
+                        Path(f"{root}/{file}"),
+                        Path(f"{new_root}/{file}"),
+                        properties,
+                        checksum_enabled,
+                        build_module,
+                    )
         else:
             properties_param_str = ""
             if properties is not None:
@@ -129,6 +143,20 @@ class ArtifactoryArtifact(ArtifactoryObject):
                 with local_file.open("rb") as stream:
                     self._put(route=route, headers=headers, data=stream)
 
+            if build_module is not None:
+                from pyartifactory.models.build import Artifacts
+
+                build_module.artifacts = [
+                    *(build_module.artifacts or []),
+                    Artifacts(
+                        type=artifact_folder.suffix.lstrip(".") or None,
+                        sha1=artifact_check_sums.sha1,
+                        sha256=artifact_check_sums.sha256,
+                        md5=artifact_check_sums.md5,
+                        name=artifact_folder.name,
+                        path=artifact_folder.as_posix().lstrip("/").partition("/")[2],
+                    ),
+                ]
             logger.debug("Artifact %s successfully deployed", local_file)
         return self.info(artifact_folder)
 
@@ -144,11 +172,19 @@ class ArtifactoryArtifact(ArtifactoryObject):
             return _str[len(prefix) :]
         raise ValueError(f"Input string, '{_str}', doesn't have the prefix: '{prefix}'")
 
-    def _download(self, artifact_path: str, local_directory_path: Optional[Path] = None) -> Path:
+    def _download(
+        self,
+        artifact_path: str,
+        local_directory_path: Optional[Path] = None,
+        checksums: Optional[Checksums] = None,
+        cache: Optional[BlobCache] = None,
+    ) -> Path:
         """
         Download artifact (file) into local directory.
         :param artifact_path: Path to file in Artifactory
         :param local_directory_path: Local path to where the artifact will be downloaded
+        :param checksums: Checksums of the artifact, from its file info
+        :param cache: Blob cache the artifact is taken from, or added to, when its checksums are known
         :return: File name
         """
         artifact_path = artifact_path.lstrip("/")
@@ -161,6 +197,17 @@ class ArtifactoryArtifact(ArtifactoryObject):
             local_file_full_path = Path(local_filename)
 
         artifact_path_url = urllib.parse.quote(artifact_path)
+        if cache is not None and checksums is not None:
+            algorithm, checksum = ("sha256", checksums.sha256) if checksums.sha256 else ("sha1", checksums.sha1)
+
+            def write(file: Any) -> None:
+                with self._get(f"{artifact_path_url}", stream=True) as response:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        if chunk:  # filter out keep-alive new chunks
+                            file.write(chunk)
+
+            return cache.fetch(algorithm, checksum, write, target=local_file_full_path)
+
         with self._get(f"{artifact_path_url}", stream=True) as response, local_file_full_path.open("wb") as file:
             for chunk in response.iter_content(chunk_size=8192):
                 if chunk:  # filter out keep-alive new chunks
@@ -168,11 +215,17 @@ class ArtifactoryArtifact(ArtifactoryObject):
         logger.debug("Artifact %s successfully downloaded", local_filename)
         return local_file_full_path
 
-    def download(self, artifact_path: str, local_directory_path: str = ".") -> Path:
+    def download(
+        self,
+        artifact_path: str,
+        local_directory_path: str = ".",
+        cache: Optional[BlobCache] = None,
+    ) -> Path:
         """
         Download artifact (file or directory) into local directory.
         :param artifact_path: Path to file or directory in Artifactory
         :param local_directory_path: Local path to where the artifact will be downloaded
+        :param cache: Blob cache, keyed by checksum, the files are taken from when already cached
         :return: File name
         """
         artifact_path = artifact_path.rstrip("/")
@@ -185,9 +238,57 @@ class ArtifactoryArtifact(ArtifactoryObject):
             if isinstance(art, ArtifactFolderInfoResponse):
                 local_path.mkdir(exist_ok=True)
             else:
-                self._download(full_path, local_path.parent)
+                self._download(full_path, local_path.parent, art.checksums, cache)
         return Path(local_directory_path).joinpath(basename)
 
+    def open(
+        self,
+        artifact_path: str,
+        block_size: int = 256 * 1024,
+        read_ahead: int = 4,
+        cache_blocks: int = 64,
+    ) -> RemoteFile:
+        """
+        Open an artifact as a read-only, seekable file, reading only the parts actually needed with Range requests,
+        e.g. zipfile.ZipFile(art.artifacts.open(path)) only reads the central directory and the extracted members.
+        :param artifact_path: Path to file in Artifactory
+        :param block_size: Number of bytes of a block, the unit of the reads
+        :param read_ahead: Number of blocks read ahead of a sequential read
+        :param cache_blocks: Maximum number of blocks kept in memory
+        :return: The file object, an io.RawIOBase
+        """
+        from pyartifactory.objects.remote_file import RemoteFile
+
+        artifact_info = self.info(artifact_path)
+        if not isinstance(artifact_info, ArtifactFileInfoResponse) or artifact_info.size is None:
+            raise ArtifactoryError(f"Artifact {artifact_path} is not a file")
+        return RemoteFile(
+            self,
+            artifact_path.lstrip("/"),
+            artifact_info.size,
+            block_size=block_size,
+            read_ahead=read_ahead,
+            cache_blocks=cache_blocks,
+        )
+
+    def read_range(self, artifact_path: str, start: int, end: int) -> Response:
+        """
+        Read a range of bytes of an artifact with a single Range request.
+        A server ignoring Range requests answers with a 200 status and the whole content, instead of a 206.
+        :param artifact_path: Path to file in Artifactory
+        :param start: Offset of the first byte
+        :param end: Offset after the last byte
+        :return: The response, its status code telling whether only the range was read
+        """
+        artifact_path = artifact_path.lstrip("/")
+        try:
+            return self._get(urllib.parse.quote(artifact_path), headers={"Range": f"bytes={start}-{end - 1}"})
+        except requests.exceptions.HTTPError as error:
+            if error.response is not None and error.response.status_code == 404:
+                logger.error("Artifact %s does not exist", artifact_path)
+                raise ArtifactNotFoundError(f"Artifact {artifact_path} does not exist") from error
+            raise ArtifactoryError from error
+
     def list(
         self,
         artifact_path: str,
@@ -214,7 +315,7 @@ class ArtifactoryArtifact(ArtifactoryObject):
             if depth is not None:
                 params.update(depth=depth)
             response = self._get(f"api/storage/{artifact_path}?list", params=params)
-            artifact_list: ArtifactListResponse = ArtifactListResponse.model_validate(response.json())
+            artifact_list: ArtifactListResponse = self._parse(response, ArtifactListResponse)
             return artifact_list
         except requests.exceptions.HTTPError as error:
             http_response: Union[Response, None] = error.response
@@ -245,7 +346,7 @@ class ArtifactoryArtifact(ArtifactoryObject):
                 params={"properties": ",".join(properties)},
             )
             logger.debug("Artifact Properties successfully retrieved")
-            return ArtifactPropertiesResponse(**response.json())
+            return self._parse(response, ArtifactPropertiesResponse)
         except requests.exceptions.HTTPError as error:
             http_response: Union[Response, None] = error.response
             if isinstance(http_response, Response) and http_response.status_code == 404:
@@ -327,7 +428,7 @@ class ArtifactoryArtifact(ArtifactoryObject):
         artifact_path = artifact_path.lstrip("/")
         response = self._get(f"api/storage/{artifact_path}?stats")
         logger.debug("Artifact stats successfully retrieved")
-        return ArtifactStatsResponse(**response.json())
+        return self._parse(response, ArtifactStatsResponse)
 
     def copy(self, artifact_current_path: str, artifact_new_path: str, dryrun: bool = False) -> ArtifactInfoResponse:
         """
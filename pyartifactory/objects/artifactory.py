@@ -1,17 +1,27 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple, Union
+import functools
+from typing import TYPE_CHECKING, Callable, List, Literal, Optional, Tuple, Union
 
 from pydantic import SecretStr
 
+from pyartifactory.metrics import MetricsCallback
 from pyartifactory.models.auth import AuthModel
-from pyartifactory.objects.artifact import ArtifactoryArtifact
-from pyartifactory.objects.build import ArtifactoryBuild
-from pyartifactory.objects.group import ArtifactoryGroup
-from pyartifactory.objects.permission import ArtifactoryPermission
-from pyartifactory.objects.repository import ArtifactoryRepository
-from pyartifactory.objects.security import ArtifactorySecurity
-from pyartifactory.objects.user import ArtifactoryUser
+from pyartifactory.tracing import Tracer
+
+if TYPE_CHECKING:
+    from pyartifactory.objects.access import EffectiveAccess
+    from pyartifactory.objects.artifact import ArtifactoryArtifact
+    from pyartifactory.objects.build import ArtifactoryBuild
+    from pyartifactory.objects.build_cache import BuildInfoCache
+    from pyartifactory.objects.build_catalog import BuildCatalog
+    from pyartifactory.objects.group import ArtifactoryGroup
+    from pyartifactory.objects.permission import ArtifactoryPermission
+    from pyartifactory.objects.provenance import ProvenanceIndex
+    from pyartifactory.objects.repository import ArtifactoryRepository
+    from pyartifactory.objects.security import ArtifactorySecurity
+    from pyartifactory.objects.snapshot import ArtifactorySnapshot
+    from pyartifactory.objects.user import ArtifactoryUser
 
 
 class Artifactory:
@@ -26,20 +36,112 @@ class Artifactory:
         api_version: int = 1,
         timeout: Optional[int] = None,
         access_token: Optional[str] = None,
+        token_provider: Optional[Callable[[], str]] = None,
+        metrics_callbacks: Optional[List[MetricsCallback]] = None,
+        tracer: Optional[Tracer] = None,
+        trusted_responses: bool = False,
+        json_backend: Literal["json", "orjson", "msgspec"] = "json",
     ):
         self.artifactory = AuthModel(
             url=url,
             auth=auth,
             access_token=access_token,
+            token_provider=token_provider,
             verify=verify,
             cert=cert,
             api_version=api_version,
             timeout=timeout,
+            metrics_callbacks=metrics_callbacks or [],
+            tracer=tracer,
+            trusted_responses=trusted_responses,
+            json_backend=json_backend,
         )
-        self.users = ArtifactoryUser(self.artifactory)
-        self.groups = ArtifactoryGroup(self.artifactory)
-        self.security = ArtifactorySecurity(self.artifactory)
-        self.repositories = ArtifactoryRepository(self.artifactory)
-        self.artifacts = ArtifactoryArtifact(self.artifactory)
-        self.permissions = ArtifactoryPermission(self.artifactory)
-        self.builds = ArtifactoryBuild(self.artifactory)
+
+    # Sub-clients are created, and their modules imported, on first access.
+
+    @functools.cached_property
+    def users(self) -> ArtifactoryUser:
+        from pyartifactory.objects.user import ArtifactoryUser
+
+        return ArtifactoryUser(self.artifactory)
+
+    @functools.cached_property
+    def groups(self) -> ArtifactoryGroup:
+        from pyartifactory.objects.group import ArtifactoryGroup
+
+        return ArtifactoryGroup(self.artifactory)
+
+    @functools.cached_property
+    def security(self) -> ArtifactorySecurity:
+        from pyartifactory.objects.security import ArtifactorySecurity
+
+        return ArtifactorySecurity(self.artifactory)
+
+    @functools.cached_property
+    def repositories(self) -> ArtifactoryRepository:
+        from pyartifactory.objects.repository import ArtifactoryRepository
+
+        return ArtifactoryRepository(self.artifactory)
+
+    @functools.cached_property
+    def artifacts(self) -> ArtifactoryArtifact:
+        from pyartifactory.objects.artifact import ArtifactoryArtifact
+
+        return ArtifactoryArtifact(self.artifactory)
+
+    @functools.cached_property
+    def permissions(self) -> ArtifactoryPermission:
+        from pyartifactory.objects.permission import ArtifactoryPermission
+
+        return ArtifactoryPermission(self.artifactory)
+
+    @functools.cached_property
+    def builds(self) -> ArtifactoryBuild:
+        from pyartifactory.objects.build import ArtifactoryBuild
+
+        return ArtifactoryBuild(self.artifactory)
+
+    def snapshot(self, ttl: Optional[float] = 300.0) -> ArtifactorySnapshot:
+        """
+        :param ttl: Number of seconds a listed collection is kept, None to keep it until refreshed
+        :return: An in-memory snapshot of the users, groups, permissions and repositories
+        """
+        from pyartifactory.objects.snapshot import ArtifactorySnapshot
+
+        return ArtifactorySnapshot(self.users, self.groups, self.permissions, self.repositories, ttl=ttl)
+
+    def effective_access(self, concurrency: int = 8) -> EffectiveAccess:
+        """
+        :param concurrency: Maximum number of concurrent requests loading the permissions and groups
+        :return: A resolver of the effective access of users to repositories, answering queries locally
+        """
+        from pyartifactory.objects.access import EffectiveAccess
+
+        return EffectiveAccess.load(self.permissions, self.groups, self.repositories, concurrency=concurrency)
+
+    def build_info_cache(self, maxsize: Optional[int] = 256) -> BuildInfoCache:
+        """
+        :param maxsize: Maximum number of build infos kept, None for no limit
+        :return: A cache of the build infos, comparing builds locally
+        """
+        from pyartifactory.objects.build_cache import BuildInfoCache
+
+        return BuildInfoCache(self.builds, maxsize=maxsize)
+
+    def provenance_index(self, path: str) -> ProvenanceIndex:
+        """
+        :param path: Path of the SQLite database holding the index, created if needed
+        :return: An on-disk index of the artifacts produced by the builds, by checksum
+        """
+        from pyartifactory.objects.provenance import ProvenanceIndex
+
+        return ProvenanceIndex(self.builds, path)
+
+    def build_catalog(self, concurrency: int = 8) -> BuildCatalog:
+        """
+        :param concurrency: Maximum number of concurrent requests reading the runs of the changed builds
+        :return: A local catalog of the builds and their runs, kept up to date by polling
+        """
+        from pyartifactory.objects.build_catalog import BuildCatalog
+
+        return BuildCatalog(self.builds, concurrency=concurrency)
@@ -0,0 +1,244 @@
+"""
+Definition of the content-addressed cache of downloaded artifacts, shared across processes.
+"""
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import IO, Callable, Iterator, Literal, Optional, Union
+
+from pyartifactory.exception import ArtifactoryError
+from pyartifactory.models.artifact import Checksums
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock(fd: int) -> None:
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock(fd: int) -> None:
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+logger = logging.getLogger("pyartifactory")
+
+# ioctl cloning a file on copy-on-write filesystems (btrfs, xfs)
+_FICLONE = 0x40049409
+
+LinkMode = Literal["auto", "reflink", "hardlink", "copy"]
+
+
+class _HashingWriter:
+    """A file wrapper hashing the bytes written to it."""
+
+    def __init__(self, file: IO[bytes], algorithm: str) -> None:
+        self._file = file
+        self.hasher = Checksums.get_hasher(getattr(hashlib, algorithm))
+
+    def write(self, data: bytes) -> int:
+        self.hasher.update(data)
+        return self._file.write(data)
+
+
+class BlobCache:
+    """
+    Models a local cache of downloaded files, keyed by their sha256 (or sha1) checksum, that several processes
+    can share: each blob is written under a file lock to a temporary file, checked against its checksum,
+    then atomically renamed into place. The least recently used blobs are evicted beyond max_size bytes.
+    A cached file is materialised into its target by reflink, copy or hardlink, without any download.
+    """
+
+    def __init__(
+        self,
+        directory: Union[Path, str],
+        max_size: Optional[int] = None,
+        link: LinkMode = "auto",
+    ) -> None:
+        """
+        :param directory: Directory of the cache, created if needed
+        :param max_size: Maximum total size of the blobs in bytes, None for no limit
+        :param link: How cached files are materialised: "reflink", "copy", "hardlink",
+                     or "auto" to try a reflink, then a copy. Hardlinked files share the blob,
+                     so they must never be modified in place, hardlinks being only used when asked for
+        """
+        self._directory = Path(directory)
+        self._max_size = max_size
+        self._link = link
+        (self._directory / "locks").mkdir(parents=True, exist_ok=True)
+
+    def get(self, algorithm: str, checksum: str) -> Optional[Path]:
+        """
+        :param algorithm: "sha256" or "sha1"
+        :param checksum: Checksum of the file
+        :return: Path of the cached blob, None if the file is not cached
+        """
+        blob = self._blob_path(algorithm, checksum)
+        if not blob.is_file():
+            return None
+        # The recency of a blob is kept by its lock file, the mtime of the blob being shared with its hardlinks
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(self._lock_path(self._lock_name(blob)))
+        return blob
+
+    def fetch(
+        self,
+        algorithm: str,
+        checksum: str,
+        write: Callable[[_HashingWriter], None],
+        target: Optional[Path] = None,
+    ) -> Path:
+        """
+        Get a blob, writing it first if it is not cached yet. Concurrent fetches of the same blob,
+        in this process or in others, write it only once.
+        :param algorithm: "sha256" or "sha1"
+        :param checksum: Checksum of the file
+        :param write: Function writing the content of the file to the given writer
+        :param target: Path of a file to materialise the blob into, before any eviction can delete it
+        :return: Path of the cached blob, or the target path when given
+        """
+        blob = self._blob_path(algorithm, checksum)
+        with self._locked(self._lock_name(blob)):
+            if self.get(algorithm, checksum) is not None:
+                logger.debug("Blob %s found in the cache", blob.name)
+                return blob if target is None else self._materialize(blob, target)
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            fd, temporary_name = tempfile.mkstemp(dir=blob.parent, prefix=".", suffix=".part")
+            temporary = Path(temporary_name)
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    writer = _HashingWriter(file, algorithm)
+                    write(writer)
+                if writer.hasher.hexdigest() != checksum.lower():
+                    raise ArtifactoryError(f"Downloaded content doesn't match its {algorithm} checksum {checksum}")
+                temporary.replace(blob)
+                self._lock_path(self._lock_name(blob)).touch()
+            except BaseException:
+                with contextlib.suppress(FileNotFoundError):
+                    temporary.unlink()
+                raise
+            logger.debug("Blob %s added to the cache", blob.name)
+            if target is not None:
+                self._materialize(blob, target)
+        self.evict(keep=blob)
+        return blob if target is None else target
+
+    def materialize(self, blob: Path, target: Path) -> Path:
+        """
+        :param blob: Path of a cached blob
+        :param target: Path of the file to create, replaced if it exists
+        :return: The target path
+        :raise FileNotFoundError: If the blob was evicted meanwhile, which fetch with a target never raises
+        """
+        with self._locked(self._lock_name(blob)):
+            return self._materialize(blob, target)
+
+    def _materialize(self, blob: Path, target: Path) -> Path:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.suppress(FileNotFoundError):
+            target.unlink()
+        modes = ["reflink", "copy"] if self._link == "auto" else [self._link]
+        for mode in modes:
+            try:
+                if mode == "reflink":
+                    self._reflink(blob, target)
+                elif mode == "hardlink":
+                    os.link(blob, target)
+                else:
+                    shutil.copyfile(blob, target)
+                return target
+            except OSError:
+                if mode == modes[-1]:
+                    raise
+                with contextlib.suppress(FileNotFoundError):
+                    target.unlink()
+        return target
+
+    def evict(self, keep: Optional[Path] = None) -> None:
+        """
+        Delete the least recently used blobs until their total size fits in max_size.
+        Each blob is deleted under its own lock, so that it is never deleted while being materialised,
+        along with its lock file.
+        :param keep: A blob never to delete, e.g. the one just added
+        """
+        if self._max_size is None:
+            return
+        with self._locked("eviction"):
+            blobs = []
+            for blob in (self._directory / "blobs").glob("*/*/*"):
+                if blob.name.startswith("."):
+                    continue
+                try:
+                    used = self._lock_path(self._lock_name(blob)).stat().st_mtime
+                except FileNotFoundError:
+                    used = 0.0
+                with contextlib.suppress(FileNotFoundError):
+                    blobs.append((used, blob.stat().st_size, blob))
+            total = sum(size for _, size, _ in blobs)
+            for _, size, blob in sorted(blobs, key=lambda entry: entry[0]):
+                if total <= self._max_size:
+                    break
+                if blob == keep:
+                    continue
+                with self._locked(self._lock_name(blob), remove=True), contextlib.suppress(FileNotFoundError):
+                    blob.unlink()
+                    logger.debug("Blob %s evicted from the cache", blob.name)
+                total -= size
+
+    def _blob_path(self, algorithm: str, checksum: str) -> Path:
+        checksum = checksum.lower()
+        return self._directory / "blobs" / algorithm / checksum[:2] / checksum
+
+    @staticmethod
+    def _lock_name(blob: Path) -> str:
+        return f"{blob.parent.parent.name}-{blob.name}"
+
+    def _lock_path(self, name: str) -> Path:
+        return self._directory / "locks" / f"{name}.lock"
+
+    @contextlib.contextmanager
+    def _locked(self, name: str, remove: bool = False) -> Iterator[None]:
+        """
+        :param name: Name of the lock
+        :param remove: Remove the lock file before releasing it, e.g. along with its evicted blob
+        """
+        path = self._lock_path(name)
+        while True:
+            lock_file = path.open("a+b")
+            lock_file.seek(0)
+            _lock(lock_file.fileno())
+            # A lock file removed while this one was waiting for it no longer locks anything
+            with contextlib.suppress(FileNotFoundError):
+                if os.fstat(lock_file.fileno()).st_ino == path.stat().st_ino:
+                    break
+            _unlock(lock_file.fileno())
+            lock_file.close()
+        try:
+            yield
+        finally:
+            if remove:
+                with contextlib.suppress(OSError):
+                    path.unlink()
+            _unlock(lock_file.fileno())
+            lock_file.close()
+
+    @staticmethod
+    def _reflink(blob: Path, target: Path) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("reflinks are only supported on Linux")
+        with blob.open("rb") as source, target.open("wb") as destination:
+            fcntl.ioctl(destination.fileno(), _FICLONE, source.fileno())
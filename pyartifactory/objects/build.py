@@ -1,25 +1,33 @@
 from __future__ import annotations
 
+import json
 import logging
-from typing import Union
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import requests
 from requests import Response
 
 from pyartifactory.exception import ArtifactoryError, BuildNotFoundError
 from pyartifactory.models.build import (
+    BuildArtifact,
     BuildCreateRequest,
     BuildDeleteRequest,
     BuildDiffResponse,
     BuildError,
     BuildInfo,
     BuildListResponse,
+    BuildPromotionOutcome,
+    BuildPromotionReport,
     BuildPromotionRequest,
     BuildPromotionResult,
     BuildProperties,
+    BuildRetentionPlan,
+    BuildRetentionPolicy,
     BuildRuns,
 )
 from pyartifactory.objects.object import ArtifactoryObject
+from pyartifactory.utils import iter_json_paths
 
 logger = logging.getLogger("pyartifactory")
 
@@ -43,7 +51,7 @@ class ArtifactoryBuild(ArtifactoryObject):
         except requests.exceptions.HTTPError as error:
             self._raise_exception(error)
 
-        return BuildRuns(**response.json())
+        return self._parse(response, BuildRuns)
 
     def get_build_info(
         self,
@@ -66,26 +74,120 @@ class ArtifactoryBuild(ArtifactoryObject):
         except requests.exceptions.HTTPError as error:
             self._raise_exception(error)
 
-        return BuildInfo(**response.json())
+        return self._parse(response, BuildInfo)
 
-    def create_build(self, create_build_request: BuildCreateRequest) -> None:
+    def get_build_infos(
+        self,
+        build_name: str,
+        build_numbers: Optional[Iterable[str]] = None,
+        concurrency: int = 8,
+        started_after: Optional[datetime] = None,
+        started_before: Optional[datetime] = None,
+        properties: BuildProperties = BuildProperties(),
+    ) -> Iterator[BuildInfo]:
+        """
+        Retrieves the build info of several build runs concurrently, yielding each of them as soon as it arrives.
+        The runs are filtered on their start time from a single get_build_runs call, before any build info is read.
+        :param build_name: Build name to be retrieved
+        :param build_numbers: Build numbers to be retrieved, None for all the runs of the build
+        :param concurrency: Maximum number of concurrent requests
+        :param started_after: Only retrieve the runs started at or after this time (timezone aware)
+        :param started_before: Only retrieve the runs started before this time (timezone aware)
+        :param properties: Build properties model, for admitted values
+                           see https://jfrog.com/help/r/jfrog-rest-apis/build-info
+        :return: BuildInfo model objects, in the order of their arrival
+        """
+        if build_numbers is None or started_after is not None or started_before is not None:
+            runs = self.get_build_runs(build_name).buildsNumbers or []
+            selected = [
+                run.number
+                for run in runs
+                if (started_after is None or run.started_at >= started_after)
+                and (started_before is None or run.started_at < started_before)
+            ]
+            if build_numbers is not None:
+                wanted = set(build_numbers)
+                selected = [build_number for build_number in selected if build_number in wanted]
+            build_numbers = selected
+
+        yield from self._iter_concurrently(
+            lambda build_number: self.get_build_info(build_name, build_number, properties),
+            build_numbers,
+            concurrency,
+        )
+        logger.debug("Build Infos of %s successfully retrieved", build_name)
+
+    def iter_build_artifacts(
+        self,
+        build_name: str,
+        build_number: str,
+        properties: BuildProperties = BuildProperties(),
+        chunk_size: int = 65536,
+    ) -> Iterator[Tuple[str, BuildArtifact]]:
+        """
+        Parses the artifacts of a build info incrementally from the response stream, so that very large build infos
+        can be scanned or filtered in constant memory. Each artifact comes with the id of its module.
+        :param build_name: Build name to be retrieved
+        :param build_number: Build number to be retrieved
+        :param properties: Build properties model, for admitted values
+                           see https://jfrog.com/help/r/jfrog-rest-apis/build-info
+        :param chunk_size: Number of bytes read from the response at once
+        :return: (module id, artifact) pairs of all the modules, in the order of the build info
+        """
         try:
-            self.get_build_info(create_build_request.name, create_build_request.number)
-        except BuildNotFoundError:
-            # other exception from get_build_info are forwarded to caller.
-            try:
-                # build does not exist, can be created here
-                self._put(f"api/{self._uri}", json=create_build_request.model_dump())
-                logging.debug(
-                    "Build %s in %s successfully created",
-                    create_build_request.number,
-                    create_build_request.name,
-                )
-            except requests.exceptions.HTTPError as error:
-                self._raise_exception(error)
-        else:
+            response = self._get(
+                f"api/{self._uri}/{build_name}/{build_number}{properties.to_query_string()}",
+                stream=True,
+            )
+        except requests.exceptions.HTTPError as error:
+            self._raise_exception(error)
+
+        module_position = -1
+        module_id: Optional[str] = None
+        # Artifacts of a module whose id comes after them in the document, the only ones held in memory
+        pending: List[BuildArtifact] = []
+        with response:
+            for path, positions, item in iter_json_paths(
+                response.iter_content(chunk_size),
+                [["buildInfo", "modules", "*", "id"], ["buildInfo", "modules", "*", "artifacts", "*"]],
+            ):
+                if positions[0] != module_position:
+                    yield from ((module_id or "", artifact) for artifact in pending)
+                    module_position, module_id, pending = positions[0], None, []
+                if path == 0:
+                    module_id = json.loads(item)
+                    yield from ((module_id or "", artifact) for artifact in pending)
+                    pending = []
+                elif module_id is None:
+                    pending.append(BuildArtifact.model_validate_json(item))
+                else:
+                    yield module_id, BuildArtifact.model_validate_json(item)
+            yield from ((module_id or "", artifact) for artifact in pending)
+        logger.debug("Build Artifacts successfully retrieved")
+
+    def build_exists(self, build_name: str, build_number: str) -> bool:
+        """
+        Checks whether a build run exists, with a single request and without reading its build info
+        :param build_name: Build name
+        :param build_number: Build number
+        :return: True if the build run exists
+        """
+        return self._exists(f"api/{self._uri}/{build_name}/{build_number}")
+
+    def create_build(self, create_build_request: BuildCreateRequest) -> None:
+        if self.build_exists(create_build_request.name, create_build_request.number):
             logger.error("Build %s in %s already exists", create_build_request.number, create_build_request.name)
             raise ArtifactoryError(f"Build {create_build_request.number} in {create_build_request.name} already exists")
+        try:
+            # build does not exist, can be created here
+            self._put(f"api/{self._uri}", json=create_build_request.model_dump())
+            logging.debug(
+                "Build %s in %s successfully created",
+                create_build_request.number,
+                create_build_request.name,
+            )
+        except requests.exceptions.HTTPError as error:
+            self._raise_exception(error)
 
     def promote_build(
         self,
@@ -105,23 +207,80 @@ class ArtifactoryBuild(ArtifactoryObject):
             )
         except requests.exceptions.HTTPError as error:
             self._raise_exception(error)
-        else:
-            try:
-                response = self._post(
-                    f"api/{self._uri}/promote/{build_name}/{build_number}",
-                    json=promotion_request.model_dump(),
-                )
-                logging.debug(
-                    "Build %s in %s promoted from %s to %s",
-                    build_number,
-                    build_name,
-                    promotion_request.sourceRepo,
-                    promotion_request.targetRepo,
-                )
-            except requests.exceptions.HTTPError as error:
-                self._raise_exception(error)
 
-        return BuildPromotionResult(**response.json())
+        return self._promote((build_name, build_number, promotion_request))
+
+    def promote_builds(
+        self,
+        promotions: Iterable[Tuple[str, str, BuildPromotionRequest]],
+        concurrency: int = 8,
+        dry_run_first: bool = False,
+    ) -> BuildPromotionReport:
+        """
+        Promotes several builds concurrently, without checking first that each of them exists.
+        A failed promotion is reported for its build and doesn't stop the other promotions.
+        :param promotions: (build name, build number, promotion request) tuples
+        :param concurrency: Maximum number of concurrent requests
+        :param dry_run_first: Run all the promotions as dry runs first, so that nothing is promoted,
+                              and the error raised, if any of them fails
+        :return: The outcome of each promotion, in the order of the promotions
+        """
+        promotions = list(promotions)
+        if dry_run_first:
+            self._map_concurrently(
+                self._promote,
+                [
+                    (build_name, build_number, promotion_request.model_copy(update={"dryRun": True}))
+                    for build_name, build_number, promotion_request in promotions
+                ],
+                concurrency,
+            )
+            logger.debug("Dry run of %s build promotions successful", len(promotions))
+
+        results = self._map_concurrently(self._promote_reported, promotions, concurrency)
+        logger.debug("%s of %s build promotions successful", sum(result.promoted for result in results), len(results))
+        return BuildPromotionReport(results=results)
+
+    def _promote_reported(self, promotion: Tuple[str, str, BuildPromotionRequest]) -> BuildPromotionOutcome:
+        """
+        Promote a single build, see promote_builds.
+        :param promotion: Build name, build number and promotion request
+        :return: The outcome of the promotion
+        """
+        build_name, build_number, _ = promotion
+        try:
+            result = self._promote(promotion)
+        except (ArtifactoryError, requests.exceptions.RequestException) as error:
+            logger.error("Promotion of build %s in %s failed: %s", build_number, build_name, error)
+            return BuildPromotionOutcome(
+                build_name=build_name,
+                build_number=build_number,
+                error=str(error) or repr(error),
+            )
+        return BuildPromotionOutcome(build_name=build_name, build_number=build_number, messages=result.messages)
+
+    def _promote(self, promotion: Tuple[str, str, BuildPromotionRequest]) -> BuildPromotionResult:
+        """
+        :param promotion: Build name, build number and promotion request
+        :return: BuildPromotionResult containing server response
+        """
+        build_name, build_number, promotion_request = promotion
+        try:
+            response = self._post(
+                f"api/{self._uri}/promote/{build_name}/{build_number}",
+                json=promotion_request.model_dump(),
+            )
+            logging.debug(
+                "Build %s in %s promoted from %s to %s",
+                build_number,
+                build_name,
+                promotion_request.sourceRepo,
+                promotion_request.targetRepo,
+            )
+        except requests.exceptions.HTTPError as error:
+            self._raise_exception(error)
+
+        return self._parse(response, BuildPromotionResult)
 
     def list(self) -> BuildListResponse:
         """
@@ -129,30 +288,110 @@ class ArtifactoryBuild(ArtifactoryObject):
         """
         response = self._get(f"api/{self._uri}")
         logger.debug("List all builds successful")
-        return BuildListResponse.model_validate(response.json())
+        return self._parse(response, BuildListResponse)
 
-    def delete(self, delete_build: BuildDeleteRequest) -> None:
+    def delete(
+        self,
+        delete_build: BuildDeleteRequest,
+        validate: bool = True,
+        batch_size: int = 500,
+        concurrency: int = 1,
+    ) -> None:
         """
         :param delete_build: Model object containing required parameters
+        :param validate: Check that all the build numbers exist before deleting any of them,
+                         from a single get_build_runs call
+        :param batch_size: Maximum number of build numbers deleted by a single request
+        :param concurrency: Maximum number of concurrent delete requests
         :return: None
         """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
         try:
-            if delete_build.buildNumbers:
-                for _build_number in delete_build.buildNumbers:
-                    self._get(
-                        f"api/{self._uri}/{delete_build.buildName}/{_build_number}",
-                    )
-                # all build numbers exist
-
-            self._post(f"api/{self._uri}/delete", json=delete_build.model_dump())
-
-            if delete_build.buildNumbers:
-                logger.debug("Builds %s deleted from %s", ",".join(delete_build.buildNumbers), delete_build.buildName)
-            else:
+            if delete_build.deleteAll or not delete_build.buildNumbers:
+                self._post(f"api/{self._uri}/delete", json=delete_build.model_dump())
                 logger.debug("Deleted all builds of %s", delete_build.buildName)
+                return
+
+            if validate:
+                self._check_build_numbers(delete_build.buildName, delete_build.buildNumbers)
+
+            numbers = delete_build.buildNumbers
+            batches = [
+                delete_build.model_copy(update={"buildNumbers": numbers[start : start + batch_size]})
+                for start in range(0, len(numbers), batch_size)
+            ]
+            self._map_concurrently(
+                lambda batch: self._post(f"api/{self._uri}/delete", json=batch.model_dump()),
+                batches,
+                concurrency,
+            )
+            logger.debug("Builds %s deleted from %s", ",".join(numbers), delete_build.buildName)
         except requests.exceptions.HTTPError as error:
             self._raise_exception(error)
 
+    def _check_build_numbers(self, build_name: str, build_numbers: Iterable[str]) -> None:
+        """
+        Raise an exception if one of the build numbers doesn't exist.
+        :param build_name: Build name
+        :param build_numbers: Build numbers to check
+        """
+        existing = {run.number for run in self.get_build_runs(build_name).buildsNumbers or []}
+        missing = [build_number for build_number in build_numbers if build_number not in existing]
+        if missing:
+            logger.error("Builds %s of %s do not exist", ",".join(missing), build_name)
+            raise BuildNotFoundError(f"Builds {','.join(missing)} of {build_name} do not exist")
+
+    def apply_retention(
+        self,
+        policies: Union[BuildRetentionPolicy, Dict[str, BuildRetentionPolicy]],
+        dry_run: bool = False,
+        concurrency: int = 8,
+        batch_size: int = 500,
+        now: Optional[datetime] = None,
+    ) -> BuildRetentionPlan:
+        """
+        Deletes the build runs expired according to retention policies.
+        The builds and their runs are listed once, the runs of the builds concurrently, and the policies
+        are evaluated locally on the start time of the runs.
+        :param policies: Policy applied to every build, or policies by build name, the other builds being kept
+        :param dry_run: Only plan the deletions, without deleting anything
+        :param concurrency: Maximum number of concurrent requests
+        :param batch_size: Maximum number of build numbers deleted by a single request
+        :param now: Time the ages of the runs are computed at (timezone aware), the current time by default
+        :return: The deletions, done or planned
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        now = now or datetime.now(timezone.utc)
+        build_names = [build.name for build in self.list().builds or []]
+        if isinstance(policies, dict):
+            build_names = [build_name for build_name in build_names if build_name in policies]
+
+        build_runs = self._map_concurrently(self.get_build_runs, build_names, concurrency)
+        delete_requests: List[BuildDeleteRequest] = []
+        for build_name, runs in zip(build_names, build_runs):
+            policy = policies[build_name] if isinstance(policies, dict) else policies
+            numbers = [run.number for run in policy.expired_runs(runs.buildsNumbers or [], now)]
+            delete_requests.extend(
+                BuildDeleteRequest(
+                    buildName=build_name,
+                    buildNumbers=numbers[start : start + batch_size],
+                    deleteArtifacts=policy.delete_artifacts,
+                )
+                for start in range(0, len(numbers), batch_size)
+            )
+        plan = BuildRetentionPlan(requests=delete_requests, dry_run=dry_run)
+
+        if not dry_run:
+            self._map_concurrently(
+                lambda request: self.delete(request, validate=False, batch_size=batch_size),
+                delete_requests,
+                concurrency,
+            )
+            logger.debug("Build retention successfully applied")
+        return plan
+
     def build_rename(self, build_name: str, new_build_name: str) -> None:
         """
         :param build_name: Build to be renamed
@@ -187,12 +426,12 @@ class ArtifactoryBuild(ArtifactoryObject):
         except requests.exceptions.HTTPError as error:
             self._raise_exception(error)
 
-        return BuildDiffResponse(**response.json())
+        return self._parse(response, BuildDiffResponse)
 
     def _raise_exception(self, error: requests.exceptions.HTTPError):
         http_response: Union[Response, None] = error.response
         if isinstance(http_response, Response):
-            _http_error = BuildError(**http_response.json())
+            _http_error = self._parse(http_response, BuildError)
             if http_response.status_code == 404:
                 raise BuildNotFoundError(_http_error.to_error_message()) from error
             raise ArtifactoryError(_http_error.to_error_message()) from error
@@ -0,0 +1,172 @@
+"""
+Definition of the build info cache, comparing builds locally.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from pyartifactory.models.build import BuildDiffResponse, BuildDiffResponseDetail, BuildInfo
+from pyartifactory.objects.build import ArtifactoryBuild
+from pyartifactory.objects.object import map_concurrently
+
+logger = logging.getLogger("pyartifactory")
+
+BuildKey = Tuple[str, str]
+
+
+def diff_build_infos(build_info: BuildInfo, older_build_info: BuildInfo) -> BuildDiffResponse:
+    """
+    Compare two build infos locally, as the build diff API does.
+    Artifacts are compared by name and sha1, dependencies by id and sha1, properties by key and value.
+    :param build_info: Build info of the more recent build
+    :param older_build_info: Build info of the starting build
+    :return: BuildDiffResponse model object, holding the names of the new, updated, unchanged and removed items
+    """
+    return BuildDiffResponse(
+        artifacts=_diff(_artifacts(older_build_info), _artifacts(build_info)),
+        dependencies=_diff(_dependencies(older_build_info), _dependencies(build_info)),
+        properties=_diff(older_build_info.buildInfo.properties or {}, build_info.buildInfo.properties or {}),
+    )
+
+
+def _artifacts(build_info: BuildInfo) -> Dict[str, Optional[str]]:
+    return {artifact.name: artifact.sha1 for module in build_info.buildInfo.modules for artifact in module.artifacts}
+
+
+def _dependencies(build_info: BuildInfo) -> Dict[str, Optional[str]]:
+    return {
+        dependency.id or dependency.sha1 or "": dependency.sha1
+        for module in build_info.buildInfo.modules
+        for dependency in module.dependencies or []
+    }
+
+
+def _diff(older: Mapping[str, Optional[str]], newer: Mapping[str, Optional[str]]) -> BuildDiffResponseDetail:
+    return BuildDiffResponseDetail(
+        new=sorted(newer.keys() - older.keys()),
+        removed=sorted(older.keys() - newer.keys()),
+        updated=sorted(key for key in newer.keys() & older.keys() if newer[key] != older[key]),
+        unchanged=sorted(key for key in newer.keys() & older.keys() if newer[key] == older[key]),
+    )
+
+
+class BuildInfoCache:
+    """
+    Keeps the build infos read from artifactory, a build run never changing once published,
+    and compares builds locally from them, without asking the server for every pair.
+    The least recently used build infos are evicted beyond maxsize.
+    """
+
+    def __init__(self, builds: ArtifactoryBuild, maxsize: Optional[int] = 256) -> None:
+        """
+        :param builds: Builds client
+        :param maxsize: Maximum number of build infos kept, None for no limit
+        """
+        self._builds = builds
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._build_infos: OrderedDict[BuildKey, BuildInfo] = OrderedDict()
+
+    def get(self, build_name: str, build_number: str) -> BuildInfo:
+        """
+        :param build_name: Build name
+        :param build_number: Build number
+        :return: The build info, only retrieved when it is not cached yet
+        """
+        return self.get_many(build_name, [build_number], concurrency=1)[build_number]
+
+    def get_many(self, build_name: str, build_numbers: Iterable[str], concurrency: int = 8) -> Dict[str, BuildInfo]:
+        """
+        :param build_name: Build name
+        :param build_numbers: Build numbers
+        :param concurrency: Maximum number of concurrent requests retrieving the missing build infos
+        :return: The build infos by build number, only the missing ones being retrieved
+        """
+        build_numbers = list(build_numbers)
+        build_infos: Dict[str, BuildInfo] = {}
+        with self._lock:
+            for build_number in build_numbers:
+                cached = self._build_infos.get((build_name, build_number))
+                if cached is not None:
+                    self._build_infos.move_to_end((build_name, build_number))
+                    build_infos[build_number] = cached
+
+        missing = [build_number for build_number in dict.fromkeys(build_numbers) if build_number not in build_infos]
+        fetched = map_concurrently(
+            self._builds.session,
+            lambda build_number: self._builds.get_build_info(build_name, build_number),
+            missing,
+            concurrency,
+        )
+        with self._lock:
+            for build_number, build_info in zip(missing, fetched):
+                self._build_infos[(build_name, build_number)] = build_info
+                build_infos[build_number] = build_info
+            while self._maxsize is not None and len(self._build_infos) > self._maxsize:
+                self._build_infos.popitem(last=False)
+        return {build_number: build_infos[build_number] for build_number in build_numbers}
+
+    def diff(self, build_name: str, build_number: str, older_build_number: str) -> BuildDiffResponse:
+        """
+        :param build_name: Build name to be compared
+        :param build_number: More recent build to be compared
+        :param older_build_number: Starting build to be compared
+        :return: BuildDiffResponse model object, computed locally
+        """
+        build_infos = self.get_many(build_name, [build_number, older_build_number])
+        return diff_build_infos(build_infos[build_number], build_infos[older_build_number])
+
+    def diff_many(
+        self,
+        build_name: str,
+        build_number: str,
+        older_build_numbers: Iterable[str],
+        concurrency: int = 8,
+    ) -> Dict[str, BuildDiffResponse]:
+        """
+        Compare a build against several older builds.
+        :param build_name: Build name to be compared
+        :param build_number: More recent build to be compared
+        :param older_build_numbers: Starting builds to be compared
+        :param concurrency: Maximum number of concurrent requests retrieving the missing build infos
+        :return: BuildDiffResponse model objects by older build number
+        """
+        older_build_numbers = list(older_build_numbers)
+        build_infos = self.get_many(build_name, [build_number, *older_build_numbers], concurrency)
+        return {
+            older_build_number: diff_build_infos(build_infos[build_number], build_infos[older_build_number])
+            for older_build_number in older_build_numbers
+        }
+
+    def history(self, build_name: str, last: int = 50, concurrency: int = 8) -> List[Tuple[str, BuildDiffResponse]]:
+        """
+        What changed across the last runs of a build, each run being compared with the one before it.
+        :param build_name: Build name
+        :param last: Number of runs to compare with their predecessor
+        :param concurrency: Maximum number of concurrent requests retrieving the missing build infos
+        :return: (build number, BuildDiffResponse) pairs, most recent first
+        """
+        runs = sorted(
+            self._builds.get_build_runs(build_name).buildsNumbers or [],
+            key=lambda run: run.started_at,
+            reverse=True,
+        )
+        build_numbers = [run.number for run in runs[: last + 1]]
+        build_infos = self.get_many(build_name, build_numbers, concurrency)
+        return [
+            (build_number, diff_build_infos(build_infos[build_number], build_infos[older_build_number]))
+            for build_number, older_build_number in zip(build_numbers, build_numbers[1:])
+        ]
+
+    def invalidate(self, build_name: Optional[str] = None) -> None:
+        """
+        Forgets the cached build infos.
+        :param build_name: Only forget the build infos of this build
+        """
+        with self._lock:
+            for key in list(self._build_infos):
+                if build_name in (None, key[0]):
+                    del self._build_infos[key]
@@ -0,0 +1,85 @@
+"""
+Definition of the build catalog, polling artifactory for new build runs.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+
+from pyartifactory.models.build import Run, SimpleBuild
+from pyartifactory.objects.build import ArtifactoryBuild
+from pyartifactory.objects.object import map_concurrently
+
+logger = logging.getLogger("pyartifactory")
+
+
+class BuildCatalog:
+    """
+    Models a local catalog of the builds and their runs, kept up to date by polling.
+    Each poll lists the builds once, and only reads the runs of the builds whose lastStarted changed
+    since the previous poll, so that its cost depends on the number of changes rather than on the number of builds.
+    """
+
+    def __init__(self, builds: ArtifactoryBuild, concurrency: int = 8) -> None:
+        """
+        :param builds: Builds client
+        :param concurrency: Maximum number of concurrent requests reading the runs of the changed builds
+        """
+        self._builds = builds
+        self._concurrency = concurrency
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._last_started: Dict[str, str] = {}
+        self._runs: Dict[str, Dict[str, Run]] = {}
+
+    def poll(self) -> List[Tuple[str, Run]]:
+        """
+        Update the catalog, all the runs being new on the first poll.
+        :return: The (build name, run) pairs of the runs new since the previous poll, oldest first
+        """
+        # Polls are serialised, the readers only waiting for the catalog to be updated, never for the requests
+        with self._poll_lock:
+            builds: Dict[str, SimpleBuild] = {build.name: build for build in self._builds.list().builds or []}
+            with self._lock:
+                changed = [
+                    build_name
+                    for build_name, build in builds.items()
+                    if self._last_started.get(build_name) != build.lastStarted
+                ]
+            build_runs = map_concurrently(
+                self._builds.session,
+                self._builds.get_build_runs,
+                changed,
+                self._concurrency,
+            )
+
+            new_runs: List[Tuple[str, Run]] = []
+            with self._lock:
+                for build_name in self._last_started.keys() - builds.keys():
+                    del self._last_started[build_name]
+                    del self._runs[build_name]
+                for build_name, runs in zip(changed, build_runs):
+                    known = self._runs.get(build_name, {})
+                    current = {run.number: run for run in runs.buildsNumbers or []}
+                    new_runs.extend((build_name, run) for number, run in current.items() if number not in known)
+                    self._runs[build_name] = current
+                    self._last_started[build_name] = builds[build_name].lastStarted
+
+        logger.debug("Build catalog polled, %s builds changed", len(changed))
+        return sorted(new_runs, key=lambda new_run: new_run[1].started_at)
+
+    @property
+    def build_names(self) -> List[str]:
+        """Names of the builds known at the last poll."""
+        with self._lock:
+            return sorted(self._runs)
+
+    def runs(self, build_name: str) -> Mapping[str, Run]:
+        """
+        :param build_name: Build name
+        :return: The runs of the build known at the last poll, by build number
+        """
+        with self._lock:
+            return MappingProxyType(dict(self._runs.get(build_name, {})))
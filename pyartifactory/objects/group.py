@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Union
+from typing import Dict, Iterable, List, Tuple, Union
 
 import requests
 from requests import Response
 
 from pyartifactory.exception import ArtifactoryError, GroupAlreadyExistsError, GroupNotFoundError
-from pyartifactory.models.group import Group
+from pyartifactory.models.group import Group, GroupMembershipChange
 from pyartifactory.objects.object import ArtifactoryObject
 
 logger = logging.getLogger("pyartifactory")
@@ -25,14 +25,20 @@ class ArtifactoryGroup(ArtifactoryObject):
         :return: Created group
         """
         group_name = group.name
-        try:
-            self.get(group_name)
+        if self.exists(group_name):
             logger.error("Group %s already exists", group_name)
             raise GroupAlreadyExistsError(f"Group {group_name} already exists")
-        except GroupNotFoundError:
-            self._put(f"api/{self._uri}/{group_name}", json=group.model_dump())
-            logger.debug("Group %s successfully created", group_name)
-            return self.get(group.name)
+        self._put(f"api/{self._uri}/{group_name}", json=group.model_dump())
+        logger.debug("Group %s successfully created", group_name)
+        return self.get(group.name)
+
+    def exists(self, name: str) -> bool:
+        """
+        Checks whether a group exists, with a single request and without reading the group
+        :param name: Name of the group
+        :return: True if the group exists
+        """
+        return self._exists(f"api/{self._uri}/{name}")
 
     def get(self, name: str) -> Group:
         """
@@ -43,7 +49,7 @@ class ArtifactoryGroup(ArtifactoryObject):
         try:
             response = self._get(f"api/{self._uri}/{name}", params={"includeUsers": True})
             logger.debug("Group %s found", name)
-            return Group(**response.json())
+            return self._parse(response, Group)
         except requests.exceptions.HTTPError as error:
             http_response: Union[Response, None] = error.response
             if isinstance(http_response, Response) and http_response.status_code in (404, 400):
@@ -58,7 +64,7 @@ class ArtifactoryGroup(ArtifactoryObject):
         """
         response = self._get(f"api/{self._uri}")
         logger.debug("List all groups successful")
-        return [Group(**group) for group in response.json()]
+        return self._parse_list(response, Group)
 
     def update(self, group: Group) -> Group:
         """
@@ -72,6 +78,52 @@ class ArtifactoryGroup(ArtifactoryObject):
         logger.debug("Group %s successfully updated", group_name)
         return self.get(group_name)
 
+    def sync_members(
+        self,
+        members: Dict[str, Iterable[str]],
+        dry_run: bool = False,
+        concurrency: int = 8,
+    ) -> List[GroupMembershipChange]:
+        """
+        Synchronises the members of groups with their desired members, e.g. coming from an identity provider.
+        The current members of all the groups are fetched concurrently first, then the members to add and remove
+        are computed locally from their userNames: only the groups whose members differ are written, concurrently.
+        Raises an exception, before writing anything, if one of the groups doesn't exist.
+        :param members: Desired user names by group name
+        :param dry_run: Only compute the changes, without writing anything
+        :param concurrency: Maximum number of concurrent requests
+        :return: The change of each group, in the order of the groups
+        """
+        names = list(members)
+        groups = self._map_concurrently(self.get, names, concurrency)
+        changes = []
+        for name, group in zip(names, groups):
+            current = set(group.userNames or [])
+            desired = set(members[name])
+            changes.append(
+                GroupMembershipChange(
+                    name=name,
+                    added=sorted(desired - current),
+                    removed=sorted(current - desired),
+                ),
+            )
+
+        if not dry_run:
+            writes = [(group, change) for group, change in zip(groups, changes) if change.changed]
+            self._map_concurrently(self._write_members, writes, concurrency)
+            logger.debug("Members of %s groups successfully synchronised", len(writes))
+        return changes
+
+    def _write_members(self, write: Tuple[Group, GroupMembershipChange]) -> None:
+        """
+        Send the new members of a group.
+        :param write: Current group and the change of its members
+        """
+        group, change = write
+        user_names = sorted((set(group.userNames or []) | set(change.added)) - set(change.removed))
+        self._post(f"api/{self._uri}/{group.name}", json={"name": group.name, "userNames": user_names})
+        logger.debug("Members of group %s successfully updated", group.name)
+
     def delete(self, name: str) -> None:
         """
         Removes a group
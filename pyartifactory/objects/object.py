@@ -3,17 +3,134 @@ Definition of artifactory base object.
 """
 from __future__ import annotations
 
-from typing import Optional, Tuple
+import contextvars
+import functools
+import inspect
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Set, Tuple, Type, TypeVar
 
 import requests
+from pydantic import BaseModel, TypeAdapter
 from requests import Response
+from requests.adapters import HTTPAdapter
 
+from pyartifactory.exception import ArtifactoryError
+from pyartifactory.metrics import RequestMetric
 from pyartifactory.models import AuthModel
+from pyartifactory.tracing import NOOP_TRACER, traced
+from pyartifactory.utils import get_json_loads
+
+logger = logging.getLogger("pyartifactory")
+
+M = TypeVar("M", bound=BaseModel)
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@functools.lru_cache(maxsize=None)
+def _list_adapter(model: Type[M]) -> TypeAdapter[List[M]]:
+    return TypeAdapter(List[model])  # type: ignore[valid-type]
+
+
+def _call_in_context(context: contextvars.Context, func: Callable[[T], R], item: T) -> R:
+    return context.run(func, item)
+
+
+def map_concurrently(
+    session: requests.Session,
+    func: Callable[[T], R],
+    items: Iterable[T],
+    concurrency: int,
+) -> List[R]:
+    """
+    Call func on every item from a pool of threads sharing the session, and its connection pool.
+    Each call runs in a copy of the caller context, so that its spans keep the caller span as parent.
+    :param session: Session the calls send their requests with, its connection pool being grown to concurrency
+    :param func: Function to call on each item
+    :param items: Items to process
+    :param concurrency: Maximum number of concurrent calls
+    :return: The results, in the order of the items
+    """
+    items = list(items)
+    if concurrency <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    grow_connection_pool(session, concurrency)
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+        futures = [executor.submit(_call_in_context, contextvars.copy_context(), func, item) for item in items]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def iter_concurrently(
+    session: requests.Session,
+    func: Callable[[T], R],
+    items: Iterable[T],
+    concurrency: int,
+) -> Iterator[R]:
+    """
+    Call func on every item from a pool of threads sharing the session, yielding the results as they arrive.
+    At most concurrency calls are pending at once, so that a consumer stopping early doesn't send every request.
+    :param session: Session the calls send their requests with, its connection pool being grown to concurrency
+    :param func: Function to call on each item
+    :param items: Items to process
+    :param concurrency: Maximum number of concurrent calls
+    :return: The results, in the order of their completion
+    """
+    if concurrency <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    grow_connection_pool(session, concurrency)
+    remaining = iter(items)
+    pending: Set[Future[R]] = set()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        try:
+            for item in remaining:
+                pending.add(executor.submit(_call_in_context, contextvars.copy_context(), func, item))
+                if len(pending) < concurrency:
+                    continue
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def grow_connection_pool(session: requests.Session, size: int) -> None:
+    """
+    Make sure the session keeps enough connections alive for size concurrent requests.
+    :param session: Session to grow the connection pool of
+    :param size: Number of concurrent requests
+    """
+    for prefix in ("https://", "http://"):
+        adapter = session.get_adapter(prefix)
+        if isinstance(adapter, HTTPAdapter) and adapter._pool_maxsize < size:  # type: ignore[attr-defined]
+            session.mount(prefix, HTTPAdapter(pool_maxsize=size, max_retries=adapter.max_retries))
 
 
 class ArtifactoryObject:
     """Models the artifactory object."""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Open a tracing span around every public method of the subclasses."""
+        super().__init_subclass__(**kwargs)
+        for name, attribute in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.isfunction(attribute):
+                setattr(cls, name, traced(f"{cls.__name__}.{name}")(attribute))
+
     def __init__(self, artifactory: AuthModel) -> None:
         self._artifactory = artifactory
         self._auth: Optional[Tuple[str, str]] = None
@@ -25,10 +142,15 @@ class ArtifactoryObject:
             )
 
         self._access_token = self._artifactory.access_token
+        self._token_provider = self._artifactory.token_provider
         self._api_version = self._artifactory.api_version
         self._verify = self._artifactory.verify
         self._cert = self._artifactory.cert
         self._timeout = self._artifactory.timeout
+        self._metrics_callbacks = self._artifactory.metrics_callbacks
+        self._tracer = self._artifactory.tracer or NOOP_TRACER
+        self._trusted_responses = self._artifactory.trusted_responses
+        self._json_loads = get_json_loads(self._artifactory.json_backend)
         self.session = requests.Session()
 
     def _get(self, route: str, **kwargs) -> Response:
@@ -71,6 +193,77 @@ class ArtifactoryObject:
         """
         return self._generic_http_method_request("patch", route, **kwargs)
 
+    def _head(self, route: str, **kwargs) -> Response:
+        """
+        :param route: API Route
+        :param kwargs: Additional parameters to add the request
+        :returns  An HTTP response
+        """
+        return self._generic_http_method_request("head", route, **kwargs)
+
+    def _exists(self, route: str) -> bool:
+        """
+        Check whether a resource exists with a single request, without downloading nor validating it.
+        HEAD is used, falling back to a GET whose body is not read when the endpoint doesn't allow HEAD.
+        :param route: API Route of the resource
+        :return: Whether the resource exists
+        """
+        response = self._head(route, raise_for_status=False)
+        if response.status_code == 405:
+            response = self._get(route, raise_for_status=False, stream=True)
+            response.close()
+        if response.status_code in (404, 400):
+            return False
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as error:
+            raise ArtifactoryError from error
+        return True
+
+    def _decode(self, response: Response) -> Any:
+        """
+        Decode the JSON body of a response with the configured JSON backend,
+        for the responses that are not validated by a model.
+        :param response: HTTP response
+        :return: The decoded body
+        """
+        if self._artifactory.json_backend == "json":
+            return response.json()
+        return self._json_loads(response.content)
+
+    def _parse(self, response: Response, model: Type[M]) -> M:
+        """
+        Build a model from the JSON body of a response.
+        With trusted_responses, pydantic validates the raw bytes of the body directly,
+        without decoding them into intermediate Python objects first.
+        :param response: HTTP response
+        :param model: Model of the response body
+        :return: The validated model
+        """
+        if self._trusted_responses:
+            return model.model_validate_json(response.content)
+        return model.model_validate(self._decode(response))
+
+    def _parse_list(self, response: Response, model: Type[M]) -> List[M]:
+        """
+        Build a list of models from the JSON body of a response, see _parse.
+        :param response: HTTP response
+        :param model: Model of the list items
+        :return: The validated models
+        """
+        adapter = _list_adapter(model)
+        if self._trusted_responses:
+            return adapter.validate_json(response.content)
+        return adapter.validate_python(self._decode(response))
+
+    def _map_concurrently(self, func: Callable[[T], R], items: Iterable[T], concurrency: int) -> List[R]:
+        """See map_concurrently, with the session of this object."""
+        return map_concurrently(self.session, func, items, concurrency)
+
+    def _iter_concurrently(self, func: Callable[[T], R], items: Iterable[T], concurrency: int) -> Iterator[R]:
+        """See iter_concurrently, with the session of this object."""
+        return iter_concurrently(self.session, func, items, concurrency)
+
     def _generic_http_method_request(
         self,
         method: str,
@@ -85,9 +278,10 @@ class ArtifactoryObject:
         :return: An HTTP response
         """
 
-        if self._access_token is not None:
+        access_token = self._token_provider() if self._token_provider is not None else self._access_token
+        if access_token is not None:
             headers = kwargs.get("headers", {})
-            headers["Authorization"] = f"Bearer {self._access_token}"
+            headers["Authorization"] = f"Bearer {access_token}"
             kwargs["headers"] = headers
 
             auth = None
@@ -95,14 +289,69 @@ class ArtifactoryObject:
             auth = self._auth
 
         http_method = getattr(self.session, method)
-        response: Response = http_method(
-            f"{self._artifactory.url}/{route}",
-            auth=auth,
-            **kwargs,
-            verify=self._verify,
-            cert=self._cert,
-            timeout=self._timeout,
-        )
-        if raise_for_status:
-            response.raise_for_status()
+        with self._tracer.start_as_current_span(f"HTTP {method.upper()}") as span:
+            started = time.perf_counter()
+            try:
+                response: Response = http_method(
+                    f"{self._artifactory.url}/{route}",
+                    auth=auth,
+                    **kwargs,
+                    verify=self._verify,
+                    cert=self._cert,
+                    timeout=self._timeout,
+                )
+            except requests.exceptions.RequestException as error:
+                self._observe(span, method, route, started, error=error)
+                raise
+            self._observe(span, method, route, started, response=response, streamed=kwargs.get("stream", False))
+            if raise_for_status:
+                response.raise_for_status()
         return response
+
+    def _observe(
+        self,
+        span: Any,
+        method: str,
+        route: str,
+        started: float,
+        response: Optional[Response] = None,
+        error: Optional[BaseException] = None,
+        streamed: bool = False,
+    ) -> None:
+        """
+        Hand the measurement of a request over to the metrics callbacks and the request span.
+        A failing callback is logged and never breaks the request.
+        :param span: Span of the request
+        :param method: HTTP method used
+        :param route: API Route
+        :param started: perf_counter value taken before sending the request
+        :param response: The HTTP response, if any was received
+        :param error: The exception raised by the transport, if any
+        :param streamed: Whether the response body is streamed by the caller
+        """
+        if not self._metrics_callbacks and self._tracer is NOOP_TRACER:
+            return
+        metric = RequestMetric.from_response(
+            method,
+            route,
+            time.perf_counter() - started,
+            response=response,
+            error=error,
+            streamed=streamed,
+        )
+        for callback in self._metrics_callbacks:
+            try:
+                callback(metric)
+            except Exception:
+                logger.exception("Metrics callback %r failed", callback)
+
+        span.set_attribute("http.request.method", metric.method)
+        span.set_attribute("http.route", metric.route)
+        span.set_attribute("url.path", route.split("?", 1)[0])
+        span.set_attribute("http.request.body.size", metric.bytes_sent)
+        span.set_attribute("http.response.body.size", metric.bytes_received)
+        span.set_attribute("http.resend_count", metric.retries)
+        if metric.status_code is not None:
+            span.set_attribute("http.response.status_code", metric.status_code)
+        if metric.error is not None:
+            span.set_attribute("error.type", metric.error)
@@ -46,17 +46,23 @@ class ArtifactoryPermission(ArtifactoryObject):
         :return: Permission v2 or v1
         """
         permission_name = permission.name
-        try:
-            self.get(permission_name)
+        if self.exists(permission_name):
             logger.debug("Permission %s already exists", permission_name)
             raise PermissionAlreadyExistsError(f"Permission {permission_name} already exists")
-        except PermissionNotFoundError:
-            self._put(
-                f"api/{self._uri}/{permission_name}",
-                json=permission.model_dump(by_alias=True),
-            )
-            logger.debug("Permission %s successfully created", permission_name)
-            return self.get(permission_name)
+        self._put(
+            f"api/{self._uri}/{permission_name}",
+            json=permission.model_dump(by_alias=True),
+        )
+        logger.debug("Permission %s successfully created", permission_name)
+        return self.get(permission_name)
+
+    def exists(self, permission_name: str) -> bool:
+        """
+        Checks whether a permission exists, with a single request and without reading the permission
+        :param permission_name: Name of the permission
+        :return: True if the permission exists
+        """
+        return self._exists(f"api/{self._uri}/{permission_name}")
 
     def get(self, permission_name: str) -> AnyPermission:
         """
@@ -68,7 +74,9 @@ class ArtifactoryPermission(ArtifactoryObject):
             response = self._get(f"api/{self._uri}/{permission_name}")
             logger.debug("Permission %s found", permission_name)
             return (
-                Permission(**response.json()) if self._artifactory.api_version == 1 else PermissionV2(**response.json())
+                self._parse(response, Permission)
+                if self._artifactory.api_version == 1
+                else self._parse(response, PermissionV2)
             )
         except requests.exceptions.HTTPError as error:
             http_response: Union[Response, None] = error.response
@@ -84,7 +92,7 @@ class ArtifactoryPermission(ArtifactoryObject):
         """
         response = self._get(f"api/{self._uri}")
         logger.debug("List all permissions successful")
-        return [SimplePermission(**permission) for permission in response.json()]
+        return self._parse_list(response, SimplePermission)
 
     @overload
     def update(self, permission: Permission) -> Permission:
@@ -0,0 +1,127 @@
+"""
+Definition of the provenance index, mapping artifact checksums to the builds that produced them.
+"""
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from typing import Iterable, List, Optional, Set, Tuple
+
+from pyartifactory.models.build import BuildInfo, BuildProvenance
+from pyartifactory.objects.build import ArtifactoryBuild
+from pyartifactory.objects.object import iter_concurrently, map_concurrently
+
+logger = logging.getLogger("pyartifactory")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    checksum TEXT NOT NULL,
+    build_name TEXT NOT NULL,
+    build_number TEXT NOT NULL,
+    module_id TEXT NOT NULL,
+    PRIMARY KEY (checksum, build_name, build_number, module_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS indexed_runs (
+    build_name TEXT NOT NULL,
+    build_number TEXT NOT NULL,
+    PRIMARY KEY (build_name, build_number)
+) WITHOUT ROWID;
+"""
+
+
+class ProvenanceIndex:
+    """
+    Models an on-disk index of the artifacts produced by the builds, by sha1 and sha256 checksums.
+    The index is updated incrementally: the indexed build runs are recorded, and only the runs missing from them
+    are read, so that a lookup never needs any request once the index is synchronised.
+    """
+
+    def __init__(self, builds: ArtifactoryBuild, path: str) -> None:
+        """
+        :param builds: Builds client
+        :param path: Path of the SQLite database holding the index, created if needed
+        """
+        self._builds = builds
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def sync(self, build_names: Optional[Iterable[str]] = None, concurrency: int = 8) -> int:
+        """
+        Index the build runs not indexed yet, whenever they started.
+        :param build_names: Builds to synchronise, None for all the builds
+        :param concurrency: Maximum number of concurrent requests
+        :return: Number of build runs indexed
+        """
+        if build_names is None:
+            build_names = [build.name for build in self._builds.list().builds or []]
+        build_names = list(build_names)
+        indexed_runs = self._indexed_runs()
+
+        build_runs = map_concurrently(self._builds.session, self._builds.get_build_runs, build_names, concurrency)
+        new_runs: List[Tuple[str, str]] = [
+            (build_name, run.number)
+            for build_name, runs in zip(build_names, build_runs)
+            for run in runs.buildsNumbers or []
+            if (build_name, run.number) not in indexed_runs
+        ]
+
+        indexed = 0
+        for build_name, build_number, build_info in iter_concurrently(
+            self._builds.session,
+            lambda new_run: (*new_run, self._builds.get_build_info(*new_run)),
+            new_runs,
+            concurrency,
+        ):
+            rows = _rows(build_name, build_number, build_info)
+            # Each run is committed on its own, the lock being never held while build infos are fetched
+            with self._lock, self._connection:
+                self._connection.executemany("INSERT OR IGNORE INTO artifacts VALUES (?, ?, ?, ?)", rows)
+                self._connection.execute("INSERT OR IGNORE INTO indexed_runs VALUES (?, ?)", (build_name, build_number))
+            indexed += 1
+        logger.debug("Provenance index synchronised with %s build runs", indexed)
+        return indexed
+
+    def lookup(self, checksum: str) -> List[BuildProvenance]:
+        """
+        :param checksum: sha1 or sha256 checksum of an artifact
+        :return: The builds, and their modules, which produced the artifact
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT build_name, build_number, module_id FROM artifacts WHERE checksum = ? "
+                "ORDER BY build_name, build_number, module_id",
+                (checksum.lower(),),
+            ).fetchall()
+        return [
+            BuildProvenance(build_name=build_name, build_number=build_number, module_id=module_id)
+            for build_name, build_number, module_id in rows
+        ]
+
+    def close(self) -> None:
+        """Closes the database."""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> ProvenanceIndex:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _indexed_runs(self) -> Set[Tuple[str, str]]:
+        with self._lock:
+            rows = self._connection.execute("SELECT build_name, build_number FROM indexed_runs").fetchall()
+        return {(build_name, build_number) for build_name, build_number in rows}
+
+
+def _rows(build_name: str, build_number: str, build_info: BuildInfo) -> List[Tuple[str, str, str, str]]:
+    return [
+        (checksum.lower(), build_name, build_number, module.id)
+        for module in build_info.buildInfo.modules
+        for artifact in module.artifacts
+        for checksum in (artifact.sha1, artifact.sha256)
+        if checksum
+    ]
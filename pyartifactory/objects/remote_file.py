@@ -0,0 +1,180 @@
+"""
+Definition of the seekable remote file, reading an artifact with HTTP Range requests.
+"""
+from __future__ import annotations
+
+import io
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Union
+
+from pyartifactory.exception import ArtifactoryError
+
+if TYPE_CHECKING:
+    from pyartifactory.objects.artifact import ArtifactoryArtifact
+
+logger = logging.getLogger("pyartifactory")
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+
+class RemoteFile(io.RawIOBase):
+    """
+    Models a read-only, seekable file over an artifact, reading only the parts actually needed with HTTP Range
+    requests, e.g. the central directory and a single member of a zip file.
+    The file is read by blocks, kept in a LRU block cache; sequential reads fetch read_ahead more blocks at once.
+    When the server ignores Range requests, the whole file is read once and kept in memory.
+    """
+
+    def __init__(
+        self,
+        artifacts: ArtifactoryArtifact,
+        artifact_path: str,
+        size: int,
+        block_size: int = 256 * 1024,
+        read_ahead: int = 4,
+        cache_blocks: int = 64,
+    ) -> None:
+        """
+        :param artifacts: Artifacts client
+        :param artifact_path: Path to file in Artifactory
+        :param size: Size of the file in bytes
+        :param block_size: Number of bytes of a block, the unit of the reads
+        :param read_ahead: Number of blocks read ahead of a sequential read
+        :param cache_blocks: Maximum number of blocks kept in memory
+        """
+        super().__init__()
+        self._artifacts = artifacts
+        self._artifact_path = artifact_path
+        self._size = size
+        self._block_size = block_size
+        self._read_ahead = read_ahead
+        self._cache_blocks = max(cache_blocks, read_ahead + 1)
+        self._blocks: OrderedDict[int, bytes] = OrderedDict()
+        self._whole: Optional[bytes] = None
+        self._lock = threading.Lock()
+        self._position = 0
+        self._last_block = -1
+
+    @property
+    def size(self) -> int:
+        """Size of the file in bytes."""
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._check_closed()
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer: Union[bytearray, memoryview]) -> int:  # type: ignore[override]
+        """
+        Fill the buffer from the current position, up to the end of the file.
+        :param buffer: Buffer to fill
+        :return: Number of bytes read, 0 at the end of the file
+        """
+        self._check_closed()
+        with memoryview(buffer) as view, view.cast("B") as target:
+            end = min(self._position + len(target), self._size)
+            written = 0
+            while self._position < end:
+                index, offset = divmod(self._position, self._block_size)
+                block = self._block(index)
+                chunk = block[offset : offset + end - self._position]
+                if not chunk:
+                    raise ArtifactoryError(f"Artifact {self._artifact_path} is shorter than its size {self._size}")
+                target[written : written + len(chunk)] = chunk
+                written += len(chunk)
+                self._position += len(chunk)
+            return written
+
+    def readall(self) -> bytes:
+        buffer = bytearray(max(self._size - self._position, 0))
+        return bytes(buffer[: self.readinto(buffer)])
+
+    def _block(self, index: int) -> bytes:
+        """
+        :param index: Index of the block
+        :return: The block, read with the following ones when the reads are sequential
+        """
+        with self._lock:
+            if self._whole is not None:
+                return self._whole[index * self._block_size : (index + 1) * self._block_size]
+            block = self._blocks.get(index)
+            if block is not None:
+                self._blocks.move_to_end(index)
+                self._last_block = index
+                return block
+
+            last = index
+            if index == self._last_block + 1:
+                last = min(index + self._read_ahead, (self._size - 1) // self._block_size)
+                while last > index and last in self._blocks:
+                    last -= 1
+            data = self._read_range(index * self._block_size, min((last + 1) * self._block_size, self._size))
+            if self._whole is not None:
+                self._blocks.clear()
+                return self._whole[index * self._block_size : (index + 1) * self._block_size]
+            for block_index in range(index, last + 1):
+                start = (block_index - index) * self._block_size
+                self._blocks[block_index] = data[start : start + self._block_size]
+                self._blocks.move_to_end(block_index)
+            while len(self._blocks) > self._cache_blocks:
+                self._blocks.popitem(last=False)
+            self._last_block = index
+            return self._blocks[index]
+
+    def _read_range(self, start: int, end: int) -> bytes:
+        """
+        :param start: Offset of the first byte
+        :param end: Offset after the last byte
+        :return: The bytes of the range
+        :raise ArtifactoryError: If the response doesn't match the range, e.g. when the artifact changed
+        """
+        response = self._artifacts.read_range(self._artifact_path, start, end)
+        if response.status_code == 206:
+            content_range = _CONTENT_RANGE.fullmatch(response.headers.get("Content-Range", ""))
+            if content_range is not None and (
+                int(content_range.group(1)) != start or content_range.group(3) not in ("*", str(self._size))
+            ):
+                raise ArtifactoryError(
+                    f"Range {response.headers['Content-Range']} of {self._artifact_path} doesn't match "
+                    f"bytes {start}-{end - 1}/{self._size}",
+                )
+            if len(response.content) != end - start:
+                raise ArtifactoryError(
+                    f"Artifact {self._artifact_path} has {len(response.content)} bytes in range {start}-{end - 1}",
+                )
+            return response.content
+
+        logger.warning("Range requests not supported for %s, the whole file was read", self._artifact_path)
+        if len(response.content) != self._size:
+            raise ArtifactoryError(
+                f"Artifact {self._artifact_path} has {len(response.content)} bytes instead of its size {self._size}",
+            )
+        self._whole = response.content
+        return response.content[start:end]
+
+    def _check_closed(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging
-from typing import List, Union, overload
+from collections import Counter
+from typing import Dict, Iterable, List, Literal, Optional, Tuple, Union, overload
 
 import requests
+from pydantic import Field, SecretStr, TypeAdapter, ValidationError
 from requests import Response
+from typing_extensions import Annotated
 
 from pyartifactory.exception import ArtifactoryError, RepositoryAlreadyExistsError, RepositoryNotFoundError
 from pyartifactory.models import AnyRepository, AnyRepositoryResponse
@@ -17,6 +21,10 @@ from pyartifactory.models.repository import (
     RClassEnum,
     RemoteRepository,
     RemoteRepositoryResponse,
+    RepositoryAction,
+    RepositoryChange,
+    RepositoryFieldChange,
+    RepositoryPlan,
     SimpleRepository,
     VirtualRepository,
     VirtualRepositoryResponse,
@@ -27,6 +35,11 @@ from pyartifactory.utils import custom_encoder
 logger = logging.getLogger("pyartifactory")
 
 
+@functools.lru_cache(maxsize=None)
+def _repository_response_adapter() -> TypeAdapter[AnyRepositoryResponse]:
+    return TypeAdapter(Annotated[AnyRepositoryResponse, Field(discriminator="rclass")])
+
+
 class ArtifactoryRepository(ArtifactoryObject):
     """Models an artifactory repository."""
 
@@ -41,7 +54,10 @@ class ArtifactoryRepository(ArtifactoryObject):
         """
         try:
             response = self._get(f"api/{self._uri}/{repo_name}")
-            response_data = response.json()
+            if self._trusted_responses:
+                return self._parse_repository(response)
+
+            response_data = self._decode(response)
             rclass = None
 
             try:
@@ -70,6 +86,36 @@ class ArtifactoryRepository(ArtifactoryObject):
                 raise RepositoryNotFoundError(f" Repository {repo_name} does not exist")
             raise ArtifactoryError from error
 
+    def get_repos(self, repo_names: Iterable[str], concurrency: int = 8) -> List[AnyRepositoryResponse]:
+        """
+        Finds several repositories in artifactory, fetching their configurations concurrently.
+        Raises an exception if one of the repos doesn't exist.
+        :param repo_names: Names of the repositories to retrieve
+        :param concurrency: Maximum number of concurrent requests
+        :return: The local, virtual, remote or federated repositories, in the order of the names
+        """
+        return self._map_concurrently(self.get_repo, repo_names, concurrency)
+
+    def _parse_repository(self, response: Response) -> AnyRepositoryResponse:
+        """
+        Validate a repository configuration straight from the response bytes,
+        the model being selected by pydantic from the "rclass" field.
+        :param response: HTTP response of the repository configuration
+        :return: Either a local, virtual, remote or federated repository
+        """
+        try:
+            return _repository_response_adapter().validate_json(response.content)
+        except ValidationError as error:
+            first_error = error.errors()[0]
+            if first_error["type"] == "union_tag_not_found":
+                raise KeyError('"rclass" key not found in the response data received by artifactory.') from error
+            if first_error["type"] == "union_tag_invalid":
+                raise ArtifactoryError(
+                    f"Unknown repository type found in response: {first_error.get('ctx', {}).get('tag')}. "
+                    "Please report this issue.",
+                ) from error
+            raise
+
     @overload
     def create_repo(self, repo: LocalRepository) -> LocalRepositoryResponse:
         ...
@@ -97,19 +143,25 @@ class ArtifactoryRepository(ArtifactoryObject):
                  or FederatedRepositoryResponse object
         """
         repo_name = repo.key
-        try:
-            self.get_repo(repo_name)
+        if self.exists(repo_name):
             logger.error("Repository %s already exists", repo_name)
             raise RepositoryAlreadyExistsError(f"Repository {repo_name} already exists")
-        except RepositoryNotFoundError:
-            data = json.dumps(repo.model_dump(), default=custom_encoder)
-            self._put(
-                f"api/{self._uri}/{repo_name}",
-                headers={"Content-Type": "application/json"},
-                data=data,
-            )
-            logger.debug("Repository %s successfully created", repo_name)
-            return self.get_repo(repo_name)
+        data = json.dumps(repo.model_dump(), default=custom_encoder)
+        self._put(
+            f"api/{self._uri}/{repo_name}",
+            headers={"Content-Type": "application/json"},
+            data=data,
+        )
+        logger.debug("Repository %s successfully created", repo_name)
+        return self.get_repo(repo_name)
+
+    def exists(self, repo_name: str) -> bool:
+        """
+        Checks whether a repository exists, with a single request and without reading its configuration
+        :param repo_name: Name of the repository
+        :return: True if the repository exists
+        """
+        return self._exists(f"api/{self._uri}/{repo_name}")
 
     @overload
     def update_repo(self, repo: LocalRepository) -> LocalRepositoryResponse:
@@ -149,15 +201,118 @@ class ArtifactoryRepository(ArtifactoryObject):
         logger.debug("Repository %s successfully updated", repo_name)
         return self.get_repo(repo_name)
 
+    def apply(self, desired: List[AnyRepository], dry_run: bool = False, concurrency: int = 8) -> RepositoryPlan:
+        """
+        Creates or updates repositories so that they match their desired configuration.
+        The current configurations are fetched concurrently and compared locally: only the repositories
+        which are missing or differ are written, updates sending only the fields which changed.
+        As for update_repo, only the fields explicitly set on the desired repositories are compared.
+        Secret fields can't be compared: a secret explicitly set, e.g. a rotated password, is always planned
+        as an update of its repository, its value being masked in the plan.
+        :param desired: Desired local, virtual, remote or federated repositories
+        :param dry_run: Only compute the plan, without writing anything
+        :param concurrency: Maximum number of concurrent requests
+        :return: The plan of the changes, applied unless dry_run is set
+        """
+        keys = [repo.key for repo in desired]
+        duplicates = sorted(key for key, count in Counter(keys).items() if count > 1)
+        if duplicates:
+            raise ValueError(f"Repositories {', '.join(duplicates)} are defined more than once")
+
+        existing_keys = {repository.key for repository in self.list()}
+        current_keys = [key for key in keys if key in existing_keys]
+        current = dict(zip(current_keys, self.get_repos(current_keys, concurrency)))
+        changes = [self._plan_change(repo, current.get(repo.key)) for repo in desired]
+        plan = RepositoryPlan(changes=changes, dry_run=dry_run)
+
+        if not dry_run:
+            writes = [
+                (repo, change) for repo, change in zip(desired, changes) if change.action != RepositoryAction.unchanged
+            ]
+            self._map_concurrently(self._apply_change, writes, concurrency)
+            logger.debug("Repositories successfully applied")
+        return plan
+
+    @staticmethod
+    def _plan_change(repo: AnyRepository, current: Optional[AnyRepositoryResponse]) -> RepositoryChange:
+        """
+        Compare a desired repository with its current configuration.
+        The desired values are validated by the response model first, so that equivalent values compare equal.
+        :param repo: Desired repository
+        :param current: Current configuration, None if the repository doesn't exist
+        :return: The change needed to reach the desired configuration
+        """
+        if current is None:
+            return RepositoryChange(key=repo.key, action=RepositoryAction.create)
+        if current.rclass != repo.rclass:
+            raise ArtifactoryError(
+                f"Repository {repo.key} is a {current.rclass.value} repository, "
+                f"it can't become a {repo.rclass.value} one",
+            )
+
+        secrets = {field for field in repo.model_fields_set if isinstance(getattr(repo, field), SecretStr)}
+        compared = [field for field in repo.model_fields_set - {"key"} - secrets if hasattr(current, field)]
+        normalized = type(current).model_validate({**current.model_dump(), **repo.model_dump(include=set(compared))})
+        fields = [
+            RepositoryFieldChange(field=field, current=getattr(current, field), desired=getattr(normalized, field))
+            for field in sorted(compared)
+            if getattr(normalized, field) != getattr(current, field)
+        ]
+        fields.extend(RepositoryFieldChange(field=field, desired=getattr(repo, field)) for field in sorted(secrets))
+        if not fields:
+            return RepositoryChange(key=repo.key, action=RepositoryAction.unchanged)
+        return RepositoryChange(key=repo.key, action=RepositoryAction.update, fields=fields)
+
+    def _apply_change(self, write: Tuple[AnyRepository, RepositoryChange]) -> None:
+        """
+        Send the request creating or updating a repository.
+        :param write: Desired repository and its planned change
+        """
+        repo, change = write
+        data: Dict[str, object]
+        if change.action == RepositoryAction.create:
+            data = repo.model_dump()
+            self._put(
+                f"api/{self._uri}/{repo.key}",
+                headers={"Content-Type": "application/json"},
+                data=json.dumps(data, default=custom_encoder),
+            )
+            logger.debug("Repository %s successfully created", repo.key)
+        else:
+            data = repo.model_dump(include={"key", "rclass"} | {field.field for field in change.fields})
+            self._post(
+                f"api/{self._uri}/{repo.key}",
+                headers={"Content-Type": "application/json"},
+                data=json.dumps(data, default=custom_encoder),
+            )
+            logger.debug("Repository %s successfully updated", repo.key)
+
     # Remote repositories operations
-    def list(self) -> List[SimpleRepository]:
+    @overload
+    def list(self, detailed: Literal[False] = False, concurrency: int = 8) -> List[SimpleRepository]:
+        ...
+
+    @overload
+    def list(self, detailed: Literal[True], concurrency: int = 8) -> List[AnyRepositoryResponse]:
+        ...
+
+    def list(
+        self,
+        detailed: bool = False,
+        concurrency: int = 8,
+    ) -> Union[List[SimpleRepository], List[AnyRepositoryResponse]]:
         """
         Lists all the repositories
+        :param detailed: Whether to return the full configuration of each repository, see get_repos
+        :param concurrency: Maximum number of concurrent requests fetching the configurations
         :return: A list of repositories
         """
         response = self._get(f"api/{self._uri}")
         logger.debug("List all repositories successful")
-        return [SimpleRepository(**repository) for repository in response.json()]
+        repositories = self._parse_list(response, SimpleRepository)
+        if detailed:
+            return self.get_repos([repository.key for repository in repositories], concurrency)
+        return repositories
 
     def delete(self, repo_name: str) -> None:
         """
@@ -22,7 +22,7 @@ class ArtifactorySecurity(ArtifactoryObject):
         """
         response = self._get(f"api/{self._uri}/encryptedPassword")
         logger.debug("Encrypted password successfully delivered")
-        return PasswordModel(**response.json())
+        return self._parse(response, PasswordModel)
 
     def create_access_token(
         self,
@@ -44,8 +44,23 @@ class ArtifactorySecurity(ArtifactoryObject):
         payload = {"username": user_name, "expires_in": expires_in, "refreshable": refreshable, "scope": scope}
         response = self._post(f"access/api/v1/{self._tokens_uri}", data=payload, raise_for_status=False)
         if response.ok:
-            return AccessTokenModel(**response.json())
-        raise InvalidTokenDataError(response.json().get("error_description", "Unknown error"))
+            return self._parse(response, AccessTokenModel)
+        raise InvalidTokenDataError(self._decode(response).get("error_description", "Unknown error"))
+
+    def refresh_access_token(self, access_token: str, refresh_token: str) -> AccessTokenModel:
+        """
+        Refreshes a refreshable access token, without minting a new one.
+
+        :param access_token: The access token to refresh
+        :param refresh_token: The refresh token returned along with the access token
+        :return: AccessToken, with a new refresh token
+        """
+        payload = {"grant_type": "refresh_token", "access_token": access_token, "refresh_token": refresh_token}
+        response = self._post(f"access/api/v1/{self._tokens_uri}", data=payload, raise_for_status=False)
+        if response.ok:
+            logger.debug("Token refreshed successfully")
+            return self._parse(response, AccessTokenModel)
+        raise InvalidTokenDataError(self._decode(response).get("error_description", "Unknown error"))
 
     def revoke_access_token(self, token: str) -> bool:
         """
@@ -73,7 +88,7 @@ class ArtifactorySecurity(ArtifactoryObject):
         """
         response = self._post(f"api/{self._uri}/apiKey")
         logger.debug("API Key successfully created")
-        return ApiKeyModel(**response.json())
+        return self._parse(response, ApiKeyModel)
 
     def regenerate_api_key(self) -> ApiKeyModel:
         """
@@ -82,7 +97,7 @@ class ArtifactorySecurity(ArtifactoryObject):
         """
         response = self._put(f"api/{self._uri}/apiKey")
         logger.debug("API Key successfully regenerated")
-        return ApiKeyModel(**response.json())
+        return self._parse(response, ApiKeyModel)
 
     def get_api_key(self) -> ApiKeyModel:
         """
@@ -91,7 +106,7 @@ class ArtifactorySecurity(ArtifactoryObject):
         """
         response = self._get(f"api/{self._uri}/apiKey")
         logger.debug("API Key successfully delivered")
-        return ApiKeyModel(**response.json())
+        return self._parse(response, ApiKeyModel)
 
     def revoke_api_key(self) -> None:
         """
@@ -0,0 +1,191 @@
+"""
+Definition of the in-memory snapshot of artifactory users, groups, permissions and repositories.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Generic, List, Mapping, Optional, Sequence, TypeVar
+
+from pyartifactory.models.group import Group
+from pyartifactory.models.permission import SimplePermission
+from pyartifactory.models.repository import SimpleRepository
+from pyartifactory.models.user import SimpleUser
+from pyartifactory.objects.group import ArtifactoryGroup
+from pyartifactory.objects.permission import ArtifactoryPermission
+from pyartifactory.objects.repository import ArtifactoryRepository
+from pyartifactory.objects.user import ArtifactoryUser
+
+logger = logging.getLogger("pyartifactory")
+
+T = TypeVar("T")
+
+
+class _Collection(Generic[T]):
+    """A listed collection, indexed by name and by a few attributes, reloaded once its TTL has expired."""
+
+    def __init__(
+        self,
+        load: Callable[[], Sequence[T]],
+        name: Callable[[T], str],
+        attributes: Dict[str, Callable[[T], Optional[str]]],
+        ttl: Optional[float],
+    ) -> None:
+        self._load = load
+        self._name = name
+        self._attributes = attributes
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._loaded_at: Optional[float] = None
+        self.by_name: Mapping[str, T] = MappingProxyType({})
+        self.by_attribute: Dict[str, Dict[Optional[str], List[T]]] = {}
+
+    @property
+    def expired(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        return self._ttl is not None and time.monotonic() - self._loaded_at >= self._ttl
+
+    def ensure_loaded(self) -> None:
+        if not self.expired:
+            return
+        with self._lock:
+            if self.expired:
+                self.reload()
+
+    def reload(self) -> None:
+        items = self._load()
+        by_attribute: Dict[str, Dict[Optional[str], List[T]]] = {attribute: {} for attribute in self._attributes}
+        for item in items:
+            for attribute, value in self._attributes.items():
+                by_attribute[attribute].setdefault(value(item), []).append(item)
+        self.by_name = MappingProxyType({self._name(item): item for item in items})
+        self.by_attribute = by_attribute
+        self._loaded_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+
+class ArtifactorySnapshot:
+    """
+    Models an in-memory snapshot of the users, groups, permissions and repositories, indexed for O(1) lookups.
+    Each collection is listed with a single request on first use, then again only once its TTL has expired,
+    independently of the other collections.
+    """
+
+    def __init__(
+        self,
+        users: ArtifactoryUser,
+        groups: ArtifactoryGroup,
+        permissions: ArtifactoryPermission,
+        repositories: ArtifactoryRepository,
+        ttl: Optional[float] = 300.0,
+    ) -> None:
+        """
+        :param users: Users client
+        :param groups: Groups client
+        :param permissions: Permissions client
+        :param repositories: Repositories client
+        :param ttl: Number of seconds a listed collection is kept, None to keep it until refreshed
+        """
+        self._users: _Collection[SimpleUser] = _Collection(
+            users.list,
+            lambda user: user.name,
+            {"realm": lambda user: user.realm},
+            ttl,
+        )
+        self._groups: _Collection[Group] = _Collection(
+            groups.list,
+            lambda group: group.name,
+            {"realm": lambda group: group.realm},
+            ttl,
+        )
+        self._permissions: _Collection[SimplePermission] = _Collection(
+            permissions.list,
+            lambda permission: permission.name,
+            {},
+            ttl,
+        )
+        self._repositories: _Collection[SimpleRepository] = _Collection(
+            repositories.list,
+            lambda repository: repository.key,
+            {
+                "package_type": lambda repository: repository.packageType.lower(),
+                "rclass": lambda repository: repository.type.lower(),
+            },
+            ttl,
+        )
+
+    @property
+    def users(self) -> Mapping[str, SimpleUser]:
+        """Users by name."""
+        self._users.ensure_loaded()
+        return self._users.by_name
+
+    @property
+    def groups(self) -> Mapping[str, Group]:
+        """Groups by name."""
+        self._groups.ensure_loaded()
+        return self._groups.by_name
+
+    @property
+    def permissions(self) -> Mapping[str, SimplePermission]:
+        """Permissions by name."""
+        self._permissions.ensure_loaded()
+        return self._permissions.by_name
+
+    @property
+    def repositories(self) -> Mapping[str, SimpleRepository]:
+        """Repositories by key."""
+        self._repositories.ensure_loaded()
+        return self._repositories.by_name
+
+    def users_by_realm(self, realm: Optional[str]) -> List[SimpleUser]:
+        """
+        :param realm: Realm of the users, e.g. "internal" or "ldap"
+        :return: The users of the realm
+        """
+        self._users.ensure_loaded()
+        return list(self._users.by_attribute["realm"].get(realm, []))
+
+    def groups_by_realm(self, realm: Optional[str]) -> List[Group]:
+        """
+        :param realm: Realm of the groups
+        :return: The groups of the realm
+        """
+        self._groups.ensure_loaded()
+        return list(self._groups.by_attribute["realm"].get(realm, []))
+
+    def repositories_by_package_type(self, package_type: str) -> List[SimpleRepository]:
+        """
+        :param package_type: Package type of the repositories, e.g. "docker"
+        :return: The repositories of the package type
+        """
+        self._repositories.ensure_loaded()
+        return list(self._repositories.by_attribute["package_type"].get(package_type.lower(), []))
+
+    def repositories_by_rclass(self, rclass: str) -> List[SimpleRepository]:
+        """
+        :param rclass: Class of the repositories: "local", "remote", "virtual" or "federated"
+        :return: The repositories of the class
+        """
+        self._repositories.ensure_loaded()
+        return list(self._repositories.by_attribute["rclass"].get(rclass.lower(), []))
+
+    def refresh(self) -> None:
+        """Lists all the collections again, whatever their TTL."""
+        for collection in self._collections:
+            collection.reload()
+        logger.debug("Snapshot successfully refreshed")
+
+    def invalidate(self) -> None:
+        """Forgets all the collections, each of them being listed again on its next use."""
+        for collection in self._collections:
+            collection.invalidate()
+
+    @property
+    def _collections(self) -> List[_Collection[Any]]:
+        return [self._users, self._groups, self._permissions, self._repositories]
@@ -0,0 +1,167 @@
+"""
+Definition of the access token manager, caching and refreshing access tokens.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import requests
+
+from pyartifactory.exception import ArtifactoryError
+from pyartifactory.models.auth import AccessTokenModel
+from pyartifactory.objects.security import ArtifactorySecurity
+
+logger = logging.getLogger("pyartifactory")
+
+TokenKey = Tuple[str, str]
+
+
+class _CachedToken:
+    """An access token and the time it was obtained at, the token being None until it is created."""
+
+    def __init__(self) -> None:
+        self.token: Optional[AccessTokenModel] = None
+        self.obtained_at = 0.0
+        # Guards the token and its state, never held while a request is sent
+        self.lock = threading.Lock()
+        # Serialises the creation and the renewals of the token, so that a refresh token is used only once;
+        # only the callers without any valid token wait for it
+        self.renew_lock = threading.Lock()
+        self.refreshing = False
+
+    def age(self) -> float:
+        return time.monotonic() - self.obtained_at
+
+    def update(self, token: AccessTokenModel) -> AccessTokenModel:
+        with self.lock:
+            self.token = token
+            self.obtained_at = time.monotonic()
+        return token
+
+
+class AccessTokenManager:
+    """
+    Caches access tokens per (user, scope) and refreshes them ahead of their expiry.
+    A token close to its expiry is refreshed in the background while it is still handed out, so that
+    callers never wait; a token already expired is renewed before being returned.
+    Refreshable tokens are refreshed with their refresh token, the others are minted again.
+    """
+
+    def __init__(
+        self,
+        security: ArtifactorySecurity,
+        expires_in: int = 3600,
+        refreshable: bool = True,
+        refresh_before: float = 60.0,
+    ) -> None:
+        """
+        :param security: Security client, authenticated as a user allowed to create the tokens
+        :param expires_in: Expiry time of the created tokens in seconds
+        :param refreshable: Whether the created tokens can be refreshed with their refresh token
+        :param refresh_before: Number of seconds before the expiry at which a token is refreshed,
+                               at most half of the lifetime of the token
+        """
+        self._security = security
+        self._expires_in = expires_in
+        self._refreshable = refreshable
+        self._refresh_before = refresh_before
+        self._lock = threading.Lock()
+        self._tokens: Dict[TokenKey, _CachedToken] = {}
+
+    def get_token(self, user_name: str, scope: str = "applied-permissions/user") -> AccessTokenModel:
+        """
+        :param user_name: Name of the user the token is granted to
+        :param scope: The scope of access that the token provides
+        :return: A valid access token, created only when none is cached for this user and scope
+        """
+        key = (user_name, scope)
+        with self._lock:
+            cached = self._tokens.setdefault(key, _CachedToken())
+
+        token = cached.token
+        if token is None:
+            # Only the callers asking for this user and scope wait for the token to be created
+            with cached.renew_lock:
+                return cached.token or cached.update(self._create(key))
+
+        lifetime = token.expires_in
+        if not lifetime:
+            return token
+        age = cached.age()
+        if age >= lifetime:
+            with cached.renew_lock:
+                if cached.age() >= lifetime:
+                    return cached.update(self._renew(key, cached.token or token))
+            return cached.token or token
+        if age >= lifetime - min(self._refresh_before, lifetime / 2):
+            self._renew_in_background(key, cached, token)
+        return token
+
+    def token_provider(self, user_name: str, scope: str = "applied-permissions/user") -> Callable[[], str]:
+        """
+        :param user_name: Name of the user the token is granted to
+        :param scope: The scope of access that the token provides
+        :return: A function returning a valid access token, to be given as token_provider to Artifactory
+        """
+        return lambda: self.get_token(user_name, scope).access_token
+
+    def invalidate(self, user_name: Optional[str] = None, scope: Optional[str] = None) -> None:
+        """
+        Forgets the cached tokens, the next ones being created again.
+        :param user_name: Only forget the tokens of this user
+        :param scope: Only forget the tokens of this scope
+        """
+        with self._lock:
+            for key in list(self._tokens):
+                if user_name in (None, key[0]) and scope in (None, key[1]):
+                    del self._tokens[key]
+
+    def _create(self, key: TokenKey) -> AccessTokenModel:
+        user_name, scope = key
+        token = self._security.create_access_token(
+            user_name,
+            expires_in=self._expires_in,
+            refreshable=self._refreshable,
+            scope=scope,
+        )
+        logger.debug("Access token created for %s", user_name)
+        return token
+
+    def _renew(self, key: TokenKey, current: AccessTokenModel) -> AccessTokenModel:
+        """
+        Refresh a token, or create a new one when it can't be refreshed. No lock is held meanwhile,
+        the new token replacing the cached one once obtained.
+        :param key: User and scope of the token
+        :param current: The token to renew
+        :return: The new token
+        """
+        token = None
+        if current.refresh_token is not None:
+            try:
+                token = self._security.refresh_access_token(current.access_token, current.refresh_token)
+            except (ArtifactoryError, requests.exceptions.RequestException) as error:
+                logger.warning("Access token of %s could not be refreshed, creating a new one: %s", key[0], error)
+        return token or self._create(key)
+
+    def _renew_in_background(self, key: TokenKey, cached: _CachedToken, current: AccessTokenModel) -> None:
+        with cached.lock:
+            if cached.refreshing:
+                return
+            cached.refreshing = True
+
+        def renew() -> None:
+            try:
+                with cached.renew_lock:
+                    # Skipped if the token expired, and was renewed by a caller, before the lock was acquired
+                    if cached.token is current:
+                        cached.update(self._renew(key, current))
+            except Exception:
+                logger.exception("Access token of %s could not be renewed", key[0])
+            finally:
+                with cached.lock:
+                    cached.refreshing = False
+
+        threading.Thread(target=renew, name="pyartifactory-token-refresh", daemon=True).start()
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Union
+from typing import List, Tuple, Union
 
 import requests
 from requests import Response
 
 from pyartifactory.exception import ArtifactoryError, UserAlreadyExistsError, UserNotFoundError
-from pyartifactory.models.user import NewUser, SimpleUser, User, UserResponse
+from pyartifactory.models.user import (
+    NewUser,
+    SimpleUser,
+    User,
+    UserResponse,
+    UserUpsertAction,
+    UserUpsertReport,
+    UserUpsertResult,
+)
 from pyartifactory.objects.object import ArtifactoryObject
 
 logger = logging.getLogger("pyartifactory")
@@ -25,16 +33,22 @@ class ArtifactoryUser(ArtifactoryObject):
         :return: User
         """
         username = user.name
-        try:
-            self.get(username)
+        if self.exists(username):
             logger.error("User %s already exists", username)
             raise UserAlreadyExistsError(f"User {username} already exists")
-        except UserNotFoundError:
-            data = user.model_dump()
-            data["password"] = user.password.get_secret_value()
-            self._put(f"api/{self._uri}/{username}", json=data)
-            logger.debug("User %s successfully created", username)
-            return self.get(user.name)
+        data = user.model_dump()
+        data["password"] = user.password.get_secret_value()
+        self._put(f"api/{self._uri}/{username}", json=data)
+        logger.debug("User %s successfully created", username)
+        return self.get(user.name)
+
+    def exists(self, name: str) -> bool:
+        """
+        Checks whether a user exists, with a single request and without reading the user
+        :param name: Name of the user
+        :return: True if the user exists
+        """
+        return self._exists(f"api/{self._uri}/{name}")
 
     def get(self, name: str) -> UserResponse:
         """
@@ -45,7 +59,7 @@ class ArtifactoryUser(ArtifactoryObject):
         try:
             response = self._get(f"api/{self._uri}/{name}")
             logger.debug("User %s found", name)
-            return UserResponse(**response.json())
+            return self._parse(response, UserResponse)
         except requests.exceptions.HTTPError as error:
             http_response: Union[Response, None] = error.response
             if isinstance(http_response, Response) and http_response.status_code in (404, 400):
@@ -60,7 +74,7 @@ class ArtifactoryUser(ArtifactoryObject):
         """
         response = self._get(f"api/{self._uri}")
         logger.debug("List all users successful")
-        return [SimpleUser(**user) for user in response.json()]
+        return self._parse_list(response, SimpleUser)
 
     def update(self, user: User) -> UserResponse:
         """
@@ -77,6 +91,58 @@ class ArtifactoryUser(ArtifactoryObject):
         logger.debug("User %s successfully updated", username)
         return self.get(username)
 
+    def upsert(self, users: List[Union[NewUser, User]], concurrency: int = 8) -> UserUpsertReport:
+        """
+        Creates the missing users and updates the existing ones, concurrently.
+        The existing users are known from a single list call; only the users which are missing or differ
+        on the fields explicitly set are written, an update sending only these fields.
+        The password of an existing user is never changed.
+        A failure is reported for its user and doesn't stop the other upserts.
+        :param users: NewUser objects for the users to create, NewUser or User objects for the users to update
+        :param concurrency: Maximum number of concurrent requests
+        :return: The outcome of each upsert, in the order of the users
+        """
+        existing = {user.name for user in self.list()}
+        results = self._map_concurrently(
+            self._upsert,
+            [(user, user.name in existing) for user in users],
+            concurrency,
+        )
+        logger.debug("Users successfully upserted")
+        return UserUpsertReport(results=results)
+
+    def _upsert(self, item: Tuple[Union[NewUser, User], bool]) -> UserUpsertResult:
+        """
+        Create or update a single user, see upsert.
+        :param item: User and whether it already exists
+        :return: The outcome of the upsert
+        """
+        user, exists = item
+        try:
+            if not exists:
+                if not isinstance(user, NewUser):
+                    raise UserNotFoundError(f"User {user.name} does not exist and has no password to be created")
+                data = user.model_dump()
+                data["password"] = user.password.get_secret_value()
+                self._put(f"api/{self._uri}/{user.name}", json=data)
+                logger.debug("User %s successfully created", user.name)
+                return UserUpsertResult(name=user.name, action=UserUpsertAction.created)
+
+            current = self.get(user.name)
+            fields = sorted(
+                field
+                for field in user.model_fields_set - {"name", "password"}
+                if _normalized(getattr(user, field)) != _normalized(getattr(current, field, None))
+            )
+            if not fields:
+                return UserUpsertResult(name=user.name, action=UserUpsertAction.unchanged)
+            self._post(f"api/{self._uri}/{user.name}", json=user.model_dump(include={"name", *fields}))
+            logger.debug("User %s successfully updated", user.name)
+            return UserUpsertResult(name=user.name, action=UserUpsertAction.updated, fields=fields)
+        except (ArtifactoryError, requests.exceptions.RequestException) as error:
+            logger.error("Upsert of user %s failed: %s", user.name, error)
+            return UserUpsertResult(name=user.name, action=UserUpsertAction.failed, error=str(error) or repr(error))
+
     def delete(self, name: str) -> None:
         """
         Remove user
@@ -96,3 +162,10 @@ class ArtifactoryUser(ArtifactoryObject):
         """
         self._post(f"api/security/unlockUsers/{name}")
         logger.debug("User % successfully unlocked", name)
+
+
+def _normalized(value: object) -> object:
+    """Compare lists, such as the groups of a user, whatever their order."""
+    if isinstance(value, list):
+        return sorted(value)
+    return value
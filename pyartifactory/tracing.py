@@ -0,0 +1,125 @@
+"""
+Definition of request tracing.
+"""
+from __future__ import annotations
+
+import contextvars
+import functools
+import inspect
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Generator,
+    Iterator,
+    Optional,
+    Protocol,
+    Type,
+    TypeVar,
+    runtime_checkable,
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@runtime_checkable
+class Span(Protocol):
+    """The subset of the OpenTelemetry span interface used by pyartifactory."""
+
+    def set_attribute(self, key: str, value: Any) -> Any:
+        ...
+
+
+@runtime_checkable
+class Tracer(Protocol):
+    """
+    The subset of the OpenTelemetry tracer interface used by pyartifactory.
+    Any tracer returned by opentelemetry.trace.get_tracer() can be used as is.
+    """
+
+    def start_as_current_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> ContextManager[Any]:
+        ...
+
+
+class NoOpSpan:
+    """Span discarding everything, used when tracing is disabled."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Ignore the attribute."""
+
+    def __enter__(self) -> NoOpSpan:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        return None
+
+
+class NoOpTracer:
+    """Tracer creating no span at all, the default when no tracer is configured."""
+
+    _span = NoOpSpan()
+
+    def start_as_current_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> NoOpSpan:
+        """
+        :param name: Name of the span
+        :param attributes: Attributes of the span
+        :return: A span doing nothing
+        """
+        return self._span
+
+
+NOOP_TRACER = NoOpTracer()
+
+
+def traced(span_name: str) -> Callable[[F], F]:
+    """
+    Decorate a method of an ArtifactoryObject so that each call runs in its own span,
+    the HTTP requests sent meanwhile becoming its children.
+    :param span_name: Name of the span, e.g. "ArtifactoryArtifact.download"
+    :return: The decorator
+    """
+
+    def decorator(func: F) -> F:
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def generator_wrapper(self: Any, *args: Any, **kwargs: Any) -> Iterator[Any]:
+                # The span is current in a context of its own, entered around each step of the generator only,
+                # so that it doesn't stay current in the caller between two items
+                context = contextvars.copy_context()
+                span = self._tracer.start_as_current_span(span_name)
+                context.run(span.__enter__)
+                try:
+                    iterator: Generator[Any, None, None] = context.run(func, self, *args, **kwargs)
+                    while True:
+                        try:
+                            item = context.run(next, iterator)
+                        except StopIteration:
+                            break
+                        try:
+                            yield item
+                        except GeneratorExit:
+                            context.run(iterator.close)
+                            break
+                except BaseException as error:
+                    context.run(span.__exit__, type(error), error, error.__traceback__)
+                    raise
+                context.run(span.__exit__, None, None, None)
+
+            return generator_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            with self._tracer.start_as_current_span(span_name):
+                return func(self, *args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
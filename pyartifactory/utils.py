@@ -3,11 +3,19 @@ Definition of all utils.
 """
 from __future__ import annotations
 
-from typing import Any
+import importlib
+import json
+import re
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from pydantic import SecretStr
 from pydantic_core import to_jsonable_python
 
+JsonLoads = Callable[[bytes], Any]
+
+_STRUCTURAL_CHARACTERS = re.compile(rb'["{}\[\]:,]')
+_STRING_CHARACTERS = re.compile(rb'["\\]')
+
 
 def custom_encoder(obj: Any) -> Any:
     """
@@ -18,3 +26,141 @@ def custom_encoder(obj: Any) -> Any:
     if isinstance(obj, SecretStr):
         return obj.get_secret_value()
     return to_jsonable_python(obj)
+
+
+def get_json_loads(backend: str) -> JsonLoads:
+    """
+    Get the function decoding JSON documents with the given backend
+    :param backend: "json" (standard library), "orjson" or "msgspec", the last two must be installed separately
+    :return: A function decoding JSON bytes into Python objects
+    """
+    if backend == "json":
+        return json.loads
+    if backend == "orjson":
+        return importlib.import_module("orjson").loads  # type: ignore[no-any-return]
+    if backend == "msgspec":
+        return importlib.import_module("msgspec.json").decode  # type: ignore[no-any-return]
+    raise ValueError(f"Unknown JSON backend: {backend}")
+
+
+class _Container:
+    """An object or array opened while scanning a JSON document."""
+
+    __slots__ = ("is_object", "key", "expecting_key", "position")
+
+    def __init__(self, is_object: bool) -> None:
+        self.is_object = is_object
+        self.key: Optional[str] = None if is_object else "*"
+        self.expecting_key = is_object
+        # Position of the current element of an array
+        self.position = 0
+
+
+def _string_end(buffer: bytearray, start: int) -> int:
+    """
+    :param buffer: Buffer holding a JSON string
+    :param start: Index of the first character after the opening quote
+    :return: Index of the closing quote, -1 if the string is not complete in the buffer
+    """
+    position = start
+    while True:
+        match = _STRING_CHARACTERS.search(buffer, position)
+        if match is None:
+            return -1
+        if buffer[match.start()] == ord('"'):
+            return match.start()
+        if match.start() + 1 >= len(buffer):
+            return -1
+        position = match.start() + 2
+
+
+def iter_json_items(chunks: Iterable[bytes], path: Sequence[str]) -> Iterator[bytes]:
+    """
+    Scan a JSON document incrementally, yielding the raw JSON of the objects or arrays found at path one at a time,
+    so that only one of them is held in memory at once, whatever the size of the document.
+    :param chunks: The document, as successive chunks of bytes, e.g. response.iter_content()
+    :param path: Keys leading to the items, "*" standing for any element of an array,
+                 e.g. ["buildInfo", "modules", "*", "artifacts", "*"]
+    :return: The raw JSON of the items, in the order of the document
+    """
+    for _, _, item in iter_json_paths(chunks, [path]):
+        if item[:1] != b'"':
+            yield item
+
+
+def iter_json_paths(
+    chunks: Iterable[bytes],
+    paths: Sequence[Sequence[str]],
+) -> Iterator[Tuple[int, Tuple[int, ...], bytes]]:
+    """
+    Scan a JSON document incrementally as iter_json_items does, yielding the objects, arrays or strings found
+    at any of several paths, along with the positions of their enclosing array elements, e.g. to tell which
+    module each artifact of a build info belongs to.
+    :param chunks: The document, as successive chunks of bytes, e.g. response.iter_content()
+    :param paths: Keys leading to the items, "*" standing for any element of an array
+    :return: (index of the matched path, positions in the arrays matched by "*", raw JSON) tuples,
+             in the order of the document
+    """
+    targets: List[List[Optional[str]]] = [list(path) for path in paths]
+    containers: List[_Container] = []
+    buffer = bytearray()
+    position = 0
+    item_start: Optional[int] = None
+    item_depth = 0
+    item_path = 0
+    item_positions: Tuple[int, ...] = ()
+
+    for chunk in chunks:
+        buffer += chunk
+        while True:
+            match = _STRUCTURAL_CHARACTERS.search(buffer, position)
+            if match is None:
+                position = len(buffer)
+                break
+            index = match.start()
+            character = buffer[index]
+            if character == ord('"'):
+                end = _string_end(buffer, index + 1)
+                if end < 0:
+                    position = index
+                    break
+                if containers and containers[-1].expecting_key:
+                    containers[-1].key = json.loads(buffer[index : end + 1])
+                elif item_start is None:
+                    keys = [container.key for container in containers]
+                    if keys in targets:
+                        yield targets.index(keys), _positions(containers), bytes(buffer[index : end + 1])
+                position = end + 1
+                continue
+            if character in b"{[":
+                keys = [container.key for container in containers]
+                if item_start is None and keys in targets:
+                    item_start = index
+                    item_depth = len(containers)
+                    item_path = targets.index(keys)
+                    item_positions = _positions(containers)
+                containers.append(_Container(is_object=character == ord("{")))
+            elif character in b"}]":
+                containers.pop()
+                if item_start is not None and len(containers) == item_depth:
+                    yield item_path, item_positions, bytes(buffer[item_start : index + 1])
+                    item_start = None
+            elif not containers:
+                raise ValueError(f"Unexpected {chr(character)!r} outside of any JSON object or array")
+            elif character == ord(":"):
+                containers[-1].expecting_key = False
+            elif containers[-1].is_object:
+                containers[-1].expecting_key = True
+            else:
+                containers[-1].position += 1
+            position = index + 1
+
+        keep = position if item_start is None else item_start
+        del buffer[:keep]
+        position -= keep
+        if item_start is not None:
+            item_start = 0
+
+
+def _positions(containers: List[_Container]) -> Tuple[int, ...]:
+    return tuple(container.position for container in containers if not container.is_object)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import pytest
+import responses
+
+from pyartifactory import Artifactory, EffectiveAccess
+from pyartifactory.models import Group, Permission, PermissionV2, SimplePermission, SimpleRepository
+from pyartifactory.models.permission import PermissionEnumV2
+from pyartifactory.objects.access import compile_ant_patterns
+
+URL = "http://localhost:8080/artifactory"
+AUTH = ("user", "password_or_apiKey")
+
+REPOSITORIES = [
+    SimpleRepository(key="libs-release", type="LOCAL", url="some-url", packageType="maven"),
+    SimpleRepository(key="maven-central", type="REMOTE", url="some-url", packageType="maven"),
+]
+GROUPS = [
+    Group(name="developers", userNames=["alice", "bob"]),
+    Group(name="admins", adminPrivileges=True, userNames=["root"]),
+]
+PERMISSION_V2 = PermissionV2(
+    name="deploy-releases",
+    repo={
+        "repositories": ["libs-release"],
+        "include-patterns": ["org/example/**"],
+        "exclude-patterns": ["**/*-SNAPSHOT/**"],
+        "actions": {"users": {"carol": ["read"]}, "groups": {"developers": ["read", "write"]}},
+    },
+)
+PERMISSION_V1 = Permission(
+    name="read-remotes",
+    repositories=["ANY REMOTE"],
+    principals={"users": {"carol": ["r", "w"]}},
+)
+
+
+@pytest.mark.parametrize(
+    "pattern,path,matches",
+    [
+        ("**", "any/thing.jar", True),
+        ("org/**", "org", True),
+        ("org/**", "org/example/a.jar", True),
+        ("org/**", "organization/a.jar", False),
+        ("**/*.jar", "a.jar", True),
+        ("**/*.jar", "org/example/a.jar", True),
+        ("**/*.jar", "org/example/a.pom", False),
+        ("org/*/a.jar", "org/example/a.jar", True),
+        ("org/*/a.jar", "org/example/sub/a.jar", False),
+        ("org/**/a.jar", "org/a.jar", True),
+        ("org/**/a.jar", "org/example/sub/a.jar", True),
+        ("a?c/**,b/**", "abc/file", True),
+        ("a?c/**,b/**", "b/file", True),
+        ("a?c/**,b/**", "abbc/file", False),
+    ],
+)
+def test_compile_ant_patterns(pattern, path, matches):
+    assert bool(compile_ant_patterns([pattern]).fullmatch(path)) is matches
+
+
+def test_compile_empty_ant_patterns():
+    assert compile_ant_patterns(["", " "]) is None
+
+
+def test_effective_access():
+    access = EffectiveAccess([PERMISSION_V2, PERMISSION_V1], GROUPS, REPOSITORIES)
+
+    assert access.can("alice", "write", "libs-release", "org/example/lib/1.0/lib-1.0.jar")
+    assert access.can("alice", "deploy", "libs-release", "org/example/lib/1.0/lib-1.0.jar")
+    assert not access.can("alice", "write", "libs-release", "org/example/lib/1.0-SNAPSHOT/lib.jar")
+    assert not access.can("alice", "write", "libs-release", "com/other/lib.jar")
+    assert not access.can("alice", "delete", "libs-release")
+    assert access.actions("carol", "libs-release") == {PermissionEnumV2.read}
+    assert access.actions("carol", "maven-central", "any/path") == {PermissionEnumV2.read, PermissionEnumV2.write}
+    assert access.actions("root", "libs-release") == set(PermissionEnumV2)
+    assert access.actions("dave", "libs-release") == set()
+    assert access.users_with("write", "libs-release", "org/example/a.jar") == ["alice", "bob", "root"]
+
+
+@responses.activate
+def test_load_effective_access():
+    responses.add(
+        responses.GET,
+        f"{URL}/api/v2/security/permissions",
+        json=[SimplePermission(name=PERMISSION_V2.name, uri="https://some.uri").model_dump()],
+    )
+    responses.add(
+        responses.GET,
+        f"{URL}/api/v2/security/permissions/{PERMISSION_V2.name}",
+        json=PERMISSION_V2.model_dump(by_alias=True),
+    )
+    responses.add(responses.GET, f"{URL}/api/security/groups", json=[{"name": group.name} for group in GROUPS])
+    for group in GROUPS:
+        responses.add(responses.GET, f"{URL}/api/security/groups/{group.name}", json=group.model_dump())
+    responses.add(
+        responses.GET,
+        f"{URL}/api/repositories",
+        json=[repository.model_dump() for repository in REPOSITORIES],
+    )
+
+    access = Artifactory(url=URL, auth=AUTH, api_version=2).effective_access(concurrency=2)
+
+    assert access.groups_of("bob") == {"developers"}
+    assert access.can("bob", "write", "libs-release", "org/example/a.jar")
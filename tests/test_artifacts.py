@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import urllib.parse
 from pathlib import Path
 
 import pytest
 import responses
 
-from pyartifactory import ArtifactoryArtifact
+from pyartifactory import ArtifactoryArtifact, BlobCache
 from pyartifactory.exception import ArtifactNotFoundError, ArtifactoryError, BadPropertiesError, PropertyNotFoundError
 from pyartifactory.models import ArtifactPropertiesResponse, ArtifactStatsResponse, AuthModel
 from pyartifactory.models.artifact import (
@@ -17,6 +18,7 @@ from pyartifactory.models.artifact import (
     ArtifactListResponse,
     Checksums,
 )
+from pyartifactory.models.build import Artifacts, BuildSingleModule
 
 URL = "http://localhost:8080/artifactory"
 AUTH = ("user", "password_or_apiKey")
@@ -179,6 +181,30 @@ def test_deploy_artifact_success(mocker):
     assert artifact.model_dump() == FILE_INFO.model_dump()
 
 
+@responses.activate
+def test_deploy_artifact_build_module(mocker):
+    responses.add(responses.PUT, f"{URL}/{ARTIFACT_PATH}", status=200)
+    responses.add(responses.GET, f"{URL}/api/storage/{ARTIFACT_PATH}", json=FILE_INFO_RESPONSE, status=200)
+    generate = mocker.spy(Checksums, "generate")
+    build_module = BuildSingleModule(id="org:app:1.0")
+
+    artifactory = ArtifactoryArtifact(AuthModel(url=URL, auth=AUTH))
+    artifactory.deploy(Path(LOCAL_FILE_LOCATION), Path(ARTIFACT_PATH), build_module=build_module)
+
+    checksums = Checksums.generate(Path(LOCAL_FILE_LOCATION))
+    assert generate.call_count == 2
+    assert build_module.artifacts == [
+        Artifacts(
+            type="txt",
+            sha1=checksums.sha1,
+            sha256=checksums.sha256,
+            md5=checksums.md5,
+            name="file.txt",
+            path="file.txt",
+        ),
+    ]
+
+
 @responses.activate
 def test_download_artifact_success(tmp_path):
     artifact_name = ARTIFACT_PATH.split("/")[1]
@@ -197,6 +223,23 @@ def test_download_artifact_success(tmp_path):
     assert artifact.is_file()
 
 
+@responses.activate
+def test_download_artifact_with_cache(tmp_path):
+    content = b"artifact content"
+    file_info = {**FILE_INFO_RESPONSE, "checksums": {**FILE_INFO_RESPONSE["checksums"]}}
+    file_info["checksums"]["sha256"] = hashlib.sha256(content).hexdigest()
+    responses.add(responses.GET, f"{URL}/api/storage/{ARTIFACT_PATH}", status=200, json=file_info)
+    responses.add(responses.GET, f"{URL}/{ARTIFACT_PATH}", body=content, status=200)
+
+    cache = BlobCache(tmp_path / "cache")
+    artifactory = ArtifactoryArtifact(AuthModel(url=URL, auth=AUTH))
+    first = artifactory.download(ARTIFACT_PATH, str(tmp_path / "first"), cache=cache)
+    second = artifactory.download(ARTIFACT_PATH, str(tmp_path / "second"), cache=cache)
+
+    assert first.read_bytes() == second.read_bytes() == content
+    assert [call.request.url for call in responses.calls].count(f"{URL}/{ARTIFACT_PATH}") == 1
+
+
 @pytest.mark.parametrize(
     "requested_path",
     [ARTIFACT_REPO, f"{ARTIFACT_REPO}/", f"/{ARTIFACT_REPO}", f"/{ARTIFACT_REPO}/"],
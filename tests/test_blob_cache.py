@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import hashlib
+import os
+
+import pytest
+
+from pyartifactory import BlobCache
+from pyartifactory.exception import ArtifactoryError
+
+CONTENT = b"some content"
+SHA256 = hashlib.sha256(CONTENT).hexdigest()
+
+
+def _write(content):
+    def write(file):
+        file.write(content)
+
+    return write
+
+
+def test_fetch_writes_a_blob_once(tmp_path, mocker):
+    cache = BlobCache(tmp_path / "cache")
+    write = mocker.Mock(side_effect=_write(CONTENT))
+
+    assert cache.get("sha256", SHA256) is None
+    blob = cache.fetch("sha256", SHA256, write)
+    assert cache.fetch("sha256", SHA256, write) == blob
+
+    assert blob.read_bytes() == CONTENT
+    assert cache.get("sha256", SHA256) == blob
+    write.assert_called_once()
+
+
+def test_fetch_checks_the_checksum(tmp_path):
+    cache = BlobCache(tmp_path / "cache")
+
+    with pytest.raises(ArtifactoryError):
+        cache.fetch("sha256", SHA256, _write(b"other content"))
+    assert cache.get("sha256", SHA256) is None
+    assert not [path for path in (tmp_path / "cache" / "blobs").rglob("*") if path.is_file()]
+
+
+@pytest.mark.parametrize("link", ["auto", "hardlink", "copy"])
+def test_materialize(tmp_path, link):
+    cache = BlobCache(tmp_path / "cache", link=link)
+    blob = cache.fetch("sha256", SHA256, _write(CONTENT))
+    target = tmp_path / "target" / "file.txt"
+    target.parent.mkdir()
+    target.write_bytes(b"stale")
+
+    assert cache.materialize(blob, target) == target
+    assert target.read_bytes() == CONTENT
+    assert target.samefile(blob) == (link == "hardlink")
+
+
+def test_get_keeps_the_mtime_of_hardlinked_files(tmp_path):
+    cache = BlobCache(tmp_path / "cache", link="hardlink")
+    target = cache.fetch("sha256", SHA256, _write(CONTENT), target=tmp_path / "file.txt")
+    os.utime(target, (0, 0))
+
+    assert cache.get("sha256", SHA256) is not None
+    assert target.stat().st_mtime == 0
+
+
+def test_fetch_materializes_the_target(tmp_path, mocker):
+    cache = BlobCache(tmp_path / "cache")
+    write = mocker.Mock(side_effect=_write(CONTENT))
+    target = tmp_path / "target" / "file.txt"
+
+    blob = cache.fetch("sha256", SHA256, write)
+    blob.unlink()  # evicted by another process
+    assert cache.fetch("sha256", SHA256, write, target=target) == target
+    assert cache.fetch("sha256", SHA256, write, target=target) == target
+
+    assert target.read_bytes() == CONTENT
+    assert write.call_count == 2
+
+
+def test_evict_least_recently_used(tmp_path):
+    cache = BlobCache(tmp_path / "cache", max_size=30)
+    contents = [CONTENT, b"other content", b"third content"]
+    checksums = [hashlib.sha256(content).hexdigest() for content in contents]
+    blobs = [cache.fetch("sha256", checksum, _write(content)) for checksum, content in zip(checksums[:2], contents)]
+    for index, blob in enumerate(blobs):
+        os.utime(tmp_path / "cache" / "locks" / f"sha256-{blob.name}.lock", (index, index))
+
+    cache.fetch("sha256", checksums[2], _write(contents[2]))
+
+    assert cache.get("sha256", checksums[0]) is None
+    assert not (tmp_path / "cache" / "locks" / f"sha256-{checksums[0]}.lock").exists()
+    assert cache.get("sha256", checksums[1]) is not None
+    assert cache.get("sha256", checksums[2]) is not None
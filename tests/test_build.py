@@ -1,25 +1,34 @@
 from __future__ import annotations
 
+import json
+from datetime import datetime, timedelta, timezone
+
 import pytest
 import requests
 import responses
+from pydantic import ValidationError
 from requests.models import Response
 
 from pyartifactory import ArtifactoryBuild
 from pyartifactory.exception import ArtifactoryError, BuildNotFoundError
 from pyartifactory.models import (
     AuthModel,
+    BuildArtifact,
     BuildCreateRequest,
     BuildDeleteRequest,
     BuildDiffResponse,
     BuildError,
     BuildInfo,
+    BuildInfoDetail,
     BuildListResponse,
+    BuildModules,
     BuildPromotionRequest,
     BuildPromotionResult,
     BuildProperties,
+    BuildRetentionPolicy,
     BuildRuns,
     Run,
+    SimpleBuild,
 )
 
 URL = "http://localhost:8080/artifactory"
@@ -70,6 +79,10 @@ def test_get_build_numbers_success(mocker):
     assert get_build_runs == BUILD_RUNS
 
 
+def test_run_number_is_unquoted():
+    assert Run(uri="/1.0%2Brc1", started="2025-09-05T19:55:09.593+0000").number == "1.0+rc1"
+
+
 @responses.activate
 def test_get_build_numbers_error(mocker):
     responses.add(
@@ -101,6 +114,103 @@ def test_get_build_info_success(mocker):
     assert get_build == BUILD_INFO
 
 
+@responses.activate
+def test_iter_build_artifacts():
+    artifacts = [
+        BuildArtifact(type="jar", sha1=f"sha1-{index}", sha256="sha256", md5="md5", name=f"{index}.jar", path="path")
+        for index in range(3)
+    ]
+    build_info = BuildInfo(
+        buildInfo=BuildInfoDetail(
+            name='build "name" [{',
+            modules=[BuildModules(id="a", artifacts=artifacts[:2]), BuildModules(id="b", artifacts=artifacts[2:])],
+        ),
+    )
+    responses.add(responses.GET, f"{URL}/api/build/build_name/abc", json=build_info.model_dump(), status=200)
+
+    artifactory_build = ArtifactoryBuild(AuthModel(url=URL, auth=AUTH))
+
+    assert list(artifactory_build.iter_build_artifacts("build_name", "abc", chunk_size=7)) == [
+        ("a", artifacts[0]),
+        ("a", artifacts[1]),
+        ("b", artifacts[2]),
+    ]
+
+
+@responses.activate
+def test_iter_build_artifacts_module_id_after_artifacts():
+    artifact = BuildArtifact(type="jar", sha1="sha1", sha256="sha256", md5="md5", name="a.jar", path="path")
+    modules = [{"artifacts": [artifact.model_dump()], "id": module_id} for module_id in ("a", "b")]
+    responses.add(responses.GET, f"{URL}/api/build/build_name/abc", json={"buildInfo": {"modules": modules}})
+
+    artifactory_build = ArtifactoryBuild(AuthModel(url=URL, auth=AUTH))
+
+    assert list(artifactory_build.iter_build_artifacts("build_name", "abc", chunk_size=5)) == [
+        ("a", artifact),
+        ("b", artifact),
+    ]
+
+
+@responses.activate
+def test_iter_build_artifacts_error():
+    responses.add(responses.GET, f"{URL}/api/build/build_name/abc", json=BUILD_NOT_FOUND_ERROR.model_dump(), status=404)
+
+    artifactory_build = ArtifactoryBuild(AuthModel(url=URL, auth=AUTH))
+    with pytest.raises(BuildNotFoundError):
+        list(artifactory_build.iter_build_artifacts("build_name", "abc"))
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+@responses.activate
+def test_get_build_infos_success(concurrency):
+    responses.add(responses.GET, f"{URL}/api/build/build_name", json=BUILD_RUNS.model_dump(), status=200)
+    for build_number in ("number", "other"):
+        responses.add(
+            responses.GET,
+            f"{URL}/api/build/build_name/{build_number}",
+            json=BuildInfo(uri=f"{URL}/api/build/build_name/{build_number}").model_dump(),
+            status=200,
+        )
+
+    artifactory_build = ArtifactoryBuild(AuthModel(url=URL, auth=AUTH))
+    build_infos = list(artifactory_build.get_build_infos("build_name", concurrency=concurrency))
+
+    assert sorted(build_info.uri for build_info in build_infos) == [
+        f"{URL}/api/build/build_name/number",
+        f"{URL}/api/build/build_name/other",
+    ]
+
+
+@responses.activate
+def test_get_build_infos_started_filter():
+    responses.add(responses.GET, f"{URL}/api/build/build_name", json=BUILD_RUNS.model_dump(), status=200)
+    responses.add(responses.GET, f"{URL}/api/build/build_name/other", json=BUILD_INFO.model_dump(), status=200)
+
+    artifactory_build = ArtifactoryBuild(AuthModel(url=URL, auth=AUTH))
+    build_infos = list(
+        artifactory_build.get_build_infos(
+            "build_name",
+            ["number", "other", "unknown"],
+            started_after=datetime(2025, 9, 5, 19, 55, 20, tzinfo=timezone.utc),
+        ),
+    )
+
+    assert build_infos == [BUILD_INFO]
+    assert [call.request.url for call in responses.calls] == [
+        f"{URL}/api/build/build_name",
+        f"{URL}/api/build/build_name/other",
+    ]
+
+
+@responses.activate
+def test_get_build_infos_error():
+    responses.add(responses.GET, f"{URL}/api/build/build_name/abc", json=BUILD_NOT_FOUND_ERROR.model_dump(), status=404)
+
+    artifactory_build = ArtifactoryBuild(AuthModel(url=URL, auth=AUTH))
+    with pytest.raises(BuildNotFoundError):
+        list(artifactory_build.get_build_infos("build_name", ["abc"], concurrency=4))
+
+
 @responses.activate
 @pytest.mark.parametrize(
     "build_num,properties_input,expected_query,raised_exc",
@@ -192,6 +302,76 @@ def test_promote_build_error_not_exist(mocker):
         artifactory_build.promote_build("build_name", "123", BUILD_PROMOTION_REQUEST)
 
 
+@pytest.mark.parametrize("dry_run_first", [False, True])
+@responses.activate
+def test_promote_builds_success(dry_run_first):
+    for build_number in ("1", "2"):
+        responses.add(
+            responses.POST,
+            f"{URL}/api/build/promote/build_name/{build_number}",
+            json=BuildPromotionResult(messages=[{"level": "info", "message": build_number}]).model_dump(),
+            status=200,
+        )
+
+    artifactory_build = ArtifactoryBuild(AuthModel(url=URL, auth=AUTH))
+    result = artifactory_build.promote_builds(
+        [("build_name", "1", BUILD_PROMOTION_REQUEST), ("build_name", "2", BUILD_PROMOTION_REQUEST)],
+        concurrency=2,
+        dry_run_first=dry_run_first,
+    )
+
+    assert sorted(message["message"] for message in result.messages) == ["1", "2"]
+    dry_runs = [json.loads(call.request.body)["dryRun"] for call in responses.calls]
+    assert sorted(dry_runs) == ([False, False, True, True] if dry_run_first else [False, False])
+    assert all(call.request.method == "POST" for call in responses.calls)
+
+
+@responses.activate
+def test_promote_builds_reports_each_promotion():
+    responses.add(
+        responses.POST,
+        f"{URL}/api/build/promote/build_name/1",
+        json=BuildPromotionResult(messages=[{"level": "info", "message": "1"}]).model_dump(),
+        status=200,
+    )
+    responses.add(
+        responses.POST,
+        f"{URL}/api/build/promote/build_name/2",
+        json=BUILD_NOT_FOUND_ERROR.model_dump(),
+        status=404,
+    )
+
+    artifactory_build = ArtifactoryBuild(AuthModel(url=URL, auth=AUTH))
+    report = artifactory_build.promote_builds(
+        [("build_name", "1", BUILD_PROMOTION_REQUEST), ("build_name", "2", BUILD_PROMOTION_REQUEST)],
+        concurrency=2,
+    )
+
+    assert [(result.build_number, result.promoted) for result in report.results] == [("1", True), ("2", False)]
+    assert report.messages == [{"level": "info", "message": "1"}]
+    assert [result.build_number for result in report.failed] == ["2"]
+    assert report.failed[0].error
+
+
+@responses.activate
+def test_promote_builds_dry_run_error():
+    responses.add(responses.POST, f"{URL}/api/build/promote/build_name/1", status=200, json={"messages": []})
+    responses.add(
+        responses.POST,
+        f"{URL}/api/build/promote/build_name/2",
+        json=BUILD_NOT_FOUND_ERROR.model_dump(),
+        status=404,
+    )
+
+    artifactory_build = ArtifactoryBuild(AuthModel(url=URL, auth=AUTH))
+    with pytest.raises(BuildNotFoundError):
+        artifactory_build.promote_builds(
+            [("build_name", "1", BUILD_PROMOTION_REQUEST), ("build_name", "2", BUILD_PROMOTION_REQUEST)],
+            dry_run_first=True,
+        )
+    assert all(json.loads(call.request.body)["dryRun"] for call in responses.calls)
+
+
 @responses.activate
 def test_list_build(mocker):
     responses.add(
@@ -211,13 +391,18 @@ def test_list_build(mocker):
 
 @responses.activate
 def test_delete_buildnumbers_success(mocker):
-    for _build_number in BUILD_DELETE_BUILDNUMBERS_REQUEST.buildNumbers:
-        responses.add(
-            responses.GET,
-            f"{URL}/api/build/{BUILD_DELETE_BUILDNUMBERS_REQUEST.buildName}/{_build_number}",
-            json=BUILD_INFO.model_dump(),
-            status=200,
-        )
+    responses.add(
+        responses.GET,
+        f"{URL}/api/build/{BUILD_DELETE_BUILDNUMBERS_REQUEST.buildName}",
+        json=BuildRuns(
+            uri=f"{URL}/api/build/{BUILD_DELETE_BUILDNUMBERS_REQUEST.buildName}",
+            buildsNumbers=[
+                Run(uri=f"/{build_number}", started="2025-09-05T19:55:09.593+0000")
+                for build_number in BUILD_DELETE_BUILDNUMBERS_REQUEST.buildNumbers
+            ],
+        ).model_dump(),
+        status=200,
+    )
 
     responses.add(
         responses.POST,
@@ -230,6 +415,34 @@ def test_delete_buildnumbers_success(mocker):
     mocker.spy(artifactory_build, "delete")
     artifactory_build.delete(BUILD_DELETE_BUILDNUMBERS_REQUEST)
 
+    assert len(responses.calls) == 2
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+@responses.activate
+def test_delete_buildnumbers_batches(concurrency):
+    delete_request = BuildDeleteRequest(buildName="build", buildNumbers=[str(number) for number in range(5)])
+    responses.add(responses.POST, f"{URL}/api/build/delete", status=200)
+
+    artifactory_build = ArtifactoryBuild(AuthModel(url=URL, auth=AUTH))
+    artifactory_build.delete(delete_request, validate=False, batch_size=2, concurrency=concurrency)
+
+    batches = sorted(json.loads(call.request.body)["buildNumbers"] for call in responses.calls)
+    assert batches == [["0", "1"], ["2", "3"], ["4"]]
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+@responses.activate
+def test_delete_and_apply_retention_batch_size_error(batch_size):
+    delete_request = BuildDeleteRequest(buildName="build", buildNumbers=["1"])
+    artifactory_build = ArtifactoryBuild(AuthModel(url=URL, auth=AUTH))
+
+    with pytest.raises(ValueError, match="batch_size"):
+        artifactory_build.delete(delete_request, validate=False, batch_size=batch_size)
+    with pytest.raises(ValueError, match="batch_size"):
+        artifactory_build.apply_retention(BuildRetentionPolicy(keep_last=1), batch_size=batch_size)
+    assert not responses.calls
+
 
 @responses.activate
 def test_delete_all_success(mocker):
@@ -247,14 +460,16 @@ def test_delete_all_success(mocker):
 def test_delete_build_error_not_exist(mocker):
     responses.add(
         responses.GET,
-        f"{URL}/api/build/{BUILD_DELETE_BUILDNUMBERS_REQUEST.buildName}/{BUILD_DELETE_BUILDNUMBERS_REQUEST.buildNumbers[0]}",
-        json=BUILD_INFO.model_dump(),
-        status=200,
-    )
-    responses.add(
-        responses.GET,
-        f"{URL}/api/build/{BUILD_DELETE_BUILDNUMBERS_REQUEST.buildName}/{BUILD_DELETE_BUILDNUMBERS_REQUEST.buildNumbers[-1]}",
-        body=NOT_FOUND_EXCEPTION_BODY,
+        f"{URL}/api/build/{BUILD_DELETE_BUILDNUMBERS_REQUEST.buildName}",
+        json=BuildRuns(
+            uri=f"{URL}/api/build/{BUILD_DELETE_BUILDNUMBERS_REQUEST.buildName}",
+            buildsNumbers=[
+                Run(
+                    uri=f"/{BUILD_DELETE_BUILDNUMBERS_REQUEST.buildNumbers[0]}",
+                    started="2025-09-05T19:55:09.593+0000",
+                ),
+            ],
+        ).model_dump(),
         status=200,
     )
 
@@ -262,6 +477,56 @@ def test_delete_build_error_not_exist(mocker):
     mocker.spy(artifactory_build, "delete")
     with pytest.raises(ArtifactoryError):
         artifactory_build.delete(BUILD_DELETE_BUILDNUMBERS_REQUEST)
+    assert len(responses.calls) == 1
+
+
+@pytest.mark.parametrize(
+    "policy,expired",
+    [
+        (BuildRetentionPolicy(keep_last=1), ["2", "1"]),
+        (BuildRetentionPolicy(max_age=timedelta(days=30)), ["1"]),
+        (BuildRetentionPolicy(keep_last=1, max_age=timedelta(days=15)), ["2", "1"]),
+        (BuildRetentionPolicy(keep_last=2, max_age=timedelta(days=30)), ["1"]),
+    ],
+)
+def test_build_retention_policy_expired_runs(policy, expired):
+    runs = [
+        Run(uri="/1", started="2025-01-01T00:00:00.000+0000"),
+        Run(uri="/3", started="2025-02-10T00:00:00.000+0000"),
+        Run(uri="/2", started="2025-01-20T00:00:00.000+0000"),
+    ]
+
+    expired_runs = policy.expired_runs(runs, datetime(2025, 2, 15, tzinfo=timezone.utc))
+
+    assert [run.number for run in expired_runs] == expired
+
+
+def test_build_retention_policy_error():
+    with pytest.raises(ValidationError):
+        BuildRetentionPolicy()
+
+
+@pytest.mark.parametrize("dry_run", [False, True])
+@responses.activate
+def test_apply_retention(dry_run):
+    build_list = BuildListResponse(
+        uri=f"{URL}/api/build",
+        builds=[
+            SimpleBuild(uri="/build_name", lastStarted="2025-09-05T19:55:28.040+0000"),
+            SimpleBuild(uri="/other_build", lastStarted="2025-09-05T19:55:28.040+0000"),
+        ],
+    )
+    responses.add(responses.GET, f"{URL}/api/build", json=build_list.model_dump(), status=200)
+    responses.add(responses.GET, f"{URL}/api/build/build_name", json=BUILD_RUNS.model_dump(), status=200)
+    responses.add(responses.POST, f"{URL}/api/build/delete", status=200)
+
+    artifactory_build = ArtifactoryBuild(AuthModel(url=URL, auth=AUTH))
+    plan = artifactory_build.apply_retention({"build_name": BuildRetentionPolicy(keep_last=1)}, dry_run=dry_run)
+
+    assert plan.deleted == {"build_name": ["number"]}
+    assert str(plan) == "- build_name #number"
+    deletions = [json.loads(call.request.body) for call in responses.calls if call.request.method == "POST"]
+    assert deletions == ([] if dry_run else [plan.requests[0].model_dump()])
 
 
 @responses.activate
@@ -296,10 +561,9 @@ def test_build_diff_success(mocker):
 @responses.activate
 def test_create_build_success(mocker):
     responses.add(
-        responses.GET,
+        responses.HEAD,
         f"{URL}/api/build/{BUILD_CREATE_REQUEST.name}/{BUILD_CREATE_REQUEST.number}",
-        body=NOT_FOUND_EXCEPTION_BODY,
-        status=200,
+        status=404,
     )
     responses.add(responses.PUT, f"{URL}/api/build", status=204)
 
@@ -311,9 +575,8 @@ def test_create_build_success(mocker):
 @responses.activate
 def test_create_build_error_already_exist(mocker):
     responses.add(
-        responses.GET,
+        responses.HEAD,
         f"{URL}/api/build/{BUILD_CREATE_REQUEST.name}/{BUILD_CREATE_REQUEST.number}",
-        json=BUILD_INFO.model_dump(),
         status=200,
     )
 
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import responses
+
+from pyartifactory import Artifactory
+from pyartifactory.models import BuildArtifact, BuildInfo, BuildInfoDetail, BuildModules, BuildRuns, Run
+from pyartifactory.models.build import Dependencies
+
+URL = "http://localhost:8080/artifactory"
+AUTH = ("user", "password_or_apiKey")
+
+
+def _build_info(number, artifacts, dependencies=(), properties=None):
+    module = BuildModules(
+        id="module",
+        artifacts=[
+            BuildArtifact(type="jar", sha1=sha1, sha256="sha256", md5="md5", name=name, path=f"path/{name}")
+            for name, sha1 in artifacts.items()
+        ],
+        dependencies=[Dependencies(id=dependency_id, sha1=sha1) for dependency_id, sha1 in dependencies],
+    )
+    return BuildInfo(
+        uri=f"{URL}/api/build/build_name/{number}",
+        buildInfo=BuildInfoDetail(name="build_name", number=number, properties=properties, modules=[module]),
+    )
+
+
+BUILD_INFOS = {
+    "1": _build_info("1", {"app.jar": "a1", "lib.jar": "l1"}, [("dep:1", "d1")], {"env": "dev"}),
+    "2": _build_info("2", {"app.jar": "a2", "lib.jar": "l1"}, [("dep:1", "d1")], {"env": "prod"}),
+    "3": _build_info("3", {"app.jar": "a3", "new.jar": "n1"}, [("dep:2", "d2")], {"env": "prod"}),
+}
+
+
+def _add_build_info_responses():
+    for number, build_info in BUILD_INFOS.items():
+        responses.add(responses.GET, f"{URL}/api/build/build_name/{number}", json=build_info.model_dump())
+
+
+@responses.activate
+def test_diff():
+    _add_build_info_responses()
+    cache = Artifactory(url=URL, auth=AUTH).build_info_cache()
+
+    diff = cache.diff("build_name", "3", "2")
+
+    assert diff.artifacts.new == ["new.jar"]
+    assert diff.artifacts.updated == ["app.jar"]
+    assert diff.artifacts.removed == ["lib.jar"]
+    assert diff.artifacts.unchanged == []
+    assert diff.dependencies.new == ["dep:2"]
+    assert diff.dependencies.removed == ["dep:1"]
+    assert diff.properties.unchanged == ["env"]
+
+
+@responses.activate
+def test_diff_many_reads_each_build_info_once():
+    _add_build_info_responses()
+    cache = Artifactory(url=URL, auth=AUTH).build_info_cache()
+
+    diffs = cache.diff_many("build_name", "3", ["2", "1"], concurrency=4)
+    cache.diff("build_name", "2", "1")
+
+    assert set(diffs) == {"2", "1"}
+    assert diffs["1"].properties.updated == ["env"]
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_history():
+    build_runs = BuildRuns(
+        uri=f"{URL}/api/build/build_name",
+        buildsNumbers=[
+            Run(uri="/1", started="2025-09-01T10:00:00.000+0000"),
+            Run(uri="/3", started="2025-09-03T10:00:00.000+0000"),
+            Run(uri="/2", started="2025-09-02T10:00:00.000+0000"),
+        ],
+    )
+    responses.add(responses.GET, f"{URL}/api/build/build_name", json=build_runs.model_dump())
+    _add_build_info_responses()
+    cache = Artifactory(url=URL, auth=AUTH).build_info_cache()
+
+    history = cache.history("build_name", last=2)
+
+    assert [build_number for build_number, _ in history] == ["3", "2"]
+    assert history[1][1].artifacts.unchanged == ["lib.jar"]
+
+
+@responses.activate
+def test_cache_eviction():
+    _add_build_info_responses()
+    cache = Artifactory(url=URL, auth=AUTH).build_info_cache(maxsize=1)
+
+    assert cache.get("build_name", "1") == BUILD_INFOS["1"]
+    cache.get("build_name", "2")
+    cache.get("build_name", "1")
+    cache.invalidate("build_name")
+    cache.get("build_name", "1")
+
+    assert len(responses.calls) == 4
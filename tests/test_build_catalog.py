@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+
+import responses
+
+from pyartifactory import Artifactory
+from pyartifactory.models import BuildListResponse, BuildRuns, Run, SimpleBuild
+
+URL = "http://localhost:8080/artifactory"
+AUTH = ("user", "password_or_apiKey")
+
+RUN_1 = Run(uri="/1", started="2025-09-01T10:00:00.000+0000")
+RUN_2 = Run(uri="/2", started="2025-09-02T10:00:00.000+0000")
+OTHER_RUN = Run(uri="/7", started="2025-08-01T10:00:00.000+0000")
+
+
+def _add_responses(builds, runs):
+    responses.add(
+        responses.GET,
+        f"{URL}/api/build",
+        json=BuildListResponse(
+            uri=f"{URL}/api/build",
+            builds=[SimpleBuild(uri=f"/{name}", lastStarted=last_started) for name, last_started in builds],
+        ).model_dump(),
+    )
+    for name, build_runs in runs.items():
+        responses.add(
+            responses.GET,
+            f"{URL}/api/build/{name}",
+            json=BuildRuns(uri=f"{URL}/api/build/{name}", buildsNumbers=build_runs).model_dump(),
+        )
+
+
+@responses.activate
+def test_poll_returns_new_runs():
+    _add_responses([("app", RUN_1.started), ("lib", OTHER_RUN.started)], {"app": [RUN_1], "lib": [OTHER_RUN]})
+    catalog = Artifactory(url=URL, auth=AUTH).build_catalog()
+
+    assert catalog.poll() == [("lib", OTHER_RUN), ("app", RUN_1)]
+    assert catalog.build_names == ["app", "lib"]
+
+    responses.reset()
+    _add_responses([("app", RUN_2.started), ("lib", OTHER_RUN.started)], {"app": [RUN_1, RUN_2]})
+
+    assert catalog.poll() == [("app", RUN_2)]
+    assert set(catalog.runs("app")) == {"1", "2"}
+    assert [call.request.url for call in responses.calls] == [f"{URL}/api/build", f"{URL}/api/build/app"]
+
+
+@responses.activate
+def test_poll_forgets_deleted_builds():
+    _add_responses([("app", RUN_1.started)], {"app": [RUN_1]})
+    catalog = Artifactory(url=URL, auth=AUTH).build_catalog()
+    catalog.poll()
+
+    responses.reset()
+    _add_responses([], {})
+
+    assert catalog.poll() == []
+    assert catalog.build_names == []
+    assert catalog.runs("app") == {}
+
+
+@responses.activate
+def test_poll_does_not_block_readers():
+    _add_responses([("app", RUN_1.started)], {"app": [RUN_1]})
+    catalog = Artifactory(url=URL, auth=AUTH).build_catalog()
+    catalog.poll()
+
+    responses.reset()
+    _add_responses([("app", RUN_2.started)], {})
+    release = threading.Event()
+
+    def build_runs(request):
+        release.wait(5)
+        return 200, {}, BuildRuns(uri=f"{URL}/api/build/app", buildsNumbers=[RUN_1, RUN_2]).model_dump_json()
+
+    responses.add_callback(responses.GET, f"{URL}/api/build/app", callback=build_runs)
+    poller = threading.Thread(target=catalog.poll)
+    poller.start()
+    reader = threading.Thread(target=lambda: (catalog.build_names, catalog.runs("app")))
+    reader.start()
+    reader.join(1)
+    assert not reader.is_alive()
+    assert set(catalog.runs("app")) == {"1"}
+
+    release.set()
+    poller.join(5)
+    assert set(catalog.runs("app")) == {"1", "2"}
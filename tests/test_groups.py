@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 import responses
 
@@ -16,24 +18,19 @@ PASSWORD = PasswordModel(password="test")  # noqa: S106
 
 @responses.activate
 def test_create_group_fail_if_group_already_exists(mocker):
-    responses.add(
-        responses.GET,
-        f"{URL}/api/security/groups/{NEW_GROUP.name}",
-        json=NEW_GROUP.model_dump(),
-        status=200,
-    )
+    responses.add(responses.HEAD, f"{URL}/api/security/groups/{NEW_GROUP.name}", status=200)
 
     artifactory_group = ArtifactoryGroup(AuthModel(url=URL, auth=AUTH))
-    mocker.spy(artifactory_group, "get")
+    mocker.spy(artifactory_group, "exists")
     with pytest.raises(GroupAlreadyExistsError):
         artifactory_group.create(NEW_GROUP)
 
-    artifactory_group.get.assert_called_once_with(NEW_GROUP.name)
+    artifactory_group.exists.assert_called_once_with(NEW_GROUP.name)
 
 
 @responses.activate
 def test_create_group_success(mocker):
-    responses.add(responses.GET, f"{URL}/api/security/groups/{NEW_GROUP.name}", status=404)
+    responses.add(responses.HEAD, f"{URL}/api/security/groups/{NEW_GROUP.name}", status=404)
     responses.add(
         responses.PUT,
         f"{URL}/api/security/groups/{NEW_GROUP.name}",
@@ -52,7 +49,7 @@ def test_create_group_success(mocker):
     group: Group = artifactory_group.create(NEW_GROUP)
 
     artifactory_group.get.assert_called_with(NEW_GROUP.name)
-    assert artifactory_group.get.call_count == 2
+    assert artifactory_group.get.call_count == 1
     assert group.model_dump() == NEW_GROUP.model_dump()
 
 
@@ -160,3 +157,69 @@ def test_delete_group_success(mocker):
     artifactory_group.delete(NEW_GROUP.name)
 
     artifactory_group.get.assert_called_once_with(NEW_GROUP.name)
+
+
+def _add_groups_for_sync():
+    responses.add(
+        responses.GET,
+        f"{URL}/api/security/groups/developers?includeUsers=True",
+        json=Group(name="developers", userNames=["alice", "bob"]).model_dump(),
+    )
+    responses.add(
+        responses.GET,
+        f"{URL}/api/security/groups/readers?includeUsers=True",
+        json=Group(name="readers", userNames=["carol"]).model_dump(),
+    )
+
+
+@responses.activate
+def test_sync_group_members():
+    _add_groups_for_sync()
+    responses.add(responses.POST, f"{URL}/api/security/groups/developers", status=200)
+
+    artifactory_group = ArtifactoryGroup(AuthModel(url=URL, auth=AUTH))
+    changes = artifactory_group.sync_members({"developers": ["bob", "dave"], "readers": ["carol"]}, concurrency=2)
+
+    assert [(change.name, change.added, change.removed, change.changed) for change in changes] == [
+        ("developers", ["dave"], ["alice"], True),
+        ("readers", [], [], False),
+    ]
+    writes = [call for call in responses.calls if call.request.method == "POST"]
+    assert len(writes) == 1
+    assert json.loads(writes[0].request.body) == {"name": "developers", "userNames": ["bob", "dave"]}
+
+
+@responses.activate
+def test_sync_group_members_name_casing():
+    responses.add(
+        responses.GET,
+        f"{URL}/api/security/groups/developers?includeUsers=True",
+        json=Group(name="Developers", userNames=["alice"]).model_dump(),
+    )
+
+    artifactory_group = ArtifactoryGroup(AuthModel(url=URL, auth=AUTH))
+    changes = artifactory_group.sync_members({"developers": ["alice", "bob"]}, dry_run=True)
+
+    assert [(change.name, change.added) for change in changes] == [("developers", ["bob"])]
+
+
+@responses.activate
+def test_sync_group_members_dry_run():
+    _add_groups_for_sync()
+
+    artifactory_group = ArtifactoryGroup(AuthModel(url=URL, auth=AUTH))
+    changes = artifactory_group.sync_members({"developers": [], "readers": ["carol"]}, dry_run=True)
+
+    assert changes[0].removed == ["alice", "bob"]
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_sync_group_members_fail_if_group_not_found():
+    _add_groups_for_sync()
+    responses.add(responses.GET, f"{URL}/api/security/groups/unknown?includeUsers=True", status=404)
+
+    artifactory_group = ArtifactoryGroup(AuthModel(url=URL, auth=AUTH))
+    with pytest.raises(GroupNotFoundError):
+        artifactory_group.sync_members({"developers": ["bob"], "unknown": ["dave"]})
+    assert all(call.request.method == "GET" for call in responses.calls)
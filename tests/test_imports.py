@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import pyartifactory
+from pyartifactory import models
+
+
+def _loaded_modules(statement: str) -> set:
+    script = f"import sys\n{statement}\nprint(' '.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", script],  # noqa: S603
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return set(output.split())
+
+
+def test_import_does_not_load_objects_nor_models():
+    loaded_modules = _loaded_modules("import pyartifactory")
+
+    assert "pyartifactory.objects.artifactory" not in loaded_modules
+    assert "pyartifactory.models.repository" not in loaded_modules
+    assert "pyartifactory.models.build" not in loaded_modules
+
+
+def test_sub_client_only_loads_its_own_models():
+    loaded_modules = _loaded_modules(
+        "from pyartifactory import Artifactory\nArtifactory(url='http://localhost').artifacts",
+    )
+
+    assert "pyartifactory.objects.artifact" in loaded_modules
+    assert "pyartifactory.models.repository" not in loaded_modules
+    assert "pyartifactory.models.build" not in loaded_modules
+
+
+@pytest.mark.parametrize("module", [pyartifactory, models])
+def test_lazy_attributes(module):
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+    assert set(module.__all__) <= set(dir(module))
+    with pytest.raises(AttributeError):
+        module.DoesNotExist  # noqa: B018
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import pytest
+import requests
+import responses
+
+from pyartifactory import ArtifactoryUser, InMemoryMetricsCollector, RequestMetric
+from pyartifactory.exception import UserNotFoundError
+from pyartifactory.metrics import route_template
+from pyartifactory.models import AuthModel, UserResponse
+
+URL = "http://localhost:8080/artifactory"
+AUTH = ("user", "password_or_apiKey")
+USER = UserResponse(name="test_user", email="test.test@test.com")
+
+
+@pytest.mark.parametrize(
+    "route,template",
+    [
+        ("api/storage/my-repo/a/b.txt", "api/storage/{path}"),
+        ("api/storage/my-repo/a?list", "api/storage/{path}?list"),
+        ("api/security/users/test_user", "api/security/users/{name}"),
+        ("api/security/users", "api/security/users"),
+        ("api/build", "api/build"),
+        ("api/build/delete", "api/build/delete"),
+        ("api/build/my-build/12?diff=11", "api/build/{name}/{number}?diff"),
+        ("api/build/promote/my-build/12", "api/build/promote/{name}/{number}"),
+        ("api/copy/my-repo/a.txt?to=other/a.txt&dry=0", "api/copy/{path}?to&dry"),
+        ("my-repo/a/b.txt;retention=30", "{repo}/{path}"),
+    ],
+)
+def test_route_template(route, template):
+    assert route_template(route) == template
+
+
+def test_collector_aggregates_per_endpoint():
+    collector = InMemoryMetricsCollector(buckets=(0.1, 1.0))
+    collector(RequestMetric(method="GET", route="api/build", duration=0.05, status_code=200, bytes_received=10))
+    collector(RequestMetric(method="GET", route="api/build", duration=0.5, status_code=404, bytes_received=5))
+    collector(RequestMetric(method="GET", route="api/build", duration=2.0, error="ConnectionError"))
+
+    [stats] = collector.snapshot()
+    assert stats.count == 3
+    assert stats.bucket_counts == [1, 2]
+    assert stats.status_counts == {"200": 1, "404": 1, "error": 1}
+    assert stats.bytes_received == 15
+    assert stats.errors == 1
+
+    collector.reset()
+    assert collector.snapshot() == []
+
+
+def test_collector_prometheus_export():
+    collector = InMemoryMetricsCollector(buckets=(0.1,))
+    collector(RequestMetric(method="PUT", route='{repo}/"path"', duration=0.05, status_code=201, bytes_sent=42))
+
+    text = collector.to_prometheus()
+    labels = 'method="PUT",route="{repo}/\\"path\\""'
+    assert "# TYPE pyartifactory_request_duration_seconds histogram" in text
+    assert f'pyartifactory_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+    assert f'pyartifactory_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert f"pyartifactory_request_duration_seconds_count{{{labels}}} 1" in text
+    assert f'pyartifactory_requests_total{{{labels},status="201"}} 1' in text
+    assert f"pyartifactory_request_bytes_sent_total{{{labels}}} 42" in text
+
+
+@responses.activate
+def test_metrics_callback_called_for_each_request():
+    responses.add(responses.GET, f"{URL}/api/security/users/{USER.name}", json=USER.model_dump(), status=200)
+    responses.add(responses.GET, f"{URL}/api/security/users/unknown", status=404)
+    recorded = []
+
+    artifactory_user = ArtifactoryUser(AuthModel(url=URL, auth=AUTH, metrics_callbacks=[recorded.append]))
+    artifactory_user.get(USER.name)
+    with pytest.raises(UserNotFoundError):
+        artifactory_user.get("unknown")
+
+    assert [(metric.method, metric.route, metric.status_code) for metric in recorded] == [
+        ("GET", "api/security/users/{name}", 200),
+        ("GET", "api/security/users/{name}", 404),
+    ]
+    assert recorded[0].bytes_received == len(responses.calls[0].response.content)
+    assert recorded[0].duration >= 0
+
+
+@responses.activate
+def test_metrics_recorded_on_connection_error():
+    responses.add(
+        responses.GET,
+        f"{URL}/api/security/users",
+        body=requests.exceptions.ConnectionError("refused"),
+    )
+    collector = InMemoryMetricsCollector()
+
+    artifactory_user = ArtifactoryUser(AuthModel(url=URL, auth=AUTH, metrics_callbacks=[collector]))
+    with pytest.raises(requests.exceptions.ConnectionError):
+        artifactory_user.list()
+
+    [stats] = collector.snapshot()
+    assert stats.status_counts == {"error": 1}
+    assert stats.errors == 1
+
+
+@responses.activate
+def test_failing_metrics_callback_does_not_break_request():
+    responses.add(responses.GET, f"{URL}/api/security/users/{USER.name}", json=USER.model_dump(), status=200)
+
+    def broken_callback(metric):
+        raise RuntimeError("broken")
+
+    artifactory_user = ArtifactoryUser(AuthModel(url=URL, auth=AUTH, metrics_callbacks=[broken_callback]))
+    assert artifactory_user.get(USER.name).name == USER.name
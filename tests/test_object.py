@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from pyartifactory import ArtifactoryArtifact
-from pyartifactory.models import AuthModel
+import pytest
+import responses
+
+from pyartifactory import ArtifactoryArtifact, ArtifactoryRepository, ArtifactoryUser
+from pyartifactory.exception import ArtifactoryError
+from pyartifactory.models import AuthModel, LocalRepository, SimpleUser, UserResponse
+from pyartifactory.utils import get_json_loads
 
 URL = "http://localhost:8080/artifactory"
 AUTH = ("user", "password_or_apiKey")
 ARTIFACT_REPO = "my_repository"
+SIMPLE_USER = SimpleUser(name="test_user", uri="https://some.uri")
+USER = UserResponse(name="test_user", email="test.test@test.com")
+LOCAL_REPOSITORY = LocalRepository(key="test_local_repository")
 
 
 # Test that timeout is used by requests
@@ -16,3 +24,73 @@ def test_get_artifact_folder_info_timeout(mocker):
     artifactory.session.return_value = mocker.MagicMock()
     artifactory.info("ARTIFACT_REPO")
     assert artifactory.session.get.call_args_list[0][1]["timeout"] == 1
+
+
+@pytest.mark.parametrize("trusted_responses", [False, True])
+@responses.activate
+def test_parse_responses(trusted_responses):
+    responses.add(responses.GET, f"{URL}/api/security/users", json=[SIMPLE_USER.model_dump()], status=200)
+    responses.add(responses.GET, f"{URL}/api/security/users/{USER.name}", json=USER.model_dump(), status=200)
+
+    artifactory_user = ArtifactoryUser(AuthModel(url=URL, auth=AUTH, trusted_responses=trusted_responses))
+
+    assert artifactory_user.list() == [SIMPLE_USER]
+    assert artifactory_user.get(USER.name) == USER
+
+
+@responses.activate
+def test_trusted_responses_skip_json_decoding(mocker):
+    responses.add(responses.GET, f"{URL}/api/security/users/{USER.name}", json=USER.model_dump(), status=200)
+    json_decoding = mocker.patch("requests.Response.json")
+
+    artifactory_user = ArtifactoryUser(AuthModel(url=URL, auth=AUTH, trusted_responses=True))
+
+    assert artifactory_user.get(USER.name) == USER
+    json_decoding.assert_not_called()
+
+
+@pytest.mark.parametrize("json_backend", ["orjson", "msgspec"])
+@responses.activate
+def test_json_backend(json_backend):
+    pytest.importorskip(json_backend)
+    responses.add(responses.GET, f"{URL}/api/security/users", json=[SIMPLE_USER.model_dump()], status=200)
+    responses.add(
+        responses.GET,
+        f"{URL}/api/repositories/{LOCAL_REPOSITORY.key}",
+        json=LOCAL_REPOSITORY.model_dump(mode="json"),
+        status=200,
+    )
+    auth_model = AuthModel(url=URL, auth=AUTH, json_backend=json_backend)
+
+    assert ArtifactoryUser(auth_model).list() == [SIMPLE_USER]
+    assert ArtifactoryRepository(auth_model).get_repo(LOCAL_REPOSITORY.key).key == LOCAL_REPOSITORY.key
+
+
+def test_unknown_json_backend():
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        get_json_loads("simplejson")
+
+
+@pytest.mark.parametrize("status,exists", [(200, True), (404, False), (400, False)])
+@responses.activate
+def test_exists(status, exists):
+    responses.add(responses.HEAD, f"{URL}/api/security/users/{USER.name}", status=status)
+
+    assert ArtifactoryUser(AuthModel(url=URL, auth=AUTH)).exists(USER.name) is exists
+    assert [call.request.method for call in responses.calls] == ["HEAD"]
+
+
+@responses.activate
+def test_exists_falls_back_to_get():
+    responses.add(responses.HEAD, f"{URL}/api/security/users/{USER.name}", status=405)
+    responses.add(responses.GET, f"{URL}/api/security/users/{USER.name}", json=USER.model_dump(), status=200)
+
+    assert ArtifactoryUser(AuthModel(url=URL, auth=AUTH)).exists(USER.name)
+
+
+@responses.activate
+def test_exists_error():
+    responses.add(responses.HEAD, f"{URL}/api/security/users/{USER.name}", status=500)
+
+    with pytest.raises(ArtifactoryError):
+        ArtifactoryUser(AuthModel(url=URL, auth=AUTH)).exists(USER.name)
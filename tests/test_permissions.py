@@ -66,18 +66,13 @@ PERMISSIONV2 = PermissionV2(
 )
 @responses.activate
 def test_create_permission_fail_if_group_already_exists(mocker, api_version, permission, api_uri):
-    responses.add(
-        responses.GET,
-        f"{URL}/{api_uri}/{permission.name}",
-        json=permission.model_dump(),
-        status=200,
-    )
+    responses.add(responses.HEAD, f"{URL}/{api_uri}/{permission.name}", status=200)
 
     artifactory_permission = ArtifactoryPermission(AuthModel(url=URL, auth=AUTH, api_version=api_version))
-    mocker.spy(artifactory_permission, "get")
+    mocker.spy(artifactory_permission, "exists")
     with pytest.raises(PermissionAlreadyExistsError):
         artifactory_permission.create(permission)
-    artifactory_permission.get.assert_called_once_with(permission.name)
+    artifactory_permission.exists.assert_called_once_with(permission.name)
 
 
 @pytest.mark.parametrize(
@@ -86,7 +81,7 @@ def test_create_permission_fail_if_group_already_exists(mocker, api_version, per
 )
 @responses.activate
 def test_create_permission_success(mocker, api_version, permission, api_uri):
-    responses.add(responses.GET, f"{URL}/{api_uri}/{permission.name}", status=404)
+    responses.add(responses.HEAD, f"{URL}/{api_uri}/{permission.name}", status=404)
     responses.add(
         responses.PUT,
         f"{URL}/{api_uri}/{permission.name}",
@@ -106,7 +101,7 @@ def test_create_permission_success(mocker, api_version, permission, api_uri):
     artifactory_permission.get.assert_called_with(permission.name)
     assert mocked_permission.model_dump() == permission.model_dump()
 
-    assert artifactory_permission.get.call_count == 2
+    assert artifactory_permission.get.call_count == 1
 
 
 @pytest.mark.parametrize(
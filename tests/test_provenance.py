@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import responses
+
+from pyartifactory import Artifactory
+from pyartifactory.models import (
+    BuildArtifact,
+    BuildInfo,
+    BuildInfoDetail,
+    BuildListResponse,
+    BuildModules,
+    BuildProvenance,
+    BuildRuns,
+    Run,
+    SimpleBuild,
+)
+
+URL = "http://localhost:8080/artifactory"
+AUTH = ("user", "password_or_apiKey")
+
+BUILD_LIST = BuildListResponse(
+    uri=f"{URL}/api/build",
+    builds=[SimpleBuild(uri="/build_name", lastStarted="2025-09-02T10:00:00.000+0000")],
+)
+RUN_1 = Run(uri="/1", started="2025-09-01T10:00:00.000+0000")
+RUN_2 = Run(uri="/2", started="2025-09-02T10:00:00.000+0000")
+
+
+def _build_info(number, sha1):
+    module = BuildModules(
+        id="org:app:1.0",
+        artifacts=[BuildArtifact(type="jar", sha1=sha1, sha256=f"{sha1}-256", md5="md5", name="app.jar", path="app")],
+    )
+    return BuildInfo(buildInfo=BuildInfoDetail(name="build_name", number=number, modules=[module]))
+
+
+def _add_responses(runs):
+    responses.add(responses.GET, f"{URL}/api/build", json=BUILD_LIST.model_dump())
+    responses.add(
+        responses.GET,
+        f"{URL}/api/build/build_name",
+        json=BuildRuns(uri=f"{URL}/api/build/build_name", buildsNumbers=runs).model_dump(),
+    )
+
+
+@responses.activate
+def test_provenance_lookup(tmp_path):
+    _add_responses([RUN_1, RUN_2])
+    responses.add(responses.GET, f"{URL}/api/build/build_name/1", json=_build_info("1", "AAA").model_dump())
+    responses.add(responses.GET, f"{URL}/api/build/build_name/2", json=_build_info("2", "bbb").model_dump())
+
+    with Artifactory(url=URL, auth=AUTH).provenance_index(str(tmp_path / "provenance.db")) as index:
+        assert index.sync(concurrency=2) == 2
+
+        assert index.lookup("aaa") == [
+            BuildProvenance(build_name="build_name", build_number="1", module_id="org:app:1.0"),
+        ]
+        assert index.lookup("bbb-256") == [
+            BuildProvenance(build_name="build_name", build_number="2", module_id="org:app:1.0"),
+        ]
+        assert index.lookup("ccc") == []
+
+
+@responses.activate
+def test_provenance_sync_is_incremental(tmp_path):
+    path = str(tmp_path / "provenance.db")
+    _add_responses([RUN_1])
+    responses.add(responses.GET, f"{URL}/api/build/build_name/1", json=_build_info("1", "aaa").model_dump())
+    with Artifactory(url=URL, auth=AUTH).provenance_index(path) as index:
+        index.sync()
+
+    responses.reset()
+    _add_responses([RUN_1, RUN_2])
+    responses.add(responses.GET, f"{URL}/api/build/build_name/2", json=_build_info("2", "bbb").model_dump())
+    with Artifactory(url=URL, auth=AUTH).provenance_index(path) as index:
+        assert index.sync(["build_name"]) == 1
+        assert [provenance.build_number for provenance in index.lookup("aaa")] == ["1"]
+        assert [provenance.build_number for provenance in index.lookup("bbb")] == ["2"]
+
+    assert [call.request.url for call in responses.calls] == [
+        f"{URL}/api/build/build_name",
+        f"{URL}/api/build/build_name/2",
+    ]
+
+
+@responses.activate
+def test_provenance_sync_indexes_runs_published_late(tmp_path):
+    path = str(tmp_path / "provenance.db")
+    _add_responses([RUN_2])
+    responses.add(responses.GET, f"{URL}/api/build/build_name/2", json=_build_info("2", "bbb").model_dump())
+    with Artifactory(url=URL, auth=AUTH).provenance_index(path) as index:
+        index.sync(["build_name"])
+
+    responses.reset()
+    _add_responses([RUN_1, RUN_2])
+    responses.add(responses.GET, f"{URL}/api/build/build_name/1", json=_build_info("1", "aaa").model_dump())
+    with Artifactory(url=URL, auth=AUTH).provenance_index(path) as index:
+        assert index.sync(["build_name"]) == 1
+        assert [provenance.build_number for provenance in index.lookup("aaa")] == ["1"]
+
+    assert [call.request.url for call in responses.calls] == [
+        f"{URL}/api/build/build_name",
+        f"{URL}/api/build/build_name/1",
+    ]
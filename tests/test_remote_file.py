@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import io
+import os
+import re
+import zipfile
+
+import pytest
+import responses
+
+from pyartifactory import ArtifactoryArtifact
+from pyartifactory.exception import ArtifactNotFoundError, ArtifactoryError
+from pyartifactory.models import AuthModel
+
+URL = "http://localhost:8080/artifactory"
+AUTH = ("user", "password_or_apiKey")
+ARTIFACT_PATH = "my_repository/archive.zip"
+
+
+def _zip_content():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("small.txt", b"small member")
+        archive.writestr("large.bin", os.urandom(200_000))
+    return buffer.getvalue()
+
+
+def _add_responses(content, range_supported=True, size=None):
+    responses.add(
+        responses.GET,
+        f"{URL}/api/storage/{ARTIFACT_PATH}",
+        json={"repo": "my_repository", "path": "/archive.zip", "size": size or len(content), "uri": "uri"},
+    )
+    sent = []
+
+    def callback(request):
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", request.headers.get("Range", ""))
+        if not range_supported or match is None:
+            sent.append(len(content))
+            return 200, {}, content
+        start, end = int(match.group(1)), min(int(match.group(2)), len(content) - 1)
+        sent.append(end + 1 - start)
+        return 206, {"Content-Range": f"bytes {start}-{end}/{len(content)}"}, content[start : end + 1]
+
+    responses.add_callback(responses.GET, f"{URL}/{ARTIFACT_PATH}", callback=callback)
+    return sent
+
+
+@responses.activate
+def test_open_zip_member_with_range_requests():
+    content = _zip_content()
+    sent = _add_responses(content)
+
+    artifactory = ArtifactoryArtifact(AuthModel(url=URL, auth=AUTH))
+    with artifactory.open(ARTIFACT_PATH, block_size=1024, read_ahead=2) as remote_file:
+        assert remote_file.size == len(content)
+        with zipfile.ZipFile(remote_file) as archive:
+            assert archive.namelist() == ["small.txt", "large.bin"]
+            assert archive.read("small.txt") == b"small member"
+
+    assert sum(sent) < len(content) / 10
+
+
+@pytest.mark.parametrize("range_supported", [True, False])
+@responses.activate
+def test_open_seek_and_read(range_supported):
+    content = bytes(range(256)) * 40
+    _add_responses(content, range_supported)
+
+    remote_file = ArtifactoryArtifact(AuthModel(url=URL, auth=AUTH)).open(ARTIFACT_PATH, block_size=100)
+
+    assert remote_file.read(10) == content[:10]
+    assert remote_file.seek(-5, io.SEEK_END) == len(content) - 5
+    assert remote_file.read() == content[-5:]
+    assert remote_file.read(10) == b""
+    remote_file.seek(950)
+    assert remote_file.read(300) == content[950:1250]
+    assert remote_file.tell() == 1250
+
+
+@pytest.mark.parametrize("range_supported", [True, False])
+@responses.activate
+def test_open_read_truncated_artifact_error(range_supported):
+    _add_responses(bytes(500), range_supported, size=1000)
+
+    remote_file = ArtifactoryArtifact(AuthModel(url=URL, auth=AUTH)).open(ARTIFACT_PATH, block_size=100)
+
+    with pytest.raises(ArtifactoryError):
+        remote_file.read()
+
+
+@responses.activate
+def test_open_without_range_support_reads_once():
+    content = bytes(range(256)) * 40
+    sent = _add_responses(content, range_supported=False)
+
+    remote_file = ArtifactoryArtifact(AuthModel(url=URL, auth=AUTH)).open(ARTIFACT_PATH, block_size=100)
+
+    assert remote_file.read(500) == content[:500]
+    remote_file.seek(5000)
+    assert remote_file.read(300) == content[5000:5300]
+    remote_file.seek(0)
+    assert remote_file.read() == content
+    assert sent == [len(content)]
+
+
+@responses.activate
+def test_open_read_content_range_mismatch_error():
+    responses.add(
+        responses.GET,
+        f"{URL}/api/storage/{ARTIFACT_PATH}",
+        json={"repo": "my_repository", "path": "/archive.zip", "size": 1000, "uri": "uri"},
+    )
+    responses.add(
+        responses.GET,
+        f"{URL}/{ARTIFACT_PATH}",
+        status=206,
+        headers={"Content-Range": "bytes 0-99/1200"},
+        body=bytes(100),
+    )
+
+    remote_file = ArtifactoryArtifact(AuthModel(url=URL, auth=AUTH)).open(ARTIFACT_PATH, block_size=100, read_ahead=0)
+
+    with pytest.raises(ArtifactoryError):
+        remote_file.read(10)
+
+
+@responses.activate
+def test_read_range():
+    content = bytes(range(256))
+    _add_responses(content)
+
+    response = ArtifactoryArtifact(AuthModel(url=URL, auth=AUTH)).read_range(ARTIFACT_PATH, 10, 20)
+
+    assert response.status_code == 206
+    assert response.content == content[10:20]
+
+
+@responses.activate
+def test_read_range_not_found_error():
+    responses.add(responses.GET, f"{URL}/{ARTIFACT_PATH}", status=404)
+
+    with pytest.raises(ArtifactNotFoundError):
+        ArtifactoryArtifact(AuthModel(url=URL, auth=AUTH)).read_range(ARTIFACT_PATH, 0, 10)
+
+
+@responses.activate
+def test_open_folder_error():
+    responses.add(
+        responses.GET,
+        f"{URL}/api/storage/my_repository",
+        json={"repo": "my_repository", "path": "/", "uri": "uri", "children": []},
+    )
+
+    with pytest.raises(ArtifactoryError):
+        ArtifactoryArtifact(AuthModel(url=URL, auth=AUTH)).open("my_repository")
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 import requests
 import responses
+from pydantic import SecretStr
 
 from pyartifactory import ArtifactoryRepository
-from pyartifactory.exception import RepositoryAlreadyExistsError, RepositoryNotFoundError
+from pyartifactory.exception import ArtifactoryError, RepositoryAlreadyExistsError, RepositoryNotFoundError
 from pyartifactory.models import (
     AuthModel,
     FederatedRepository,
@@ -14,6 +17,7 @@ from pyartifactory.models import (
     LocalRepositoryResponse,
     RemoteRepository,
     RemoteRepositoryResponse,
+    RepositoryAction,
     SimpleRepository,
     VirtualRepository,
     VirtualRepositoryResponse,
@@ -72,81 +76,61 @@ UPDATED_FEDERATED_REPOSITORY_RESPONSE = FederatedRepositoryResponse(
 def test_create_local_repository_fail_if_repository_already_exists(
     mocker,
 ):
-    responses.add(
-        responses.GET,
-        f"{URL}/api/repositories/{LOCAL_REPOSITORY.key}",
-        json=LOCAL_REPOSITORY_RESPONSE.model_dump(),
-        status=200,
-    )
+    responses.add(responses.HEAD, f"{URL}/api/repositories/{LOCAL_REPOSITORY.key}", status=200)
 
     artifactory_repo = ArtifactoryRepository(AuthModel(url=URL, auth=AUTH))
-    mocker.spy(artifactory_repo, "get_repo")
+    mocker.spy(artifactory_repo, "exists")
     with pytest.raises(RepositoryAlreadyExistsError):
         artifactory_repo.create_repo(LOCAL_REPOSITORY)
 
-    artifactory_repo.get_repo.assert_called_once_with(LOCAL_REPOSITORY.key)
+    artifactory_repo.exists.assert_called_once_with(LOCAL_REPOSITORY.key)
 
 
 @responses.activate
 def test_create_virtual_repository_fail_if_repository_already_exists(
     mocker,
 ):
-    responses.add(
-        responses.GET,
-        f"{URL}/api/repositories/{VIRTUAL_REPOSITORY.key}",
-        json=VIRTUAL_REPOSITORY_RESPONSE.model_dump(),
-        status=200,
-    )
+    responses.add(responses.HEAD, f"{URL}/api/repositories/{VIRTUAL_REPOSITORY.key}", status=200)
 
     artifactory_repo = ArtifactoryRepository(AuthModel(url=URL, auth=AUTH))
-    mocker.spy(artifactory_repo, "get_repo")
+    mocker.spy(artifactory_repo, "exists")
     with pytest.raises(RepositoryAlreadyExistsError):
         artifactory_repo.create_repo(VIRTUAL_REPOSITORY)
 
-    artifactory_repo.get_repo.assert_called_once_with(VIRTUAL_REPOSITORY.key)
+    artifactory_repo.exists.assert_called_once_with(VIRTUAL_REPOSITORY.key)
 
 
 @responses.activate
 def test_create_remote_repository_fail_if_repository_already_exists(
     mocker,
 ):
-    responses.add(
-        responses.GET,
-        f"{URL}/api/repositories/{REMOTE_REPOSITORY.key}",
-        json=REMOTE_REPOSITORY_RESPONSE.model_dump(),
-        status=200,
-    )
+    responses.add(responses.HEAD, f"{URL}/api/repositories/{REMOTE_REPOSITORY.key}", status=200)
 
     artifactory_repo = ArtifactoryRepository(AuthModel(url=URL, auth=AUTH))
-    mocker.spy(artifactory_repo, "get_repo")
+    mocker.spy(artifactory_repo, "exists")
     with pytest.raises(RepositoryAlreadyExistsError):
         artifactory_repo.create_repo(REMOTE_REPOSITORY)
 
-    artifactory_repo.get_repo.assert_called_once_with(REMOTE_REPOSITORY.key)
+    artifactory_repo.exists.assert_called_once_with(REMOTE_REPOSITORY.key)
 
 
 @responses.activate
 def test_create_federated_repository_fail_if_repository_already_exists(
     mocker,
 ):
-    responses.add(
-        responses.GET,
-        f"{URL}/api/repositories/{FEDERATED_REPOSITORY.key}",
-        json=FEDERATED_REPOSITORY_RESPONSE.model_dump(),
-        status=200,
-    )
+    responses.add(responses.HEAD, f"{URL}/api/repositories/{FEDERATED_REPOSITORY.key}", status=200)
 
     artifactory_repo = ArtifactoryRepository(AuthModel(url=URL, auth=AUTH))
-    mocker.spy(artifactory_repo, "get_repo")
+    mocker.spy(artifactory_repo, "exists")
     with pytest.raises(RepositoryAlreadyExistsError):
         artifactory_repo.create_repo(FEDERATED_REPOSITORY)
 
-    artifactory_repo.get_repo.assert_called_once_with(FEDERATED_REPOSITORY.key)
+    artifactory_repo.exists.assert_called_once_with(FEDERATED_REPOSITORY.key)
 
 
 @responses.activate
 def test_create_local_repository_success(mocker):
-    responses.add(responses.GET, f"{URL}/api/repositories/{LOCAL_REPOSITORY.key}", status=404)
+    responses.add(responses.HEAD, f"{URL}/api/repositories/{LOCAL_REPOSITORY.key}", status=404)
     responses.add(
         responses.PUT,
         f"{URL}/api/repositories/{LOCAL_REPOSITORY.key}",
@@ -170,7 +154,7 @@ def test_create_local_repository_success(mocker):
 
 @responses.activate
 def test_create_virtual_repository_repo_success(mocker):
-    responses.add(responses.GET, f"{URL}/api/repositories/{VIRTUAL_REPOSITORY.key}", status=404)
+    responses.add(responses.HEAD, f"{URL}/api/repositories/{VIRTUAL_REPOSITORY.key}", status=404)
     responses.add(
         responses.PUT,
         f"{URL}/api/repositories/{VIRTUAL_REPOSITORY.key}",
@@ -193,7 +177,7 @@ def test_create_virtual_repository_repo_success(mocker):
 
 @responses.activate
 def test_create_remote_repository_success(mocker):
-    responses.add(responses.GET, f"{URL}/api/repositories/{REMOTE_REPOSITORY.key}", status=404)
+    responses.add(responses.HEAD, f"{URL}/api/repositories/{REMOTE_REPOSITORY.key}", status=404)
     responses.add(
         responses.PUT,
         f"{URL}/api/repositories/{REMOTE_REPOSITORY.key}",
@@ -216,7 +200,7 @@ def test_create_remote_repository_success(mocker):
 
 @responses.activate
 def test_create_federated_repository_success(mocker):
-    responses.add(responses.GET, f"{URL}/api/repositories/{FEDERATED_REPOSITORY.key}", status=404)
+    responses.add(responses.HEAD, f"{URL}/api/repositories/{FEDERATED_REPOSITORY.key}", status=404)
     responses.add(
         responses.PUT,
         f"{URL}/api/repositories/{FEDERATED_REPOSITORY.key}",
@@ -307,6 +291,44 @@ def test_get_federated_repository_success():
     assert remote_repo == FEDERATED_REPOSITORY_RESPONSE
 
 
+@pytest.mark.parametrize(
+    "repository_response",
+    [
+        LOCAL_REPOSITORY_RESPONSE,
+        VIRTUAL_REPOSITORY_RESPONSE,
+        REMOTE_REPOSITORY_RESPONSE,
+        FEDERATED_REPOSITORY_RESPONSE,
+    ],
+)
+@responses.activate
+def test_get_repository_trusted_responses_success(repository_response):
+    responses.add(
+        responses.GET,
+        f"{URL}/api/repositories/{repository_response.key}",
+        json=repository_response.model_dump(mode="json"),
+        status=200,
+    )
+
+    artifactory_repo = ArtifactoryRepository(AuthModel(url=URL, auth=AUTH, trusted_responses=True))
+    repo = artifactory_repo.get_repo(repository_response.key)
+
+    assert repo == repository_response
+
+
+@responses.activate
+def test_get_repository_trusted_responses_unknown_rclass():
+    responses.add(
+        responses.GET,
+        f"{URL}/api/repositories/{LOCAL_REPOSITORY.key}",
+        json={**LOCAL_REPOSITORY_RESPONSE.model_dump(mode="json"), "rclass": "distribution"},
+        status=200,
+    )
+
+    artifactory_repo = ArtifactoryRepository(AuthModel(url=URL, auth=AUTH, trusted_responses=True))
+    with pytest.raises(ArtifactoryError, match="distribution"):
+        artifactory_repo.get_repo(LOCAL_REPOSITORY.key)
+
+
 @responses.activate
 def test_list_repositories_success(mocker):
     responses.add(
@@ -323,6 +345,169 @@ def test_list_repositories_success(mocker):
     artifactory_repo.list.assert_called_once()
 
 
+@responses.activate
+def test_get_repos_success():
+    for repository_response in (LOCAL_REPOSITORY_RESPONSE, REMOTE_REPOSITORY_RESPONSE, VIRTUAL_REPOSITORY_RESPONSE):
+        responses.add(
+            responses.GET,
+            f"{URL}/api/repositories/{repository_response.key}",
+            json=repository_response.model_dump(),
+            status=200,
+        )
+
+    artifactory_repo = ArtifactoryRepository(AuthModel(url=URL, auth=AUTH))
+    repos = artifactory_repo.get_repos(
+        [VIRTUAL_REPOSITORY.key, LOCAL_REPOSITORY.key, REMOTE_REPOSITORY.key],
+        concurrency=3,
+    )
+
+    assert repos == [VIRTUAL_REPOSITORY_RESPONSE, LOCAL_REPOSITORY_RESPONSE, REMOTE_REPOSITORY_RESPONSE]
+
+
+@responses.activate
+def test_get_repos_error_not_found():
+    responses.add(
+        responses.GET,
+        f"{URL}/api/repositories/{LOCAL_REPOSITORY.key}",
+        json=LOCAL_REPOSITORY_RESPONSE.model_dump(),
+        status=200,
+    )
+    responses.add(responses.GET, f"{URL}/api/repositories/{REMOTE_REPOSITORY.key}", status=404)
+
+    artifactory_repo = ArtifactoryRepository(AuthModel(url=URL, auth=AUTH))
+    with pytest.raises(RepositoryNotFoundError):
+        artifactory_repo.get_repos([LOCAL_REPOSITORY.key, REMOTE_REPOSITORY.key], concurrency=2)
+
+
+@responses.activate
+def test_list_repositories_detailed_success():
+    responses.add(
+        responses.GET,
+        f"{URL}/api/repositories",
+        json=[
+            SimpleRepository(
+                key=LOCAL_REPOSITORY.key,
+                type="local",
+                url="some-url",
+                packageType="generic",
+            ).model_dump(),
+            SimpleRepository(
+                key=REMOTE_REPOSITORY.key,
+                type="remote",
+                url="some-url",
+                packageType="generic",
+            ).model_dump(),
+        ],
+        status=200,
+    )
+    for repository_response in (LOCAL_REPOSITORY_RESPONSE, REMOTE_REPOSITORY_RESPONSE):
+        responses.add(
+            responses.GET,
+            f"{URL}/api/repositories/{repository_response.key}",
+            json=repository_response.model_dump(),
+            status=200,
+        )
+
+    artifactory_repo = ArtifactoryRepository(AuthModel(url=URL, auth=AUTH))
+
+    assert artifactory_repo.list(detailed=True) == [LOCAL_REPOSITORY_RESPONSE, REMOTE_REPOSITORY_RESPONSE]
+
+
+def _add_repositories_for_apply():
+    responses.add(
+        responses.GET,
+        f"{URL}/api/repositories",
+        json=[
+            SimpleRepository(key=LOCAL_REPOSITORY.key, type="local", url="url", packageType="generic").model_dump(),
+            SimpleRepository(key=REMOTE_REPOSITORY.key, type="remote", url="url", packageType="generic").model_dump(),
+        ],
+        status=200,
+    )
+    for repository_response in (LOCAL_REPOSITORY_RESPONSE, REMOTE_REPOSITORY_RESPONSE):
+        responses.add(
+            responses.GET,
+            f"{URL}/api/repositories/{repository_response.key}",
+            json=repository_response.model_dump(),
+            status=200,
+        )
+
+
+@responses.activate
+def test_apply_repositories_dry_run():
+    _add_repositories_for_apply()
+
+    artifactory_repo = ArtifactoryRepository(AuthModel(url=URL, auth=AUTH))
+    plan = artifactory_repo.apply(
+        [UPDATED_LOCAL_REPOSITORY, REMOTE_REPOSITORY, VIRTUAL_REPOSITORY],
+        dry_run=True,
+    )
+
+    assert plan.has_changes
+    assert [(change.key, change.action) for change in plan.changes] == [
+        (LOCAL_REPOSITORY.key, RepositoryAction.update),
+        (REMOTE_REPOSITORY.key, RepositoryAction.unchanged),
+        (VIRTUAL_REPOSITORY.key, RepositoryAction.create),
+    ]
+    assert [(field.field, field.current, field.desired) for field in plan.changes[0].fields] == [
+        ("description", None, "updated"),
+    ]
+    assert f"~ {LOCAL_REPOSITORY.key} (update)" in str(plan)
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_apply_repositories_writes_only_changes():
+    _add_repositories_for_apply()
+    responses.add(responses.POST, f"{URL}/api/repositories/{LOCAL_REPOSITORY.key}", status=200)
+    responses.add(responses.PUT, f"{URL}/api/repositories/{VIRTUAL_REPOSITORY.key}", status=200)
+
+    artifactory_repo = ArtifactoryRepository(AuthModel(url=URL, auth=AUTH))
+    plan = artifactory_repo.apply([UPDATED_LOCAL_REPOSITORY, REMOTE_REPOSITORY, VIRTUAL_REPOSITORY])
+
+    assert not plan.dry_run
+    writes = {call.request.method: json.loads(call.request.body) for call in responses.calls[3:]}
+    assert writes["POST"] == {"key": LOCAL_REPOSITORY.key, "rclass": "local", "description": "updated"}
+    assert writes["PUT"]["key"] == VIRTUAL_REPOSITORY.key
+    assert len(responses.calls) == 5
+
+
+@responses.activate
+def test_apply_repositories_sends_secrets():
+    _add_repositories_for_apply()
+    responses.add(responses.POST, f"{URL}/api/repositories/{REMOTE_REPOSITORY.key}", status=200)
+    rotated = RemoteRepository(key=REMOTE_REPOSITORY.key, url=REMOTE_REPOSITORY.url, password=SecretStr("rotated"))
+
+    artifactory_repo = ArtifactoryRepository(AuthModel(url=URL, auth=AUTH))
+    plan = artifactory_repo.apply([rotated])
+
+    assert [(change.key, change.action) for change in plan.changes] == [
+        (REMOTE_REPOSITORY.key, RepositoryAction.update),
+    ]
+    assert [field.field for field in plan.changes[0].fields] == ["password"]
+    assert "rotated" not in str(plan)
+    write = json.loads(responses.calls[-1].request.body)
+    assert write["key"] == REMOTE_REPOSITORY.key
+    assert write["password"] == "rotated"  # noqa: S105
+
+
+# noqa: S105
+
+
+@responses.activate
+def test_apply_repositories_fail_if_rclass_changes():
+    _add_repositories_for_apply()
+
+    artifactory_repo = ArtifactoryRepository(AuthModel(url=URL, auth=AUTH))
+    with pytest.raises(ArtifactoryError, match="can't become a virtual one"):
+        artifactory_repo.apply([VirtualRepository(key=LOCAL_REPOSITORY.key)], dry_run=True)
+
+
+def test_apply_repositories_fail_if_defined_twice():
+    artifactory_repo = ArtifactoryRepository(AuthModel(url=URL, auth=AUTH))
+    with pytest.raises(ValueError, match=LOCAL_REPOSITORY.key):
+        artifactory_repo.apply([LOCAL_REPOSITORY, UPDATED_LOCAL_REPOSITORY])
+
+
 @responses.activate
 def test_update_local_repository_fail_if_repo_not_found(mocker):
     responses.add(responses.GET, f"{URL}/api/repositories/{LOCAL_REPOSITORY.key}", status=404)
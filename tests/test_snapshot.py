@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import responses
+
+from pyartifactory import Artifactory
+from pyartifactory.models import Group, SimplePermission, SimpleRepository, SimpleUser
+
+URL = "http://localhost:8080/artifactory"
+AUTH = ("user", "password_or_apiKey")
+
+USERS = [
+    SimpleUser(name="alice", uri="https://some.uri", realm="internal"),
+    SimpleUser(name="bob", uri="https://some.uri", realm="ldap"),
+    SimpleUser(name="carol", uri="https://some.uri", realm="ldap"),
+]
+GROUPS = [Group(name="readers"), Group(name="deployers")]
+PERMISSIONS = [SimplePermission(name="read-all", uri="https://some.uri")]
+REPOSITORIES = [
+    SimpleRepository(key="libs-local", type="LOCAL", url="some-url", packageType="Maven"),
+    SimpleRepository(key="docker-local", type="LOCAL", url="some-url", packageType="Docker"),
+    SimpleRepository(key="docker-remote", type="REMOTE", url="some-url", packageType="Docker"),
+]
+
+
+def _add_list_responses():
+    responses.add(responses.GET, f"{URL}/api/security/users", json=[user.model_dump() for user in USERS])
+    responses.add(responses.GET, f"{URL}/api/security/groups", json=[group.model_dump() for group in GROUPS])
+    responses.add(
+        responses.GET,
+        f"{URL}/api/security/permissions",
+        json=[permission.model_dump() for permission in PERMISSIONS],
+    )
+    responses.add(
+        responses.GET,
+        f"{URL}/api/repositories",
+        json=[repository.model_dump() for repository in REPOSITORIES],
+    )
+
+
+@responses.activate
+def test_snapshot_lookups():
+    _add_list_responses()
+
+    snapshot = Artifactory(url=URL, auth=AUTH).snapshot()
+
+    assert snapshot.users["alice"] == USERS[0]
+    assert "dave" not in snapshot.users
+    assert [user.name for user in snapshot.users_by_realm("ldap")] == ["bob", "carol"]
+    assert set(snapshot.groups) == {"readers", "deployers"}
+    assert snapshot.permissions["read-all"] == PERMISSIONS[0]
+    assert [repository.key for repository in snapshot.repositories_by_package_type("docker")] == [
+        "docker-local",
+        "docker-remote",
+    ]
+    assert [repository.key for repository in snapshot.repositories_by_rclass("local")] == ["libs-local", "docker-local"]
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_snapshot_lists_each_collection_once_per_ttl(mocker):
+    _add_list_responses()
+    clock = mocker.patch("pyartifactory.objects.snapshot.time.monotonic", return_value=1000.0)
+
+    snapshot = Artifactory(url=URL, auth=AUTH).snapshot(ttl=60)
+    for user in USERS:
+        assert user.name in snapshot.users
+    assert len(responses.calls) == 1
+
+    clock.return_value = 1030.0
+    assert "libs-local" in snapshot.repositories
+    clock.return_value = 1070.0
+    assert "alice" in snapshot.users
+    assert "libs-local" in snapshot.repositories
+    assert [call.request.url for call in responses.calls] == [
+        f"{URL}/api/security/users",
+        f"{URL}/api/repositories",
+        f"{URL}/api/security/users",
+    ]
+
+    snapshot.invalidate()
+    assert "libs-local" in snapshot.repositories
+    assert len(responses.calls) == 4
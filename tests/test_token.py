@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+import responses
+
+from pyartifactory import AccessTokenManager, Artifactory, ArtifactorySecurity
+from pyartifactory.exception import InvalidTokenDataError
+from pyartifactory.models import AccessTokenModel, AuthModel
+
+URL = "http://localhost:8080/artifactory"
+AUTH = ("user", "password_or_apiKey")
+SCOPE = "applied-permissions/user"
+
+
+def _token(name, refresh="refresh", expires_in=100):
+    return AccessTokenModel(
+        access_token=name,
+        expires_in=expires_in,
+        scope=SCOPE,
+        refresh_token=refresh,
+        token_type="Bearer",  # noqa: S106
+    )
+
+
+def _current(manager, user_name="alice", scope=SCOPE):
+    return manager.get_token(user_name, scope).access_token
+
+
+class SynchronousThread:
+    def __init__(self, target, **kwargs):
+        self.target = target
+
+    def start(self):
+        self.target()
+
+
+@pytest.fixture()
+def security(mocker):
+    security = mocker.Mock(spec=ArtifactorySecurity)
+    security.create_access_token.side_effect = [_token("first"), _token("second")]
+    security.refresh_access_token.return_value = _token("refreshed", refresh="refresh2")
+    return security
+
+
+@pytest.fixture()
+def clock(mocker):
+    mocker.patch("pyartifactory.objects.token.threading.Thread", SynchronousThread)
+    return mocker.patch("pyartifactory.objects.token.time.monotonic", return_value=1000.0)
+
+
+def test_token_is_cached_per_user_and_scope(security, clock):
+    manager = AccessTokenManager(security, expires_in=100)
+
+    assert _current(manager) == "first"
+    assert _current(manager) == "first"
+    assert _current(manager, scope="other-scope") == "second"
+    assert security.create_access_token.call_count == 2
+
+
+def test_token_creation_only_blocks_its_user_and_scope(security):
+    release = threading.Event()
+
+    def create_access_token(user_name, **kwargs):
+        if user_name == "alice":
+            release.wait(5)
+        return _token(user_name)
+
+    security.create_access_token.side_effect = create_access_token
+    manager = AccessTokenManager(security)
+    creator = threading.Thread(target=manager.get_token, args=("alice",))
+    creator.start()
+
+    assert _current(manager, "bob") == "bob"
+    assert creator.is_alive()
+    release.set()
+    creator.join(5)
+    assert _current(manager) == "alice"
+    assert security.create_access_token.call_count == 2
+
+
+def test_token_is_refreshed_ahead_of_expiry(security, clock):
+    manager = AccessTokenManager(security, expires_in=100, refresh_before=30)
+    manager.get_token("alice")
+
+    clock.return_value = 1060.0
+    assert _current(manager) == "first"
+    security.refresh_access_token.assert_not_called()
+
+    clock.return_value = 1075.0
+    manager.get_token("alice")
+    security.refresh_access_token.assert_called_once_with("first", "refresh")
+    assert _current(manager) == "refreshed"
+    assert security.create_access_token.call_count == 1
+
+
+def test_token_is_handed_out_while_refreshed_in_background(security, mocker):
+    clock = mocker.patch("pyartifactory.objects.token.time.monotonic", return_value=1000.0)
+    release = threading.Event()
+
+    def refresh_access_token(access_token, refresh_token):
+        release.wait(5)
+        return _token("refreshed")
+
+    security.refresh_access_token.side_effect = refresh_access_token
+    manager = AccessTokenManager(security, expires_in=100, refresh_before=30)
+    manager.get_token("alice")
+
+    clock.return_value = 1075.0
+    assert _current(manager) == "first"
+    caller = threading.Thread(target=manager.get_token, args=("alice",))
+    caller.start()
+    caller.join(1)
+    assert not caller.is_alive()
+
+    release.set()
+    deadline = time.time() + 5
+    while _current(manager) != "refreshed" and time.time() < deadline:
+        time.sleep(0.01)
+    assert _current(manager) == "refreshed"
+    security.refresh_access_token.assert_called_once()
+
+
+def test_expired_token_waits_for_the_background_refresh(security, mocker):
+    clock = mocker.patch("pyartifactory.objects.token.time.monotonic", return_value=1000.0)
+    release = threading.Event()
+    refreshing = threading.Event()
+
+    def refresh_access_token(access_token, refresh_token):
+        refreshing.set()
+        release.wait(5)
+        return _token("refreshed")
+
+    security.refresh_access_token.side_effect = refresh_access_token
+    manager = AccessTokenManager(security, expires_in=100, refresh_before=30)
+    manager.get_token("alice")
+
+    clock.return_value = 1075.0
+    manager.get_token("alice")
+    assert refreshing.wait(5)
+
+    clock.return_value = 1200.0
+    tokens = []
+    caller = threading.Thread(target=lambda: tokens.append(_current(manager)))
+    caller.start()
+    caller.join(0.2)
+    assert caller.is_alive()
+
+    release.set()
+    caller.join(5)
+    assert tokens == ["refreshed"]
+    security.refresh_access_token.assert_called_once()
+    security.create_access_token.assert_called_once()
+
+
+def test_expired_token_is_minted_again_when_refresh_fails(security, clock):
+    security.refresh_access_token.side_effect = InvalidTokenDataError("invalid")
+    manager = AccessTokenManager(security, expires_in=100)
+    manager.get_token("alice")
+
+    clock.return_value = 1200.0
+    assert _current(manager) == "second"
+
+
+def test_non_refreshable_token_is_minted_again(security, clock):
+    security.create_access_token.side_effect = [_token("first", refresh=None), _token("second")]
+    manager = AccessTokenManager(security, expires_in=100, refreshable=False)
+    manager.get_token("alice")
+
+    clock.return_value = 1200.0
+    assert _current(manager) == "second"
+    security.refresh_access_token.assert_not_called()
+
+
+def test_invalidate(security, clock):
+    manager = AccessTokenManager(security)
+    manager.get_token("alice")
+
+    manager.invalidate("alice")
+    assert _current(manager) == "second"
+
+
+@responses.activate
+def test_refresh_access_token():
+    responses.add(
+        responses.POST,
+        f"{URL}/access/api/v1/tokens",
+        json=_token("refreshed").model_dump(),
+        status=200,
+    )
+
+    artifactory_security = ArtifactorySecurity(AuthModel(url=URL, auth=AUTH))
+    token = artifactory_security.refresh_access_token("access", "refresh")
+
+    assert token.access_token == "refreshed"  # noqa: S105
+    assert "grant_type=refresh_token" in responses.calls[0].request.body
+
+
+@responses.activate
+def test_token_provider_authenticates_requests():
+    responses.add(responses.GET, f"{URL}/api/security/users", json=[], status=200)
+    tokens = iter(["first", "second"])
+
+    art = Artifactory(url=URL, token_provider=lambda: next(tokens))
+    art.users.list()
+    art.users.list()
+
+    assert [call.request.headers["Authorization"] for call in responses.calls] == ["Bearer first", "Bearer second"]
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import contextvars
+from contextlib import contextmanager
+
+import pytest
+import responses
+
+from pyartifactory import ArtifactoryBuild, ArtifactoryRepository, ArtifactoryUser
+from pyartifactory.exception import UserNotFoundError
+from pyartifactory.models import AuthModel, BuildInfo, LocalRepository, LocalRepositoryResponse, UserResponse
+from pyartifactory.tracing import NoOpTracer, Tracer
+
+URL = "http://localhost:8080/artifactory"
+AUTH = ("user", "password_or_apiKey")
+USER = UserResponse(name="test_user", email="test.test@test.com")
+LOCAL_REPO = LocalRepository(key="test_local_repo")
+LOCAL_REPO_RESPONSE = LocalRepositoryResponse(key="test_local_repo")
+
+
+class RecordingSpan:
+    def __init__(self, name, parent):
+        self.name = name
+        self.parent = parent
+        self.attributes = {}
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+
+class RecordingTracer:
+    def __init__(self):
+        self.spans = []
+        self._stack = []
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        span = RecordingSpan(name, self._stack[-1] if self._stack else None)
+        self.spans.append(span)
+        self._stack.append(span)
+        try:
+            yield span
+        finally:
+            self._stack.pop()
+
+
+class ContextTracer(RecordingTracer):
+    """Keep the current span in a context variable, like OpenTelemetry does."""
+
+    def __init__(self):
+        super().__init__()
+        self.current = contextvars.ContextVar("current_span", default=None)
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        span = RecordingSpan(name, self.current.get())
+        self.spans.append(span)
+        token = self.current.set(span)
+        try:
+            yield span
+        finally:
+            self.current.reset(token)
+
+
+def test_tracers_follow_the_protocol():
+    assert isinstance(NoOpTracer(), Tracer)
+    assert isinstance(RecordingTracer(), Tracer)
+
+
+@responses.activate
+def test_http_spans_are_children_of_the_method_span():
+    responses.add(responses.HEAD, f"{URL}/api/repositories/{LOCAL_REPO.key}", status=404)
+    responses.add(responses.PUT, f"{URL}/api/repositories/{LOCAL_REPO.key}", status=200)
+    responses.add(
+        responses.GET,
+        f"{URL}/api/repositories/{LOCAL_REPO.key}",
+        json=LOCAL_REPO_RESPONSE.model_dump(),
+        status=200,
+    )
+    tracer = RecordingTracer()
+
+    artifactory_repo = ArtifactoryRepository(AuthModel(url=URL, auth=AUTH, tracer=tracer))
+    artifactory_repo.create_repo(LOCAL_REPO)
+
+    root = tracer.spans[0]
+    assert root.name == "ArtifactoryRepository.create_repo"
+    assert root.parent is None
+    http_spans = [span for span in tracer.spans if span.name.startswith("HTTP")]
+    assert [span.name for span in http_spans] == ["HTTP HEAD", "HTTP PUT", "HTTP GET"]
+    assert all(span.parent is not None and span.parent.name.startswith("ArtifactoryRepository.") for span in http_spans)
+    assert {span.parent.parent for span in http_spans if span.parent is not root} == {root}
+    assert http_spans[1].attributes["http.route"] == "api/repositories/{key}"
+    assert http_spans[1].attributes["url.path"] == f"api/repositories/{LOCAL_REPO.key}"
+    assert http_spans[1].attributes["http.response.status_code"] == 200
+    assert http_spans[2].attributes["http.response.body.size"] > 0
+
+
+@responses.activate
+def test_http_span_records_error_status():
+    responses.add(responses.GET, f"{URL}/api/security/users/{USER.name}", status=404)
+    tracer = RecordingTracer()
+
+    artifactory_user = ArtifactoryUser(AuthModel(url=URL, auth=AUTH, tracer=tracer))
+    with pytest.raises(UserNotFoundError):
+        artifactory_user.get(USER.name)
+
+    method_span, http_span = tracer.spans
+    assert method_span.name == "ArtifactoryUser.get"
+    assert http_span.attributes["http.response.status_code"] == 404
+
+
+@responses.activate
+def test_concurrent_requests_keep_the_caller_span_as_parent():
+    repo_names = [f"repo{index}" for index in range(4)]
+    for repo_name in repo_names:
+        responses.add(
+            responses.GET,
+            f"{URL}/api/repositories/{repo_name}",
+            json=LocalRepositoryResponse(key=repo_name).model_dump(),
+            status=200,
+        )
+    tracer = ContextTracer()
+
+    ArtifactoryRepository(AuthModel(url=URL, auth=AUTH, tracer=tracer)).get_repos(repo_names, concurrency=4)
+
+    root = tracer.spans[0]
+    assert root.name == "ArtifactoryRepository.get_repos"
+    get_repo_spans = [span for span in tracer.spans if span.name == "ArtifactoryRepository.get_repo"]
+    assert len(get_repo_spans) == len(repo_names)
+    assert all(span.parent is root for span in get_repo_spans)
+
+
+@responses.activate
+def test_generator_span_is_not_current_between_items():
+    for build_number in ("1", "2"):
+        responses.add(
+            responses.GET,
+            f"{URL}/api/build/build_name/{build_number}",
+            json=BuildInfo(uri=f"{URL}/api/build/build_name/{build_number}").model_dump(),
+            status=200,
+        )
+    tracer = ContextTracer()
+
+    build_infos = ArtifactoryBuild(AuthModel(url=URL, auth=AUTH, tracer=tracer)).get_build_infos(
+        "build_name",
+        ["1", "2"],
+        concurrency=1,
+    )
+    next(build_infos)
+    assert tracer.current.get() is None
+    next(build_infos)
+    build_infos.close()
+
+    root = tracer.spans[0]
+    assert root.name == "ArtifactoryBuild.get_build_infos"
+    get_build_info_spans = [span for span in tracer.spans if span.name == "ArtifactoryBuild.get_build_info"]
+    assert len(get_build_info_spans) == 2
+    assert all(span.parent is root for span in get_build_info_spans)
@@ -7,7 +7,7 @@ import responses
 
 from pyartifactory import ArtifactoryUser
 from pyartifactory.exception import UserAlreadyExistsError, UserNotFoundError
-from pyartifactory.models import AuthModel, NewUser, SimpleUser, User, UserResponse
+from pyartifactory.models import AuthModel, NewUser, SimpleUser, User, UserResponse, UserUpsertAction
 
 URL = "http://localhost:8080/artifactory"
 AUTH = ("user", "password_or_apiKey")
@@ -19,24 +19,19 @@ NEW_USER = NewUser(name="test_user", password="test", email="test.test@test.com"
 
 @responses.activate
 def test_create_user_fail_if_user_already_exists(mocker):
-    responses.add(
-        responses.GET,
-        f"{URL}/api/security/users/{USER.name}",
-        json=USER.model_dump(),
-        status=200,
-    )
+    responses.add(responses.HEAD, f"{URL}/api/security/users/{USER.name}", status=200)
 
     artifactory_user = ArtifactoryUser(AuthModel(url=URL, auth=AUTH))
-    mocker.spy(artifactory_user, "get")
+    mocker.spy(artifactory_user, "exists")
     with pytest.raises(UserAlreadyExistsError):
         artifactory_user.create(NEW_USER)
 
-    artifactory_user.get.assert_called_once_with(NEW_USER.name)
+    artifactory_user.exists.assert_called_once_with(NEW_USER.name)
 
 
 @responses.activate
 def test_create_user_success(mocker):
-    responses.add(responses.GET, f"{URL}/api/security/users/{USER.name}", status=404)
+    responses.add(responses.HEAD, f"{URL}/api/security/users/{USER.name}", status=404)
     responses.add(
         responses.PUT,
         f"{URL}/api/security/users/{USER.name}",
@@ -55,7 +50,7 @@ def test_create_user_success(mocker):
     user = artifactory_user.create(NEW_USER)
 
     artifactory_user.get.assert_called_with(NEW_USER.name)
-    assert artifactory_user.get.call_count == 2
+    assert artifactory_user.get.call_count == 1
     assert user.model_dump() == USER.model_dump()
 
 
@@ -171,3 +166,56 @@ def test_unlock_user_success(mocker):
     responses.add(responses.POST, f"{URL}/api/security/unlockUsers/{NEW_USER.name}", status=200)
     artifactory_user = ArtifactoryUser(AuthModel(url=URL, auth=AUTH))
     artifactory_user.unlock(NEW_USER.name)
+
+
+@responses.activate
+def test_upsert_users():
+    responses.add(
+        responses.GET,
+        f"{URL}/api/security/users",
+        json=[
+            SimpleUser(name="changed_user", uri="https://some.uri").model_dump(),
+            SimpleUser(name="same_user", uri="https://some.uri").model_dump(),
+            SimpleUser(name="broken_user", uri="https://some.uri").model_dump(),
+        ],
+    )
+    responses.add(
+        responses.GET,
+        f"{URL}/api/security/users/changed_user",
+        json=UserResponse(name="changed_user", email="old@test.com", groups=["readers"]).model_dump(mode="json"),
+    )
+    responses.add(
+        responses.GET,
+        f"{URL}/api/security/users/same_user",
+        json=UserResponse(name="same_user", email="same@test.com", groups=["b", "a"]).model_dump(mode="json"),
+    )
+    responses.add(responses.GET, f"{URL}/api/security/users/broken_user", status=500)
+    responses.add(responses.POST, f"{URL}/api/security/users/changed_user", status=200)
+    responses.add(responses.PUT, f"{URL}/api/security/users/new_user", status=201)
+
+    artifactory_user = ArtifactoryUser(AuthModel(url=URL, auth=AUTH))
+    report = artifactory_user.upsert(
+        [
+            NewUser(name="new_user", password="test", email="new@test.com"),  # noqa: S106
+            User(name="changed_user", email="new@test.com", groups=["readers"]),
+            NewUser(name="same_user", password="test", email="same@test.com", groups=["a", "b"]),  # noqa: S106
+            User(name="missing_user", email="missing@test.com"),
+            User(name="broken_user", email="broken@test.com"),
+        ],
+        concurrency=4,
+    )
+
+    assert [(result.name, result.action) for result in report.results] == [
+        ("new_user", UserUpsertAction.created),
+        ("changed_user", UserUpsertAction.updated),
+        ("same_user", UserUpsertAction.unchanged),
+        ("missing_user", UserUpsertAction.failed),
+        ("broken_user", UserUpsertAction.failed),
+    ]
+    assert report.results[1].fields == ["email"]
+    assert report.names(UserUpsertAction.failed) == ["missing_user", "broken_user"]
+    assert "no password" in report.failed[0].error
+    post = next(call for call in responses.calls if call.request.method == "POST")
+    assert json.loads(post.request.body) == {"name": "changed_user", "email": "new@test.com"}
+    put = next(call for call in responses.calls if call.request.method == "PUT")
+    assert json.loads(put.request.body)["password"] == "test"  # noqa: S105